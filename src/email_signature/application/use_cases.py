@@ -42,7 +42,12 @@ class GenerateSignatureUseCase:
         self.config = config
         logger.info("GenerateSignatureUseCase initialized")
 
-    def execute(self, signature_data: SignatureData, output_path: str) -> str:
+    def execute(
+        self,
+        signature_data: SignatureData,
+        output_path: str,
+        logo_path_override: str | None = None,
+    ) -> str:
         """Generate email signature image.
 
         This method orchestrates the complete signature generation process:
@@ -53,6 +58,8 @@ class GenerateSignatureUseCase:
         Args:
             signature_data: User data for the signature
             output_path: Path where the signature image should be saved
+            logo_path_override: Logo file to use instead of searching the
+                configured logo paths
 
         Returns:
             Path to the generated signature file
@@ -69,10 +76,16 @@ class GenerateSignatureUseCase:
 
             # Step 1: Find logo file
             logger.debug("Searching for logo file")
-            logo_path = self.logo_loader.find_logo()
+            if logo_path_override:
+                # Passed per call so concurrent executions never share state
+                logo_path = self.logo_loader.find_logo([logo_path_override])
+            else:
+                logo_path = self.logo_loader.find_logo()
 
             if logo_path is None:
                 logger.error("Logo file not found in any search path")
+                if logo_path_override:
+                    raise LogoNotFoundError([logo_path_override])
                 raise LogoNotFoundError(self.logo_loader.search_paths)
 
             logger.info(f"Logo found at: {logo_path}")
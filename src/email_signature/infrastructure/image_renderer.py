@@ -1,5 +1,6 @@
 """Image rendering for email signature generation."""
 
+import functools
 import logging
 import platform
 import warnings
@@ -14,6 +15,23 @@ from .platform_utils import FontLocator, PathManager
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on memoized text measurements kept per renderer
+_TEXT_METRICS_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=32)
+def _load_truetype(path: str, size: int) -> Any:
+    """Load a TrueType font, sharing the loaded object between renderers.
+
+    Args:
+        path: Font file path
+        size: Font size in points
+
+    Returns:
+        Loaded font object
+    """
+    return ImageFont.truetype(path, size)
+
 
 class ImageRenderError(Exception):
     """Raised when image rendering fails."""
@@ -32,6 +50,10 @@ class ImageRenderer:
         """
         self.config = config
         self.fonts = self._load_fonts()
+        self._small_font: Any = None
+        # Text widths keyed by (font key, text); see _measure_text_width
+        self._text_width_cache: dict[tuple[Any, str], int] = {}
+        self._measure_draw = ImageDraw.Draw(Image.new("RGBA", (1, 1), (0, 0, 0, 0)))
 
     def _load_fonts(self) -> dict[str, Any]:
         """Load fonts with platform-specific fallback chain.
@@ -67,7 +89,7 @@ class ImageRenderer:
             default_font_path = FontLocator.find_font(default_sans_serif)
             if default_font_path:
                 try:
-                    fonts["bold"] = ImageFont.truetype(str(default_font_path), 16)
+                    fonts["bold"] = _load_truetype(str(default_font_path), 16)
                     logger.info(f"Loaded default bold font: {default_sans_serif}")
                 except Exception as e:
                     logger.warning(f"Could not load default font {default_sans_serif}: {e}")
@@ -104,7 +126,7 @@ class ImageRenderer:
             default_font_path = FontLocator.find_font(default_sans_serif)
             if default_font_path:
                 try:
-                    fonts["regular"] = ImageFont.truetype(str(default_font_path), 14)
+                    fonts["regular"] = _load_truetype(str(default_font_path), 14)
                     logger.info(f"Loaded default regular font: {default_sans_serif}")
                 except Exception as e:
                     logger.warning(f"Could not load default font {default_sans_serif}: {e}")
@@ -168,7 +190,7 @@ class ImageRenderer:
                 
                 # Try to load the font
                 if PathManager.exists(path):
-                    font = ImageFont.truetype(str(path), size)
+                    font = _load_truetype(str(path), size)
                     logger.debug(f"Successfully loaded font from {path}")
                     return font
                 else:
@@ -180,6 +202,54 @@ class ImageRenderer:
 
         return None
 
+    def _get_small_font(self) -> Any:
+        """Get the reduced-size font used for the confidentiality notice.
+
+        Returns:
+            Smaller version of the regular font, or the regular font itself
+            if it cannot be resized
+        """
+        if self._small_font is None:
+            regular_font = self.fonts["regular"]
+            try:
+                if hasattr(regular_font, "path") and hasattr(regular_font, "size"):
+                    self._small_font = _load_truetype(
+                        regular_font.path, int(regular_font.size * 0.7)
+                    )
+                else:
+                    self._small_font = regular_font  # Fallback to regular font
+            except Exception:
+                self._small_font = regular_font  # Fallback to regular font
+        return self._small_font
+
+    def _measure_text_width(self, text: str, font: Any) -> int:
+        """Measure the rendered width of a text string.
+
+        Measurements are memoized so unchanged lines (and the constant
+        confidentiality notice) are not re-measured on every preview.
+
+        Args:
+            text: Text string to measure
+            font: Font the text will be rendered with
+
+        Returns:
+            Width of the text in pixels
+        """
+        # TrueType fonts are identified by file and size, so the key does not
+        # depend on object lifetime; others (e.g. the default bitmap font)
+        # are held by the key itself, which keeps them alive while cached
+        path = getattr(font, "path", None)
+        font_key = (path, font.size) if path is not None else font
+        key = (font_key, text)
+        width = self._text_width_cache.get(key)
+        if width is None:
+            bbox = self._measure_draw.textbbox((0, 0), text, font=font)
+            width = bbox[2] - bbox[0]
+            if len(self._text_width_cache) >= _TEXT_METRICS_CACHE_SIZE:
+                self._text_width_cache.clear()
+            self._text_width_cache[key] = width
+        return width
+
     def draw_text_with_outline(
         self,
         draw: Any,
@@ -244,24 +314,12 @@ class ImageRenderer:
             bold_font = self.fonts["bold"]
             regular_font = self.fonts["regular"]
 
-            # Create smaller font for confidentiality notice
-            # Try to create a smaller version of the regular font
-            try:
-                if hasattr(regular_font, "path") and hasattr(regular_font, "size"):
-                    small_font = ImageFont.truetype(regular_font.path, int(regular_font.size * 0.7))
-                else:
-                    small_font = regular_font  # Fallback to regular font
-            except Exception:
-                small_font = regular_font  # Fallback to regular font
+            # Smaller font for confidentiality notice
+            small_font = self._get_small_font()
 
             # Calculate text dimensions to determine image size
-            # We'll create a temporary draw object to measure text
-            temp_img = Image.new("RGBA", (1, 1), (0, 0, 0, 0))
-            temp_draw = ImageDraw.Draw(temp_img)
-
             # Measure name
-            name_bbox = temp_draw.textbbox((0, 0), signature_data.name, font=bold_font)
-            name_width = name_bbox[2] - name_bbox[0]
+            name_width = self._measure_text_width(signature_data.name, bold_font)
 
             # Measure other text lines
             text_lines = [
@@ -284,15 +342,11 @@ class ImageRenderer:
             # Measure max text width
             max_text_width = name_width
             for line in text_lines:
-                bbox = temp_draw.textbbox((0, 0), line, font=regular_font)
-                line_width = bbox[2] - bbox[0]
+                line_width = self._measure_text_width(line, regular_font)
                 max_text_width = max(max_text_width, line_width)
 
             # Measure confidentiality notice
-            conf_bbox = temp_draw.textbbox(
-                (0, 0), self.config.confidentiality_text, font=small_font
-            )
-            conf_width = conf_bbox[2] - conf_bbox[0]
+            conf_width = self._measure_text_width(self.config.confidentiality_text, small_font)
 
             # Calculate image dimensions
             logo_width = logo.size[0]
@@ -59,13 +59,18 @@ class LogoLoader:
         """
         self.search_paths = search_paths
 
-    def find_logo(self) -> str | None:
+    def find_logo(self, search_paths: list[str] | None = None) -> str | None:
         """Search for logo file in configured paths.
 
+        Args:
+            search_paths: Paths to search instead of the configured ones
+
         Returns:
             Path to logo file if found, None otherwise
         """
-        for path_str in self.search_paths:
+        if search_paths is None:
+            search_paths = self.search_paths
+        for path_str in search_paths:
             path = PathManager.normalize(path_str)
             if PathManager.exists(path) and path.is_file():
                 return str(path)
@@ -35,8 +35,8 @@ class PreviewGenerator:
 
         Args:
             data: Signature data to generate preview for
-            logo_path: Optional custom logo path (currently not used, 
-                      uses default logo search paths)
+            logo_path: Optional custom logo path; when None the default
+                      logo search paths are used
 
         Returns:
             PIL Image object containing the signature preview
@@ -52,7 +52,7 @@ class PreviewGenerator:
 
         try:
             # Generate signature to temp file
-            self.use_case.execute(data, str(temp_path))
+            self.use_case.execute(data, str(temp_path), logo_path_override=logo_path)
             logger.info(f"Preview generated successfully at {temp_path}")
 
             # Load and return as PIL Image
@@ -35,15 +35,7 @@ class ProfileManager:
             ValueError: If profile name is empty or invalid
             OSError: If file cannot be written
         """
-        if not name or not name.strip():
-            raise ValueError("Profile name cannot be empty")
-        
-        # Sanitize filename
-        safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
-        if not safe_name:
-            raise ValueError("Profile name must contain valid characters")
-        
-        profile_path = PathManager.join(str(self.profiles_dir), f"{safe_name}.json")
+        profile_path = self._profile_path(name)
         PathManager.ensure_parent_dirs(profile_path)
         
         # Convert SignatureData to dictionary
@@ -78,9 +70,7 @@ class ProfileManager:
         if not name or not name.strip():
             raise ValueError("Profile name cannot be empty")
         
-        # Sanitize filename
-        safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
-        profile_path = PathManager.join(str(self.profiles_dir), f"{safe_name}.json")
+        profile_path = self._profile_path(name)
         
         if not PathManager.exists(profile_path):
             native_path = str(profile_path)
@@ -110,6 +100,42 @@ class ProfileManager:
             website=profile_data.get("website", "www.example.com"),
         )
 
+    @staticmethod
+    def sanitize_name(name: str) -> str:
+        """Reduce a profile name to the characters allowed in filenames.
+        
+        Args:
+            name: Profile name as entered by the user
+            
+        Returns:
+            Sanitized profile name
+            
+        Raises:
+            ValueError: If profile name is empty or has no valid characters
+        """
+        if not name or not name.strip():
+            raise ValueError("Profile name cannot be empty")
+        
+        safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
+        if not safe_name:
+            raise ValueError("Profile name must contain valid characters")
+        return safe_name
+
+    def _profile_path(self, name: str) -> Path:
+        """Get the file path for a profile name.
+        
+        Args:
+            name: Profile name (filename without extension)
+            
+        Returns:
+            Path to the profile's JSON file
+            
+        Raises:
+            ValueError: If profile name is empty or has no valid characters
+        """
+        safe_name = self.sanitize_name(name)
+        return PathManager.join(str(self.profiles_dir), f"{safe_name}.json")
+
     def list_profiles(self) -> List[str]:
         """List all available profile names.
         
@@ -138,9 +164,7 @@ class ProfileManager:
         if not name or not name.strip():
             raise ValueError("Profile name cannot be empty")
         
-        # Sanitize filename
-        safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
-        profile_path = PathManager.join(str(self.profiles_dir), f"{safe_name}.json")
+        profile_path = self._profile_path(name)
         
         if not PathManager.exists(profile_path):
             native_path = str(profile_path)
@@ -150,3 +174,87 @@ class ProfileManager:
             )
         
         profile_path.unlink()
+
+
+class CachedProfileManager(ProfileManager):
+    """ProfileManager that keeps profile listings and loaded data in memory.
+    
+    The profile list is cached until a profile is saved or deleted through
+    this manager. Loaded profiles are reused for as long as the profile
+    file's modification time is unchanged.
+    """
+
+    def __init__(self, profiles_dir: str = "profiles") -> None:
+        """Initialize the CachedProfileManager.
+        
+        Args:
+            profiles_dir: Directory path where profiles will be stored
+        """
+        super().__init__(profiles_dir)
+        self._profile_list_cache: List[str] | None = None
+        # Keyed by sanitized name, i.e. by profile file
+        self._profile_data_cache: dict[str, tuple[float, SignatureData]] = {}
+
+    def save_profile(self, name: str, data: SignatureData) -> None:
+        """Save signature data to a profile file and invalidate cached entries.
+        
+        Args:
+            name: Profile name (used as filename)
+            data: SignatureData to save
+        """
+        super().save_profile(name, data)
+        self._invalidate(name)
+
+    def load_profile(self, name: str) -> SignatureData:
+        """Load signature data, reusing the cached copy if the file is unchanged.
+        
+        Args:
+            name: Profile name (filename without extension)
+            
+        Returns:
+            SignatureData loaded from the profile
+        """
+        # Spellings that sanitize to the same file share one cache entry
+        key = self.sanitize_name(name)
+        try:
+            mtime = self._profile_path(name).stat().st_mtime
+        except OSError:
+            # Let the uncached path raise the appropriate error
+            self._profile_data_cache.pop(key, None)
+            return super().load_profile(name)
+        
+        cached = self._profile_data_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        data = super().load_profile(name)
+        self._profile_data_cache[key] = (mtime, data)
+        return data
+
+    def list_profiles(self) -> List[str]:
+        """List all available profile names, reading the directory only once.
+        
+        Returns:
+            List of profile names (without .json extension)
+        """
+        if self._profile_list_cache is None:
+            self._profile_list_cache = super().list_profiles()
+        return list(self._profile_list_cache)
+
+    def delete_profile(self, name: str) -> None:
+        """Delete a profile file and invalidate cached entries.
+        
+        Args:
+            name: Profile name (filename without extension)
+        """
+        super().delete_profile(name)
+        self._invalidate(name)
+
+    def _invalidate(self, name: str) -> None:
+        """Drop cached state affected by a change to a profile.
+        
+        Args:
+            name: Profile name that was saved or deleted
+        """
+        self._profile_list_cache = None
+        self._profile_data_cache.pop(self.sanitize_name(name), None)
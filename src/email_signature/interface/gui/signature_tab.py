@@ -1,20 +1,63 @@
 """Signature tab for entering signature data and generating signatures."""
 
+import dataclasses
 import logging
-from typing import TYPE_CHECKING, Optional
+import os
+import threading
+import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from tkinter import filedialog, messagebox, simpledialog, ttk
+from typing import TYPE_CHECKING, Callable, Optional
+
+from PIL import Image, ImageTk
 
 if TYPE_CHECKING:
-    import tkinter as tk
     from ...application.use_cases import GenerateSignatureUseCase
     from ...domain.config import SignatureConfig
     from ...domain.validators import InputValidator
 
+from ...domain.models import SignatureData
+from ...infrastructure.platform_utils import SystemCommandExecutor, ErrorMessageFormatter, get_platform
 from .validation_mixin import ValidationMixin
 from .preview_generator import PreviewGenerator
-from .profile_manager import ProfileManager
+from .profile_manager import CachedProfileManager
 
 logger = logging.getLogger(__name__)
 
+# Number of decoded logo thumbnails kept in memory
+_THUMBNAIL_CACHE_SIZE = 8
+# Delay before queued profile saves are written to disk
+_PROFILE_FLUSH_DELAY_MS = 500
+
+# User-facing names for get_platform() values
+_PLATFORM_DISPLAY = {
+    'windows': 'Windows',
+    'darwin': 'macOS',
+    'linux': 'Linux'
+}
+
+# Fields that must be valid before a signature can be generated, one bit each
+_REQUIRED_FIELD_BITS = {"name": 1, "position": 2, "address": 4, "email": 8}
+_REQUIRED_ALL = 0xF
+
+
+def _validate_optional(validator: "InputValidator", value: str) -> tuple[bool, str]:
+    """Accept any value for free-form optional fields (website)."""
+    return True, ""
+
+
+# Validation rule applied to each form field, resolved once per keystroke
+_VALIDATOR_BY_FIELD: dict[str, Callable[["InputValidator", str], tuple[bool, str]]] = {
+    "name": lambda v, value: v.validate_required_field(value, "Name"),
+    "position": lambda v, value: v.validate_required_field(value, "Position"),
+    "address": lambda v, value: v.validate_required_field(value, "Address"),
+    "phone": lambda v, value: v.validate_phone(value),
+    "mobile": lambda v, value: v.validate_phone(value),
+    "email": lambda v, value: v.validate_email(value),
+}
+
 
 class SignatureTab(ValidationMixin):
     """Tab for entering signature data and generating signatures.
@@ -41,8 +84,6 @@ class SignatureTab(ValidationMixin):
             validator: Input validator for form fields
             use_case: Use case for generating signatures
         """
-        from tkinter import ttk
-        
         # Initialize ValidationMixin
         super().__init__()
         
@@ -53,8 +94,8 @@ class SignatureTab(ValidationMixin):
         # Create preview generator
         self.preview_generator = PreviewGenerator(use_case)
         
-        # Create profile manager
-        self.profile_manager = ProfileManager()
+        # Create profile manager (profile list and data are cached in memory)
+        self.profile_manager = CachedProfileManager()
         
         # Create main frame for this tab
         self.frame = ttk.Frame(parent, padding="10")
@@ -65,37 +106,64 @@ class SignatureTab(ValidationMixin):
         
         # Track validation state for each field
         self.field_valid: dict[str, bool] = {}
+        # Bit set per valid required field (see _REQUIRED_FIELD_BITS)
+        self._required_valid_mask = 0
+        # Fields with a change handler already queued for the next idle cycle
+        self._pending_field_changes: set[str] = set()
+        # Set while fields are filled programmatically and validated in bulk
+        self._suppress_validation = False
+        # Field values as last read from the StringVars
+        self._form_data_cache: Optional[dict[str, str]] = None
+        # Signature data for the current form, updated one field at a time
+        self._signature_data_cache: Optional["SignatureData"] = None
+        # Profiles saved since the last flush, written to disk in one batch
+        self._dirty_profiles: dict[str, "SignatureData"] = {}
+        self._profile_flush_scheduled = False
+        # Profile picker dialogs by title, built on first use and then reused
+        self._profile_pickers: dict[
+            str, tuple["tk.Toplevel", "tk.Listbox", "tk.StringVar"]
+        ] = {}
+        # Single worker for signature generation, reused across clicks
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="siggen")
         
         # Logo selection state
         self.selected_logo_path: Optional[str] = None
         self.logo_preview_label: Optional["tk.Label"] = None
+        # Decoded thumbnails keyed by (path, mtime), least recently used first
+        self._thumb_cache: OrderedDict[tuple[str, float], "ImageTk.PhotoImage"] = OrderedDict()
         
         # Preview state
         self.preview_image_label: Optional["tk.Label"] = None
         self.preview_photo: Optional["tk.PhotoImage"] = None
+        self._last_scrollregion: Optional[tuple[int, int, int, int]] = None
         self.auto_update_preview: bool = True
+        # Fingerprint of the inputs behind the currently displayed preview
+        self._last_render_key: Optional[tuple] = None
         
         # Create the UI components
+        self._create_main_layout()
+        
+        logger.info("SignatureTab initialized")
+    
+    def _create_main_layout(self) -> None:
+        """Create all sections of the tab."""
+        # Configure grid weights for proper resizing
+        self.frame.columnconfigure(0, weight=1)
+        self.frame.rowconfigure(0, weight=1)
+        
         self._create_form_fields()
         self._create_logo_section()
         self._create_preview_section()
         self._create_action_buttons()
         self._create_status_bar()
-        
-        logger.info("SignatureTab initialized")
     
     def _create_form_fields(self) -> None:
         """Create form fields for signature data."""
-        import tkinter as tk
-        from tkinter import ttk
-        
         # Create a frame for the form
         form_frame = ttk.LabelFrame(self.frame, text="Signature Information", padding="10")
         form_frame.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
         
         # Configure grid weights for proper resizing
-        self.frame.columnconfigure(0, weight=1)
-        self.frame.rowconfigure(0, weight=1)
         form_frame.columnconfigure(1, weight=1)
         
         # Define fields: (field_name, label_text, is_required)
@@ -136,8 +204,9 @@ class SignatureTab(ValidationMixin):
             self.field_valid[field_name] = False
             
             # Set up real-time validation
-            # Use trace to trigger validation on any change
-            var.trace_add("write", lambda *args, fn=field_name: self._on_field_change(fn))
+            # Use trace to queue validation on any change; the work runs once
+            # Tcl has finished the write so the entry repaints immediately
+            var.trace_add("write", lambda *args, fn=field_name: self._schedule_field_change(fn))
         
         # Set default value for website
         self.field_vars["website"].set("www.example.com")
@@ -146,11 +215,6 @@ class SignatureTab(ValidationMixin):
     
     def _create_logo_section(self) -> None:
         """Create logo selection and preview section."""
-        import tkinter as tk
-        from tkinter import ttk
-        from tkinter import filedialog
-        from PIL import Image, ImageTk
-        
         # Create a frame for the logo section
         logo_frame = ttk.LabelFrame(self.frame, text="Logo", padding="10")
         logo_frame.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
@@ -200,10 +264,6 @@ class SignatureTab(ValidationMixin):
     
     def _on_browse_logo_clicked(self) -> None:
         """Handle browse logo button click."""
-        from tkinter import filedialog
-        from PIL import Image, ImageTk
-        import os
-        
         # Open file picker dialog with PNG/JPG filter
         file_path = filedialog.askopenfilename(
             title="Select Logo File",
@@ -240,19 +300,27 @@ class SignatureTab(ValidationMixin):
         Args:
             logo_path: Path to the logo file
         """
-        from PIL import Image, ImageTk
-        import os
-        
         try:
-            # Load the image
-            image = Image.open(logo_path)
+            # Reuse the decoded thumbnail if this file hasn't changed on disk
+            cache_key = (logo_path, os.path.getmtime(logo_path))
+            photo = self._thumb_cache.get(cache_key)
             
-            # Create thumbnail (max 150x150)
-            thumbnail_size = (150, 150)
-            image.thumbnail(thumbnail_size, Image.Resampling.LANCZOS)
-            
-            # Convert to PhotoImage for Tkinter
-            photo = ImageTk.PhotoImage(image)
+            if photo is None:
+                # Load the image
+                image = Image.open(logo_path)
+                
+                # Create thumbnail (max 150x150)
+                thumbnail_size = (150, 150)
+                image.thumbnail(thumbnail_size, Image.Resampling.LANCZOS)
+                
+                # Convert to PhotoImage for Tkinter
+                photo = ImageTk.PhotoImage(image)
+                
+                self._thumb_cache[cache_key] = photo
+                if len(self._thumb_cache) > _THUMBNAIL_CACHE_SIZE:
+                    self._thumb_cache.popitem(last=False)
+            else:
+                self._thumb_cache.move_to_end(cache_key)
             
             # Update the preview label
             self.logo_preview_label.config(image=photo, text="")
@@ -260,7 +328,7 @@ class SignatureTab(ValidationMixin):
             # Store reference to prevent garbage collection
             self.logo_preview_image = photo
             
-            logger.debug(f"Logo preview updated for: {logo_path}")
+            logger.debug("Logo preview updated for: %s", logo_path)
             
         except Exception as e:
             error_msg = f"Failed to load logo preview: {str(e)}"
@@ -279,9 +347,6 @@ class SignatureTab(ValidationMixin):
     
     def _create_preview_section(self) -> None:
         """Create preview section with image display widget."""
-        import tkinter as tk
-        from tkinter import ttk
-        
         # Create a frame for the preview section
         preview_frame = ttk.LabelFrame(self.frame, text="Preview", padding="10")
         preview_frame.grid(row=2, column=0, sticky="nsew", padx=5, pady=5)
@@ -354,12 +419,14 @@ class SignatureTab(ValidationMixin):
     def _on_preview_clicked(self) -> None:
         """Handle preview button click."""
         logger.info("Preview button clicked")
+        # An explicit request always re-renders, e.g. after the logo file changed on disk
+        self._last_render_key = None
         self._generate_preview()
     
     def _on_auto_update_toggled(self) -> None:
         """Handle auto-update checkbox toggle."""
         self.auto_update_preview = self.auto_update_var.get()
-        logger.debug(f"Auto-update preview: {self.auto_update_preview}")
+        logger.debug("Auto-update preview: %s", self.auto_update_preview)
         
         # If auto-update is enabled and form is valid, generate preview
         if self.auto_update_preview and self.is_form_valid():
@@ -367,9 +434,9 @@ class SignatureTab(ValidationMixin):
     
     def _generate_preview(self) -> None:
         """Generate and display the signature preview."""
-        import threading
-        from PIL import ImageTk
-        from ...domain.models import SignatureData
+        # Bring validity and the cached signature data up to date with edits
+        # whose idle handler has not run yet, so the render key matches them
+        self._validate_pending_fields()
         
         # Check if form is valid
         if not self.is_form_valid():
@@ -380,27 +447,46 @@ class SignatureTab(ValidationMixin):
         # Get signature data from form
         form_data = self.get_signature_data()
         
-        try:
-            signature_data = SignatureData(
-                name=form_data["name"],
-                position=form_data["position"],
-                address=form_data["address"],
-                phone=form_data.get("phone", ""),
-                mobile=form_data.get("mobile", ""),
-                email=form_data["email"],
-                website=form_data.get("website", "")
-            )
-        except ValueError as e:
-            error_msg = f"Invalid signature data: {str(e)}"
-            self.set_status(error_msg)
-            logger.error(error_msg)
+        # Skip the render when nothing visible changed since the last preview
+        render_key = (
+            tuple(sorted(form_data.items())),
+            self.selected_logo_path,
+        )
+        if render_key == self._last_render_key:
+            self.set_status("Preview is up to date")
+            logger.debug("Preview generation skipped: inputs unchanged")
             return
         
+        signature_data = self._signature_data_cache
+        if signature_data is None:
+            try:
+                signature_data = SignatureData(
+                    name=form_data["name"],
+                    position=form_data["position"],
+                    address=form_data["address"],
+                    phone=form_data.get("phone", ""),
+                    mobile=form_data.get("mobile", ""),
+                    email=form_data["email"],
+                    website=form_data.get("website", "")
+                )
+            except ValueError as e:
+                error_msg = f"Invalid signature data: {str(e)}"
+                self.set_status(error_msg)
+                logger.error(error_msg)
+                return
+            self._signature_data_cache = signature_data
+        
+        # The displayed preview is about to be replaced
+        self._last_render_key = None
+        
         # Disable preview button and show loading indicator
         self.preview_button.config(state="disabled")
         self.set_status("Generating preview...")
         self._show_preview_loading()
         
+        # Capture the logo choice on the UI thread
+        logo_path = self.selected_logo_path
+        
         # Run preview generation in background thread
         def generate_preview_in_background():
             try:
@@ -409,12 +495,14 @@ class SignatureTab(ValidationMixin):
                 # Generate preview (this is the slow operation)
                 preview_image = self.preview_generator.generate_preview(
                     signature_data,
-                    self.selected_logo_path
+                    logo_path
                 )
                 
                 # Update UI from main thread (check if widget still exists)
                 try:
-                    self.frame.after(0, lambda: self._on_preview_success(preview_image))
+                    self.frame.after(
+                        0, lambda: self._on_preview_success(preview_image, render_key)
+                    )
                 except RuntimeError:
                     # Widget was destroyed or no main loop running (e.g., in tests)
                     logger.debug("Cannot update UI: no main loop running")
@@ -434,33 +522,45 @@ class SignatureTab(ValidationMixin):
         thread.start()
     
     def _show_preview_loading(self) -> None:
-        """Show loading indicator in preview area."""
+        """Show loading indicator in preview area.
+        
+        The current PhotoImage is kept so the next preview can be pasted
+        into it instead of allocating a new Tk image.
+        """
         self.preview_image_label.config(
             text="Generating preview...\nPlease wait...",
             image=""
         )
-        self.preview_photo = None
     
-    def _on_preview_success(self, preview_image) -> None:
+    def _on_preview_success(self, preview_image, render_key: Optional[tuple] = None) -> None:
         """Handle successful preview generation.
         
         Args:
             preview_image: PIL Image object containing the preview
+            render_key: Fingerprint of the inputs the preview was rendered from
         """
-        from PIL import ImageTk
-        
         # Re-enable preview button
         self.preview_button.config(state="normal")
         
-        # Convert to PhotoImage for Tkinter
-        photo = ImageTk.PhotoImage(preview_image)
+        # Reuse the existing PhotoImage when the preview size is unchanged
+        photo = self.preview_photo
+        if photo is not None and (photo.width(), photo.height()) == preview_image.size:
+            photo.paste(preview_image)
+        else:
+            # Convert to PhotoImage for Tkinter
+            photo = ImageTk.PhotoImage(preview_image)
+            self.preview_photo = photo  # Keep reference to prevent garbage collection
         
         # Update the preview display
         self.preview_image_label.config(image=photo, text="")
-        self.preview_photo = photo  # Keep reference to prevent garbage collection
         
-        # Update canvas scroll region
-        self.preview_canvas.configure(scrollregion=self.preview_canvas.bbox("all"))
+        # Update canvas scroll region only when the preview extent changed
+        bbox = self.preview_canvas.bbox("all")
+        if bbox != self._last_scrollregion:
+            self.preview_canvas.configure(scrollregion=bbox)
+            self._last_scrollregion = bbox
+        
+        self._last_render_key = render_key
         
         self.set_status("Preview generated successfully")
         logger.info("Preview generated and displayed successfully")
@@ -487,8 +587,6 @@ class SignatureTab(ValidationMixin):
     
     def _create_action_buttons(self) -> None:
         """Create action buttons (generate, profile operations, etc.)."""
-        from tkinter import ttk
-        
         # Create a frame for action buttons
         button_frame = ttk.Frame(self.frame, padding="10")
         button_frame.grid(row=3, column=0, sticky="ew", padx=5, pady=5)
@@ -533,8 +631,6 @@ class SignatureTab(ValidationMixin):
     
     def _create_status_bar(self) -> None:
         """Create status bar for messages."""
-        from tkinter import ttk
-        
         # Create a frame for status bar
         status_frame = ttk.Frame(self.frame, relief="sunken", padding="2")
         status_frame.grid(row=4, column=0, sticky="ew", padx=5, pady=5)
@@ -545,6 +641,43 @@ class SignatureTab(ValidationMixin):
         
         logger.debug("Status bar created")
     
+    def _schedule_field_change(self, field_name: str) -> None:
+        """Queue field validation for the next idle cycle.
+        
+        Repeated writes to the same field before the queue drains are
+        coalesced into a single validation pass.
+        
+        Args:
+            field_name: Name of the field that changed
+        """
+        # Any write makes the cached form values stale
+        self._form_data_cache = None
+        if self._suppress_validation or field_name in self._pending_field_changes:
+            return
+        self._pending_field_changes.add(field_name)
+        self.frame.after_idle(self._run_pending_field_change, field_name)
+    
+    def _run_pending_field_change(self, field_name: str) -> None:
+        """Run a queued field change handler.
+        
+        Args:
+            field_name: Name of the field that changed
+        """
+        self._pending_field_changes.discard(field_name)
+        self._on_field_change(field_name)
+    
+    def _validate_pending_fields(self) -> None:
+        """Validate fields whose queued change handler has not run yet.
+        
+        The queued handlers still run at idle time; validating a field again
+        with the same value is harmless.
+        """
+        if not self._pending_field_changes:
+            return
+        for field_name in self._pending_field_changes:
+            self._validate_field(field_name, self.field_vars[field_name].get())
+        self._update_generate_button_state()
+    
     def _on_field_change(self, field_name: str) -> None:
         """Handle field value change and trigger validation.
         
@@ -569,47 +702,45 @@ class SignatureTab(ValidationMixin):
         Returns:
             True if field is valid, False otherwise
         """
+        self._form_data_cache = None
         widget = self.field_widgets[field_name]
         
         # Determine which validation to apply
-        if field_name == "email":
-            is_valid, error_message = self.validator.validate_email(value)
-        elif field_name in ("phone", "mobile"):
-            is_valid, error_message = self.validator.validate_phone(value)
-        elif field_name in ("name", "position", "address"):
-            # Required fields
-            is_valid, error_message = self.validator.validate_required_field(value, field_name.capitalize())
-        else:
-            # Optional fields (website)
-            is_valid = True
-            error_message = ""
+        validate = _VALIDATOR_BY_FIELD.get(field_name, _validate_optional)
+        is_valid, error_message = validate(self.validator, value)
         
-        # Update visual feedback
+        # Update visual feedback; set_field_valid clears any error itself and
+        # show_validation_error marks the field invalid
         if is_valid:
-            self.clear_validation_error(widget)
             self.set_field_valid(widget)
         else:
-            self.set_field_invalid(widget)
             self.show_validation_error(widget, error_message)
         
         # Update validation state
         self.field_valid[field_name] = is_valid
+        bit = _REQUIRED_FIELD_BITS.get(field_name, 0)
+        if is_valid:
+            self._required_valid_mask |= bit
+        else:
+            self._required_valid_mask &= ~bit
         
-        logger.debug(f"Field '{field_name}' validation: {is_valid}")
+        # Keep the cached signature data in step with the changed field
+        if self._signature_data_cache is not None:
+            try:
+                self._signature_data_cache = dataclasses.replace(
+                    self._signature_data_cache, **{field_name: value}
+                )
+            except ValueError:
+                # Rebuilt from the form once it is valid again
+                self._signature_data_cache = None
+        
+        logger.debug("Field '%s' validation: %s", field_name, is_valid)
         return is_valid
     
     def _update_generate_button_state(self) -> None:
         """Update the generate button enabled/disabled state based on form validity."""
-        # Check if all required fields are valid
-        required_fields = ["name", "position", "address", "email"]
-        
-        # All required fields must be valid
-        all_valid = all(
-            self.field_valid.get(field, False) for field in required_fields
-        )
-        
         # Enable button if all required fields are valid
-        if all_valid:
+        if self.is_form_valid():
             self.generate_button.config(state="normal")
             logger.debug("Generate button enabled")
         else:
@@ -617,12 +748,12 @@ class SignatureTab(ValidationMixin):
             logger.debug("Generate button disabled")
     
     def _on_generate_clicked(self) -> None:
-        """Handle generate button click."""
-        import os
-        import threading
-        from tkinter import filedialog, messagebox
-        from ...domain.models import SignatureData
+        """Handle generate button click.
         
+        The save dialog is opened from a deferred callback so Tk can repaint
+        first. The button is disabled right away so repeated clicks cannot
+        queue a second dialog.
+        """
         logger.info("Generate button clicked")
         
         # Check if form is valid
@@ -631,6 +762,11 @@ class SignatureTab(ValidationMixin):
             logger.warning("Signature generation skipped: form is invalid")
             return
         
+        self.generate_button.config(state="disabled")
+        self.frame.after(0, self._generate_clicked_deferred)
+    
+    def _generate_clicked_deferred(self) -> None:
+        """Ask for the output path and start signature generation."""
         # Ask user for output path
         default_filename = "email_signature.png"
         file_path = filedialog.asksaveasfilename(
@@ -646,6 +782,7 @@ class SignatureTab(ValidationMixin):
         # If user cancelled the dialog
         if not file_path:
             logger.debug("Signature generation cancelled by user")
+            self._update_generate_button_state()
             return
         
         # Get signature data from form
@@ -666,53 +803,47 @@ class SignatureTab(ValidationMixin):
             self.set_status(error_msg)
             messagebox.showerror("Validation Error", error_msg)
             logger.error(error_msg)
+            self._update_generate_button_state()
             return
         
-        # Disable generate button and show loading indicator
-        self.generate_button.config(state="disabled")
+        # Show loading indicator (the button is already disabled)
         self.set_status("Generating signature... Please wait...")
         self._show_generation_loading()
         
-        # Run generation in background thread to avoid blocking UI
-        def generate_in_background():
-            try:
-                logger.info(f"Generating signature for {signature_data.name} to {file_path}")
-                
-                # Use the use case to generate the signature
-                # If a custom logo is selected, temporarily override the logo loader
-                if self.selected_logo_path:
-                    # Save original search paths
-                    original_paths = self.use_case.logo_loader.search_paths
-                    # Set custom logo path
-                    self.use_case.logo_loader.search_paths = [self.selected_logo_path]
-                    try:
-                        output_path = self.use_case.execute(signature_data, file_path)
-                    finally:
-                        # Restore original search paths
-                        self.use_case.logo_loader.search_paths = original_paths
-                else:
-                    output_path = self.use_case.execute(signature_data, file_path)
-                
-                # Update UI from main thread (check if widget still exists)
-                try:
-                    self.frame.after(0, lambda: self._on_generation_success(output_path))
-                except RuntimeError:
-                    # Widget was destroyed or no main loop running (e.g., in tests)
-                    logger.debug("Cannot update UI: no main loop running")
-                
-            except Exception as e:
-                error_msg = f"Failed to generate signature: {str(e)}"
-                logger.error(error_msg, exc_info=True)
-                # Update UI from main thread (check if widget still exists)
-                try:
-                    self.frame.after(0, lambda: self._on_generation_error(error_msg))
-                except RuntimeError:
-                    # Widget was destroyed or no main loop running (e.g., in tests)
-                    logger.debug("Cannot update UI: no main loop running")
+        # Capture the logo choice on the UI thread
+        logo_path = self.selected_logo_path
         
-        # Start background thread
-        thread = threading.Thread(target=generate_in_background, daemon=True)
-        thread.start()
+        # Run generation on the worker thread to avoid blocking UI
+        logger.info("Generating signature for %s to %s", signature_data.name, file_path)
+        future = self._executor.submit(
+            self.use_case.execute, signature_data, file_path, logo_path_override=logo_path
+        )
+        future.add_done_callback(self._on_generation_done)
+    
+    def _on_generation_done(self, future: "Future[str]") -> None:
+        """Hand a finished generation task back to the UI thread.
+        
+        Called on the worker thread when the task completes.
+        
+        Args:
+            future: Completed generation task
+        """
+        if future.cancelled():
+            return
+        
+        error = future.exception()
+        # Update UI from main thread (check if widget still exists)
+        try:
+            if error is None:
+                output_path = future.result()
+                self.frame.after(0, lambda: self._on_generation_success(output_path))
+            else:
+                error_msg = f"Failed to generate signature: {str(error)}"
+                logger.error(error_msg, exc_info=error)
+                self.frame.after(0, lambda: self._on_generation_error(error_msg))
+        except RuntimeError:
+            # Widget was destroyed or no main loop running (e.g., in tests)
+            logger.debug("Cannot update UI: no main loop running")
     
     def _show_generation_loading(self) -> None:
         """Show loading indicator during signature generation."""
@@ -727,11 +858,6 @@ class SignatureTab(ValidationMixin):
         Args:
             output_path: Path where signature was saved
         """
-        import os
-        from pathlib import Path
-        from tkinter import messagebox
-        from ...infrastructure.platform_utils import SystemCommandExecutor, ErrorMessageFormatter, get_platform
-        
         # Re-enable generate button and restore text
         self.generate_button.config(state="normal", text="Generate Signature")
         
@@ -741,11 +867,7 @@ class SignatureTab(ValidationMixin):
         
         # Get platform-appropriate success message
         platform_name = get_platform()
-        platform_display = {
-            'windows': 'Windows',
-            'darwin': 'macOS',
-            'linux': 'Linux'
-        }.get(platform_name, platform_name)
+        platform_display = _PLATFORM_DISPLAY.get(platform_name, platform_name)
         
         # Show success message with option to open containing folder
         result = messagebox.askyesno(
@@ -754,25 +876,39 @@ class SignatureTab(ValidationMixin):
             icon="info"
         )
         
-        if result:
-            # Open the containing folder using SystemCommandExecutor
-            folder_path = Path(os.path.dirname(output_path))
+        if not result:
+            return
+        
+        folder_path = Path(os.path.dirname(output_path))
+        
+        # Launching the file manager can take a noticeable time, so it runs
+        # on the worker thread and reports back through the main loop
+        def open_containing_folder():
             success = SystemCommandExecutor.open_folder(folder_path)
             
-            if success:
-                logger.info(f"Opened folder: {folder_path}")
-                self.set_status(f"Opened folder in {platform_display} file manager")
-            else:
-                # Format platform-specific error message
-                error_msg = ErrorMessageFormatter.format_command_error(
-                    SystemCommandExecutor.get_open_folder_command(folder_path),
-                    f"Could not open folder in {platform_display} file manager"
-                )
-                logger.error(f"Failed to open folder: {folder_path}")
-                messagebox.showwarning(
-                    "Warning", 
-                    f"Signature saved successfully, but could not open the folder.\n\n{error_msg}"
-                )
+            try:
+                if success:
+                    logger.info(f"Opened folder: {folder_path}")
+                    self.frame.after(
+                        0,
+                        lambda: self.set_status(f"Opened folder in {platform_display} file manager")
+                    )
+                else:
+                    # Format platform-specific error message
+                    error_msg = ErrorMessageFormatter.format_command_error(
+                        SystemCommandExecutor.get_open_folder_command(folder_path),
+                        f"Could not open folder in {platform_display} file manager"
+                    )
+                    logger.error(f"Failed to open folder: {folder_path}")
+                    self.frame.after(0, lambda: messagebox.showwarning(
+                        "Warning",
+                        f"Signature saved successfully, but could not open the folder.\n\n{error_msg}"
+                    ))
+            except RuntimeError:
+                # Widget was destroyed or no main loop running (e.g., in tests)
+                logger.debug("Cannot update UI: no main loop running")
+        
+        self._executor.submit(open_containing_folder)
     
     def _on_generation_error(self, error_message: str) -> None:
         """Handle signature generation error.
@@ -780,8 +916,6 @@ class SignatureTab(ValidationMixin):
         Args:
             error_message: Error message to display
         """
-        from tkinter import messagebox
-        
         # Re-enable generate button and restore text
         self.generate_button.config(state="normal", text="Generate Signature")
         
@@ -799,7 +933,7 @@ class SignatureTab(ValidationMixin):
             message: Status message to display
         """
         self.status_label.config(text=message)
-        logger.debug(f"Status updated: {message}")
+        logger.debug("Status updated: %s", message)
     
     def get_signature_data(self) -> dict[str, str]:
         """Get the current signature data from the form.
@@ -807,10 +941,13 @@ class SignatureTab(ValidationMixin):
         Returns:
             Dictionary of field names to values
         """
-        return {
-            field_name: var.get()
-            for field_name, var in self.field_vars.items()
-        }
+        if self._form_data_cache is None:
+            self._form_data_cache = {
+                field_name: var.get()
+                for field_name, var in self.field_vars.items()
+            }
+        # Copy so callers cannot alter the cached values
+        return dict(self._form_data_cache)
     
     def is_form_valid(self) -> bool:
         """Check if the entire form is valid.
@@ -818,16 +955,10 @@ class SignatureTab(ValidationMixin):
         Returns:
             True if all required fields are valid, False otherwise
         """
-        required_fields = ["name", "position", "address", "email"]
-        return all(
-            self.field_valid.get(field, False) for field in required_fields
-        )
+        return self._required_valid_mask == _REQUIRED_ALL
     
     def _on_save_profile_clicked(self) -> None:
         """Handle save profile button click."""
-        from tkinter import simpledialog, messagebox
-        from ...domain.models import SignatureData
-        
         logger.info("Save profile button clicked")
         
         # Prompt user for profile name
@@ -855,17 +986,17 @@ class SignatureTab(ValidationMixin):
                 website=form_data.get("website", "")
             )
             
-            # Save the profile
-            self.profile_manager.save_profile(profile_name, signature_data)
+            # Reject unusable names now rather than when the queued write runs;
+            # the sanitized name itself is derived again by save_profile
+            self.profile_manager.sanitize_name(profile_name)
             
-            # Show success message
-            self.set_status(f"Profile '{profile_name}' saved successfully")
-            messagebox.showinfo(
-                "Success",
-                f"Profile '{profile_name}' has been saved successfully.",
-                parent=self.frame
-            )
-            logger.info(f"Profile '{profile_name}' saved successfully")
+            # Queue the profile; repeated saves within the flush delay are
+            # coalesced into a single write, which reports the outcome
+            self._dirty_profiles[profile_name] = signature_data
+            self._schedule_profile_flush()
+            
+            self.set_status(f"Profile '{profile_name}' queued for saving")
+            logger.info(f"Profile '{profile_name}' queued for saving")
             
         except ValueError as e:
             error_msg = f"Invalid profile data: {str(e)}"
@@ -878,15 +1009,50 @@ class SignatureTab(ValidationMixin):
             messagebox.showerror("Error", error_msg, parent=self.frame)
             logger.error(error_msg, exc_info=True)
     
+    def _schedule_profile_flush(self) -> None:
+        """Schedule a write of all queued profiles if one is not pending."""
+        if self._profile_flush_scheduled:
+            return
+        self._profile_flush_scheduled = True
+        self.frame.after(_PROFILE_FLUSH_DELAY_MS, self._flush_profiles)
+
+    def _flush_profiles(self, interactive: bool = True) -> None:
+        """Write all queued profiles to disk.
+        
+        Args:
+            interactive: Whether to report the outcome in dialogs; when False
+                (e.g. while the tab is being torn down) it is only logged
+        """
+        self._profile_flush_scheduled = False
+        dirty, self._dirty_profiles = self._dirty_profiles, {}
+        for profile_name, signature_data in dirty.items():
+            try:
+                self.profile_manager.save_profile(profile_name, signature_data)
+            except Exception as e:
+                # Keep the data queued for the next flush unless a newer
+                # save of the same profile has replaced it meanwhile
+                self._dirty_profiles.setdefault(profile_name, signature_data)
+                error_msg = f"Failed to save profile '{profile_name}': {str(e)}"
+                logger.error(error_msg, exc_info=True)
+                if interactive:
+                    self.set_status(error_msg)
+                    messagebox.showerror("Error", error_msg, parent=self.frame)
+            else:
+                logger.info(f"Profile '{profile_name}' saved successfully")
+                if interactive:
+                    self.set_status(f"Profile '{profile_name}' saved successfully")
+                    messagebox.showinfo(
+                        "Success",
+                        f"Profile '{profile_name}' has been saved successfully.",
+                        parent=self.frame
+                    )
+
     def _on_load_profile_clicked(self) -> None:
         """Handle load profile button click."""
-        from tkinter import messagebox
-        import tkinter as tk
-        from tkinter import ttk
-        
         logger.info("Load profile button clicked")
         
-        # Get list of available profiles
+        # Get list of available profiles, including any not yet written
+        self._flush_profiles()
         try:
             profiles = self.profile_manager.list_profiles()
         except Exception as e:
@@ -906,11 +1072,75 @@ class SignatureTab(ValidationMixin):
             logger.debug("No profiles available to load")
             return
         
-        # Create a dialog to select a profile
+        selected_profile = self._pick_profile(
+            profiles, "Load Profile", "Load", confirm_on_double_click=True
+        )
+        
+        # If a profile was selected, load it
+        if selected_profile:
+            self._load_profile(selected_profile)
+    
+    def _pick_profile(
+        self,
+        profiles: list[str],
+        title: str,
+        action_label: str,
+        confirm_on_double_click: bool = False,
+    ) -> Optional[str]:
+        """Show a modal profile picker and wait for the user's choice.
+        
+        The dialog for each title is built once and hidden between uses.
+        
+        Args:
+            profiles: Profile names to offer
+            title: Dialog title
+            action_label: Text of the confirm button
+            confirm_on_double_click: Whether double-clicking an entry confirms it
+            
+        Returns:
+            Selected profile name, or None if the dialog was cancelled
+        """
+        picker = self._profile_pickers.get(title)
+        if picker is None:
+            picker = self._build_profile_picker_dialog(
+                title, action_label, confirm_on_double_click
+            )
+            self._profile_pickers[title] = picker
+        dialog, listbox, choice = picker
+        
+        # Repopulate listbox in a single call and select the first item
+        listbox.delete(0, tk.END)
+        listbox.insert(tk.END, *profiles)
+        if profiles:
+            listbox.selection_set(0)
+        
+        dialog.deiconify()
+        dialog.grab_set()
+        
+        # Wait until a button (or the window close box) sets the choice
+        dialog.wait_variable(choice)
+        
+        dialog.grab_release()
+        dialog.withdraw()
+        return choice.get() or None
+    
+    def _build_profile_picker_dialog(
+        self, title: str, action_label: str, confirm_on_double_click: bool
+    ) -> tuple["tk.Toplevel", "tk.Listbox", "tk.StringVar"]:
+        """Create a hidden profile picker dialog.
+        
+        Args:
+            title: Dialog title
+            action_label: Text of the confirm button
+            confirm_on_double_click: Whether double-clicking an entry confirms it
+            
+        Returns:
+            Tuple of (dialog, listbox, variable set to the chosen profile)
+        """
         dialog = tk.Toplevel(self.frame)
-        dialog.title("Load Profile")
+        dialog.withdraw()
+        dialog.title(title)
         dialog.transient(self.frame)
-        dialog.grab_set()
         
         # Center the dialog
         dialog.geometry("300x400")
@@ -920,7 +1150,9 @@ class SignatureTab(ValidationMixin):
         content_frame.pack(fill="both", expand=True)
         
         # Label
-        ttk.Label(content_frame, text="Select a profile to load:").pack(pady=5)
+        ttk.Label(
+            content_frame, text=f"Select a profile to {action_label.lower()}:"
+        ).pack(pady=5)
         
         # Listbox with scrollbar
         list_frame = ttk.Frame(content_frame)
@@ -933,42 +1165,29 @@ class SignatureTab(ValidationMixin):
         listbox.pack(side="left", fill="both", expand=True)
         scrollbar.config(command=listbox.yview)
         
-        # Populate listbox
-        for profile in profiles:
-            listbox.insert(tk.END, profile)
-        
-        # Select first item by default
-        if profiles:
-            listbox.selection_set(0)
-        
-        # Variable to store selected profile
-        selected_profile = [None]
+        # Set to the chosen profile, or "" on cancel
+        choice = tk.StringVar(dialog)
         
-        def on_load():
+        def on_confirm():
             selection = listbox.curselection()
             if selection:
-                selected_profile[0] = listbox.get(selection[0])
-                dialog.destroy()
+                choice.set(listbox.get(selection[0]))
         
         def on_cancel():
-            dialog.destroy()
+            choice.set("")
         
-        # Double-click to load
-        listbox.bind("<Double-Button-1>", lambda e: on_load())
+        if confirm_on_double_click:
+            listbox.bind("<Double-Button-1>", lambda e: on_confirm())
+        dialog.protocol("WM_DELETE_WINDOW", on_cancel)
         
         # Buttons
         button_frame = ttk.Frame(content_frame)
         button_frame.pack(pady=5)
         
-        ttk.Button(button_frame, text="Load", command=on_load).pack(side="left", padx=5)
+        ttk.Button(button_frame, text=action_label, command=on_confirm).pack(side="left", padx=5)
         ttk.Button(button_frame, text="Cancel", command=on_cancel).pack(side="left", padx=5)
         
-        # Wait for dialog to close
-        dialog.wait_window()
-        
-        # If a profile was selected, load it
-        if selected_profile[0]:
-            self._load_profile(selected_profile[0])
+        return dialog, listbox, choice
     
     def _load_profile(self, profile_name: str) -> None:
         """Load a profile and populate form fields.
@@ -976,25 +1195,21 @@ class SignatureTab(ValidationMixin):
         Args:
             profile_name: Name of the profile to load
         """
-        from tkinter import messagebox
-        
         try:
             # Load the profile
             signature_data = self.profile_manager.load_profile(profile_name)
             
-            # Populate form fields
-            self.field_vars["name"].set(signature_data.name)
-            self.field_vars["position"].set(signature_data.position)
-            self.field_vars["address"].set(signature_data.address)
-            self.field_vars["phone"].set(signature_data.phone)
-            self.field_vars["mobile"].set(signature_data.mobile)
-            self.field_vars["email"].set(signature_data.email)
-            self.field_vars["website"].set(signature_data.website)
+            # Populate form fields without queuing a change handler per field
+            self._suppress_validation = True
+            try:
+                for field_name, var in self.field_vars.items():
+                    var.set(getattr(signature_data, field_name))
+            finally:
+                self._suppress_validation = False
             
-            # Trigger validation for all fields
-            for field_name in self.field_vars.keys():
-                value = self.field_vars[field_name].get()
-                self._validate_field(field_name, value)
+            # Validate all fields in a single pass
+            for field_name in self.field_vars:
+                self._validate_field(field_name, getattr(signature_data, field_name))
             
             # Update generate button state
             self._update_generate_button_state()
@@ -1030,13 +1245,10 @@ class SignatureTab(ValidationMixin):
     
     def _on_delete_profile_clicked(self) -> None:
         """Handle delete profile button click."""
-        from tkinter import messagebox
-        import tkinter as tk
-        from tkinter import ttk
-        
         logger.info("Delete profile button clicked")
         
-        # Get list of available profiles
+        # Get list of available profiles, including any not yet written
+        self._flush_profiles()
         try:
             profiles = self.profile_manager.list_profiles()
         except Exception as e:
@@ -1056,75 +1268,20 @@ class SignatureTab(ValidationMixin):
             logger.debug("No profiles available to delete")
             return
         
-        # Create a dialog to select a profile
-        dialog = tk.Toplevel(self.frame)
-        dialog.title("Delete Profile")
-        dialog.transient(self.frame)
-        dialog.grab_set()
-        
-        # Center the dialog
-        dialog.geometry("300x400")
-        
-        # Create frame for content
-        content_frame = ttk.Frame(dialog, padding="10")
-        content_frame.pack(fill="both", expand=True)
-        
-        # Label
-        ttk.Label(content_frame, text="Select a profile to delete:").pack(pady=5)
-        
-        # Listbox with scrollbar
-        list_frame = ttk.Frame(content_frame)
-        list_frame.pack(fill="both", expand=True, pady=5)
-        
-        scrollbar = ttk.Scrollbar(list_frame)
-        scrollbar.pack(side="right", fill="y")
-        
-        listbox = tk.Listbox(list_frame, yscrollcommand=scrollbar.set)
-        listbox.pack(side="left", fill="both", expand=True)
-        scrollbar.config(command=listbox.yview)
-        
-        # Populate listbox
-        for profile in profiles:
-            listbox.insert(tk.END, profile)
-        
-        # Select first item by default
-        if profiles:
-            listbox.selection_set(0)
-        
-        # Variable to store selected profile
-        selected_profile = [None]
-        
-        def on_delete():
-            selection = listbox.curselection()
-            if selection:
-                selected_profile[0] = listbox.get(selection[0])
-                dialog.destroy()
-        
-        def on_cancel():
-            dialog.destroy()
-        
-        # Buttons
-        button_frame = ttk.Frame(content_frame)
-        button_frame.pack(pady=5)
-        
-        ttk.Button(button_frame, text="Delete", command=on_delete).pack(side="left", padx=5)
-        ttk.Button(button_frame, text="Cancel", command=on_cancel).pack(side="left", padx=5)
-        
-        # Wait for dialog to close
-        dialog.wait_window()
+        selected_profile = self._pick_profile(profiles, "Delete Profile", "Delete")
         
         # If a profile was selected, confirm and delete it
-        if selected_profile[0]:
+        if selected_profile:
             # Confirm deletion
             result = messagebox.askyesno(
                 "Confirm Delete",
-                f"Are you sure you want to delete the profile '{selected_profile[0]}'?\n\nThis action cannot be undone.",
+                f"Are you sure you want to delete the profile '{selected_profile}'?\n\nThis action cannot be undone.",
                 parent=self.frame,
                 icon="warning"
             )
             
             if result:
-                self._delete_profile(selected_profile[0])
+                self._delete_profile(selected_profile)
     
     def _delete_profile(self, profile_name: str) -> None:
         """Delete a profile.
@@ -1132,8 +1289,6 @@ class SignatureTab(ValidationMixin):
         Args:
             profile_name: Name of the profile to delete
         """
-        from tkinter import messagebox
-        
         try:
             # Delete the profile
             self.profile_manager.delete_profile(profile_name)
@@ -1161,4 +1316,10 @@ class SignatureTab(ValidationMixin):
     def cleanup(self) -> None:
         """Clean up resources (temp files, etc.)."""
         logger.info("Cleaning up SignatureTab resources")
+        # The window is going away, so write outstanding profiles without dialogs
+        self._flush_profiles(interactive=False)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for dialog, _, _ in self._profile_pickers.values():
+            dialog.destroy()
+        self._profile_pickers.clear()
         self.preview_generator.cleanup()
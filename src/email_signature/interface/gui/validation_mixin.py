@@ -1,27 +1,155 @@
 """Validation feedback mixin for GUI widgets."""
 
 import logging
+import sys
+import weakref
 from typing import TYPE_CHECKING, Optional
 
+try:
+    from tkinter import TclError, ttk
+except ImportError:  # Tkinter is not available in this Python build
+    TclError = Exception
+    ttk = None
+
 if TYPE_CHECKING:
     import tkinter as tk
 
 logger = logging.getLogger(__name__)
 
+# Error label appearance
+_ERROR_FONT = ("Helvetica", 9)
+_ERROR_FG = "red"
+_ERROR_PADX = (5, 0)
+
+# Field backgrounds for each validation state
+_VALID_BG = "#e8f5e9"  # Light green
+_INVALID_BG = "#ffebee"  # Light red
+
+# Themed entry styles carrying the validation backgrounds
+_STYLE_ERR = sys.intern("Error.TEntry")
+_STYLE_OK = sys.intern("Success.TEntry")
+_ENTRY_STYLE_FOR_BG = {_INVALID_BG: _STYLE_ERR, _VALID_BG: _STYLE_OK}
+
+# Root windows whose Tk interpreter already has the entry styles configured
+_STYLED_ROOTS: "weakref.WeakSet[tk.Misc]" = weakref.WeakSet()
+
+# How validation backgrounds can be applied to a widget class
+_KIND_NONE = 0  # Not configurable
+_KIND_TTK_ENTRY = 1  # Themed entry; coloured through a ttk style
+_KIND_CLASSIC = 2  # Classic Tk widget with background/foreground options
+
+# Widget kind by widget class, filled in as classes are first seen
+_WIDGET_KIND: dict[type, int] = {}
+
+# Appearance options saved and restored for each widget class
+_APPEARANCE_OPTIONS: dict[type, tuple[str, ...]] = {}
+
+
+def _widget_kind(widget: "tk.Widget") -> int:
+    """Get how validation backgrounds apply to a widget.
+    
+    Args:
+        widget: The widget to classify
+        
+    Returns:
+        One of the _KIND_* constants
+    """
+    widget_type = type(widget)
+    kind = _WIDGET_KIND.get(widget_type)
+    if kind is None:
+        if ttk is not None and isinstance(widget, ttk.Entry):
+            kind = _KIND_TTK_ENTRY
+        elif hasattr(widget, 'configure'):
+            kind = _KIND_CLASSIC
+        else:
+            kind = _KIND_NONE
+        _WIDGET_KIND[widget_type] = kind
+    return kind
+
+
+def _ensure_entry_styles(widget: "tk.Widget") -> None:
+    """Configure the validation entry styles once per Tk interpreter.
+    
+    Args:
+        widget: Any widget belonging to the interpreter
+    """
+    root = widget
+    while root.master is not None:
+        root = root.master
+    if root in _STYLED_ROOTS:
+        return
+    style = ttk.Style(root)
+    for style_name, background in ((_STYLE_ERR, _INVALID_BG), (_STYLE_OK, _VALID_BG)):
+        style.configure(style_name, fieldbackground=background)
+    _STYLED_ROOTS.add(root)
+
+
+class _FieldState:
+    """Validation feedback state for a single widget."""
+
+    __slots__ = ("label", "label_shown", "pending_text", "original", "style", "grid_pos")
+
+    # Error label shown below the widget, if any
+    label: "Optional[tk.Label]"
+    # Whether the label is on screen; None until it is first placed
+    label_shown: Optional[bool]
+    # Message waiting to be written to the shown label on the next idle
+    pending_text: Optional[str]
+    # Widget colours saved before validation styling was first applied;
+    # kept for the widget's lifetime so they are read only once
+    original: Optional[dict]
+    # Background currently applied for validation, or None if unstyled
+    style: Optional[str]
+    # Widget's (row, column, columnspan), or () if it is not gridded
+    grid_pos: Optional[tuple[int, ...]]
+
+    def __init__(self) -> None:
+        self.label = None
+        self.label_shown = None
+        self.pending_text = None
+        self.original = None
+        self.style = None
+        self.grid_pos = None
+
 
 class ValidationMixin:
     """Mixin class providing visual validation feedback for form widgets.
     
     This mixin provides methods to show validation errors and set field
     validity states with visual indicators (colors, borders, etc.).
+    
+    The mixin's own state lives in ``__slots__``. Classes that mix it in
+    keep their usual ``__dict__`` unless they declare ``__slots__`` too,
+    and must not combine it with another base that defines non-empty
+    slots.
     """
 
+    __slots__ = ("_fields",)
+
+    # Per-widget validation state keyed by id(widget); entries are
+    # removed by a finalizer when their widget is garbage collected
+    _fields: "dict[int, _FieldState]"
+
     def __init__(self) -> None:
         """Initialize the validation mixin."""
-        # Store validation error labels for each widget
-        self._validation_labels: dict["tk.Widget", "tk.Label"] = {}
-        # Store original widget configurations for restoration
-        self._original_configs: dict["tk.Widget", dict] = {}
+        self._fields = {}
+
+    def _field_state(self, widget: "tk.Widget") -> _FieldState:
+        """Get the validation state for a widget, creating it if needed.
+        
+        Args:
+            widget: The widget to get the state for
+            
+        Returns:
+            The widget's validation state
+        """
+        widget_id = id(widget)
+        state = self._fields.get(widget_id)
+        if state is None:
+            state = _FieldState()
+            self._fields[widget_id] = state
+            weakref.finalize(widget, self._fields.pop, widget_id, None)
+        return state
 
     def show_validation_error(self, widget: "tk.Widget", message: str) -> None:
         """Show a validation error message for a widget.
@@ -30,16 +158,23 @@ class ValidationMixin:
             widget: The widget to show the error for
             message: The error message to display
         """
-        import tkinter as tk
-        from tkinter import ttk
-
         # Set the widget to invalid state
         self.set_field_invalid(widget)
+        state = self._field_state(widget)
+
+        if state.label_shown:
+            # The error is already on screen; coalesce rapid message changes
+            # into a single label update per idle cycle
+            if state.pending_text is None:
+                widget.after_idle(self._flush_validation_error, state)
+            state.pending_text = message
+            logger.debug("Queued validation error for widget: %s", message)
+            return
 
         # Check if we already have a label for this widget
-        if widget in self._validation_labels:
-            error_label = self._validation_labels[widget]
-            error_label.config(text=message)
+        state.pending_text = None
+        if state.label is not None:
+            state.label.config(text=message)
         else:
             # Create a new error label
             # Get the parent frame
@@ -49,34 +184,67 @@ class ValidationMixin:
             error_label = ttk.Label(
                 parent,
                 text=message,
-                foreground="red",
-                font=("Helvetica", 9)
+                foreground=_ERROR_FG,
+                font=_ERROR_FONT
             )
             
-            # Store the label reference
-            self._validation_labels[widget] = error_label
+            # Store the label reference; it is kept (hidden when the field
+            # is valid) until the widget itself is destroyed
+            state.label = error_label
+            widget.bind("<Destroy>", lambda event: error_label.destroy(), add="+")
             
-            # Position the error label below the widget
-            # Get the widget's grid info
-            grid_info = widget.grid_info()
-            if grid_info:
-                row = int(grid_info.get("row", 0))
-                column = int(grid_info.get("column", 0))
-                columnspan = int(grid_info.get("columnspan", 1))
-                
-                # Place error label in the next row
-                error_label.grid(
-                    row=row + 1,
-                    column=column,
-                    columnspan=columnspan,
-                    sticky="w",
-                    padx=(5, 0)
+            # Get the widget's grid position (layout is fixed once built)
+            if state.grid_pos is None:
+                grid_info = widget.grid_info()
+                state.grid_pos = (
+                    (
+                        int(grid_info.get("row", 0)),
+                        int(grid_info.get("column", 0)),
+                        int(grid_info.get("columnspan", 1)),
+                    )
+                    if grid_info
+                    else ()
                 )
+
+        # Position the error label below the widget
+        if not state.label_shown:
+            if state.grid_pos:
+                if state.label_shown is None:
+                    row, column, columnspan = state.grid_pos
+                    
+                    # Place error label in the next row
+                    state.label.grid(
+                        row=row + 1,
+                        column=column,
+                        columnspan=columnspan,
+                        sticky="w",
+                        padx=_ERROR_PADX
+                    )
+                else:
+                    # Re-show with the grid options kept by grid_remove()
+                    state.label.grid()
             else:
                 # If not using grid, try pack
-                error_label.pack(anchor="w", padx=5)
+                state.label.pack(anchor="w", padx=5)
+            state.label_shown = True
 
-        logger.debug(f"Showing validation error for widget: {message}")
+        logger.debug("Showing validation error for widget: %s", message)
+
+    def _flush_validation_error(self, state: _FieldState) -> None:
+        """Write a queued error message to its label.
+        
+        Args:
+            state: The validation state of the widget the message is for
+        """
+        message, state.pending_text = state.pending_text, None
+        # Drop the message if the error was cleared in the meantime
+        if message is None or not state.label_shown:
+            return
+        try:
+            state.label.config(text=message)
+        except TclError:
+            # The widget and its label were destroyed before the idle cycle
+            logger.debug("Dropped validation error for destroyed widget")
 
     def clear_validation_error(self, widget: "tk.Widget") -> None:
         """Clear the validation error for a widget.
@@ -84,65 +252,113 @@ class ValidationMixin:
         Args:
             widget: The widget to clear the error for
         """
-        # Remove error label if it exists
-        if widget in self._validation_labels:
-            error_label = self._validation_labels[widget]
-            error_label.grid_forget()  # Remove from grid
-            error_label.destroy()
-            del self._validation_labels[widget]
-
-        # Restore original widget appearance
-        if widget in self._original_configs:
+        state = self._fields.get(id(widget))
+        if state is None or (not state.label_shown and state.style is None):
+            # Never styled, or already cleared
+            return
+
+        # Hide error label if it is shown
+        self._hide_error_label(state)
+
+        # Restore original widget appearance if validation styled it
+        if state.style is not None and state.original:
             try:
-                # Restore original configuration
-                original = self._original_configs[widget]
-                if hasattr(widget, 'configure'):
-                    # Only restore style-related configs
-                    if 'background' in original:
-                        widget.configure(background=original['background'])
-                    if 'foreground' in original:
-                        widget.configure(foreground=original['foreground'])
+                # Restore original configuration; only style-related configs
+                widget.configure(**state.original)
             except Exception as e:
-                logger.warning(f"Failed to restore original config: {e}")
-            
-            del self._original_configs[widget]
+                logger.warning("Failed to restore original config: %s", e)
+        state.style = None
 
         logger.debug("Cleared validation error for widget")
 
-    def set_field_valid(self, widget: "tk.Widget") -> None:
-        """Set a field to valid state with green indicator.
+    def _hide_error_label(self, state: _FieldState) -> None:
+        """Take a widget's error label off screen, keeping it for reuse.
         
         Args:
-            widget: The widget to mark as valid
+            state: The widget's validation state
+        """
+        if not state.label_shown:
+            return
+        if state.grid_pos:
+            state.label.grid_remove()  # Remembers grid options for grid()
+        else:
+            state.label.pack_forget()
+        state.label_shown = False
+
+    def _store_original_config(self, widget: "tk.Widget", state: _FieldState) -> None:
+        """Remember a widget's appearance before validation styling changes it.
+        
+        Args:
+            widget: The widget whose configuration to store
+            state: The widget's validation state
+        """
+        if state.original is not None:
+            return
+        try:
+            widget_type = type(widget)
+            options = _APPEARANCE_OPTIONS.get(widget_type)
+            if options is None:
+                if _widget_kind(widget) == _KIND_TTK_ENTRY:
+                    options = ('style',)
+                else:
+                    widget_options = widget.keys()
+                    options = tuple(
+                        key for key in ('background', 'foreground') if key in widget_options
+                    )
+                _APPEARANCE_OPTIONS[widget_type] = options
+            state.original = {key: widget.cget(key) for key in options}
+        except Exception as e:
+            logger.warning("Failed to store original config: %s", e)
+            state.original = {}
+
+    def _transition_to(self, widget: "tk.Widget", background: str) -> _FieldState:
+        """Apply a validation background unless the widget already has it.
+        
+        The original colours are saved once and kept while the widget moves
+        between valid and invalid, so a transition costs a single configure.
+        
+        Args:
+            widget: The widget to restyle
+            background: Validation background to apply
+            
+        Returns:
+            The widget's validation state
         """
-        # Clear any existing error
-        self.clear_validation_error(widget)
+        state = self._field_state(widget)
+        if state.style == background:
+            return state
+
+        state.style = background
+        kind = _widget_kind(widget)
+        if kind == _KIND_NONE:
+            # Nothing to recolour; the error label carries the feedback
+            return state
 
         # Store original config if not already stored
-        if widget not in self._original_configs:
-            try:
-                config = {}
-                if hasattr(widget, 'cget'):
-                    try:
-                        config['background'] = widget.cget('background')
-                    except:
-                        pass
-                    try:
-                        config['foreground'] = widget.cget('foreground')
-                    except:
-                        pass
-                self._original_configs[widget] = config
-            except Exception as e:
-                logger.warning(f"Failed to store original config: {e}")
-                self._original_configs[widget] = {}
+        self._store_original_config(widget, state)
 
-        # Set green border/background to indicate valid
         try:
-            # For Entry widgets, we can set a light green background
-            if hasattr(widget, 'configure'):
-                widget.configure(background="#e8f5e9")  # Light green
+            if kind == _KIND_TTK_ENTRY:
+                # Themed entries take their field background from a style
+                _ensure_entry_styles(widget)
+                widget.configure(style=_ENTRY_STYLE_FOR_BG[background])
+            else:
+                # For Entry widgets, we can set a light background
+                widget.configure(background=background)
         except Exception as e:
-            logger.warning(f"Failed to set valid indicator: {e}")
+            logger.warning("Failed to set validation indicator: %s", e)
+        return state
+
+    def set_field_valid(self, widget: "tk.Widget") -> None:
+        """Set a field to valid state with green indicator.
+        
+        Args:
+            widget: The widget to mark as valid
+        """
+        state = self._transition_to(widget, _VALID_BG)
+
+        # Hide any error label left from the invalid state
+        self._hide_error_label(state)
 
         logger.debug("Set field to valid state")
 
@@ -152,30 +368,6 @@ class ValidationMixin:
         Args:
             widget: The widget to mark as invalid
         """
-        # Store original config if not already stored
-        if widget not in self._original_configs:
-            try:
-                config = {}
-                if hasattr(widget, 'cget'):
-                    try:
-                        config['background'] = widget.cget('background')
-                    except:
-                        pass
-                    try:
-                        config['foreground'] = widget.cget('foreground')
-                    except:
-                        pass
-                self._original_configs[widget] = config
-            except Exception as e:
-                logger.warning(f"Failed to store original config: {e}")
-                self._original_configs[widget] = {}
-
-        # Set red border/background to indicate invalid
-        try:
-            # For Entry widgets, we can set a light red background
-            if hasattr(widget, 'configure'):
-                widget.configure(background="#ffebee")  # Light red
-        except Exception as e:
-            logger.warning(f"Failed to set invalid indicator: {e}")
+        self._transition_to(widget, _INVALID_BG)
 
         logger.debug("Set field to invalid state")
@@ -4,10 +4,42 @@ Automated smoke test for GUI components.
 Tests that GUI can initialize without displaying windows.
 """
 
+import functools
 import sys
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=1)
+def _build_deps():
+    """Load the configuration and build the signature dependencies once.
+
+    Returns:
+        Tuple of (config, use_case, logo_loader, image_renderer, file_service)
+    """
+    from src.email_signature.domain.config import ConfigLoader
+    from src.email_signature.application.use_cases import GenerateSignatureUseCase
+    from src.email_signature.infrastructure.file_service import FileSystemService
+    from src.email_signature.infrastructure.image_renderer import ImageRenderer
+    from src.email_signature.infrastructure.logo_loader import LogoLoader
+
+    config_path = Path("config/default_config.yaml")
+    if config_path.exists():
+        config = ConfigLoader.load(str(config_path))
+    else:
+        config = ConfigLoader.load(None)
+
+    logo_loader = LogoLoader(config.logo_search_paths)
+    image_renderer = ImageRenderer(config)
+    file_service = FileSystemService()
+    use_case = GenerateSignatureUseCase(
+        image_renderer=image_renderer,
+        logo_loader=logo_loader,
+        file_service=file_service,
+        config=config,
+    )
+    return config, use_case, logo_loader, image_renderer, file_service
+
+
 def test_gui_imports():
     """Test that all GUI modules can be imported."""
     print("Testing GUI imports...")
@@ -46,31 +78,11 @@ def test_dependencies_initialization():
     """Test that dependencies can be initialized."""
     print("\nTesting dependency initialization...")
     try:
-        from src.email_signature.domain.config import ConfigLoader
         from src.email_signature.domain.validators import InputValidator
-        from src.email_signature.application.use_cases import GenerateSignatureUseCase
-        from src.email_signature.infrastructure.file_service import FileSystemService
-        from src.email_signature.infrastructure.image_renderer import ImageRenderer
-        from src.email_signature.infrastructure.logo_loader import LogoLoader
-
-        # Load config
-        config_path = Path("config/default_config.yaml")
-        if config_path.exists():
-            config = ConfigLoader.load(str(config_path))
-        else:
-            config = ConfigLoader.load(None)
 
         # Create dependencies
         validator = InputValidator()
-        logo_loader = LogoLoader(config.logo_search_paths)
-        image_renderer = ImageRenderer(config)
-        file_service = FileSystemService()
-        use_case = GenerateSignatureUseCase(
-            image_renderer=image_renderer,
-            logo_loader=logo_loader,
-            file_service=file_service,
-            config=config,
-        )
+        _build_deps()
 
         print("✅ All dependencies initialized successfully")
         return True
@@ -104,27 +116,9 @@ def test_preview_generator():
     print("\nTesting PreviewGenerator...")
     try:
         from src.email_signature.interface.gui.preview_generator import PreviewGenerator
-        from src.email_signature.domain.config import ConfigLoader
-        from src.email_signature.application.use_cases import GenerateSignatureUseCase
-        from src.email_signature.infrastructure.file_service import FileSystemService
-        from src.email_signature.infrastructure.image_renderer import ImageRenderer
-        from src.email_signature.infrastructure.logo_loader import LogoLoader
-
-        config_path = Path("config/default_config.yaml")
-        if config_path.exists():
-            config = ConfigLoader.load(str(config_path))
-        else:
-            config = ConfigLoader.load(None)
-
-        logo_loader = LogoLoader(config.logo_search_paths)
-        image_renderer = ImageRenderer(config)
-        file_service = FileSystemService()
-        use_case = GenerateSignatureUseCase(
-            image_renderer=image_renderer,
-            logo_loader=logo_loader,
-            file_service=file_service,
-            config=config,
-        )
+
+        # Reuse the dependencies built by the initialization check
+        _, use_case, _, _, _ = _build_deps()
 
         pg = PreviewGenerator(use_case)
         print("✅ PreviewGenerator initialized successfully")
@@ -5,23 +5,125 @@ These tests verify that the build system produces correct outputs
 across different platforms and configurations.
 """
 
+import functools
 import os
 import platform
+import re
 import subprocess
 import sys
 from pathlib import Path
 
 import pytest
-from hypothesis import given, settings
-from hypothesis import strategies as st
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DIST_DIR = PROJECT_ROOT / "dist"
+SPEC_DIR = PROJECT_ROOT / "build" / "pyinstaller"
+
+# Skip artifact tests at setup, before any fixture runs, when nothing has been built
+requires_build_artifacts = pytest.mark.skipif(
+    not DIST_DIR.exists(), reason="No build artifacts in dist/ (run a build target first)"
+)
+
+PLATFORM_TARGETS = ("build-windows", "build-macos", "build-linux")
+SPEC_NAMES = ("email-signature.spec", "email-signature-gui.spec")
+
+_CURRENT_PLATFORM = platform.system()
+
+# Expected build output per (platform.system(), is_gui spec)
+_BINARY_PATHS: dict[tuple[str, bool], Path] = {
+    ("Darwin", False): DIST_DIR / "email-signature",
+    ("Darwin", True): DIST_DIR / "EmailSignatureGenerator.app",
+    ("Windows", False): DIST_DIR / "email-signature.exe",
+    ("Windows", True): DIST_DIR / "email-signature-gui.exe",
+    ("Linux", False): DIST_DIR / "email-signature",
+    ("Linux", True): DIST_DIR / "email-signature-gui",
+}
+_EXPECTED_TYPES: dict[tuple[str, bool], str] = {
+    ("Darwin", False): "executable",
+    ("Darwin", True): "app_bundle",
+    ("Windows", False): "exe",
+    ("Windows", True): "exe",
+    ("Linux", False): "executable",
+    ("Linux", True): "executable",
+}
+
+_VERSION_RE = re.compile(rb'__version__\s*=\s*["\']([^"\']+)["\']')
+# Makefile targets start at column 0; ":=" is a variable assignment, not a rule
+_TARGET_HEADER_RE = re.compile(r'^([A-Za-z_][A-Za-z0-9_-]*):(?!=)')
+# Per target, patterns matching a make invocation of each *other* platform target
+_OTHER_TARGET_INVOCATIONS = {
+    target: {
+        other: re.compile(
+            rf'\$\(MAKE\)\s+{re.escape(other)}|^\s*{re.escape(other)}\s*$', re.MULTILINE
+        )
+        for other in PLATFORM_TARGETS
+        if other != target
+    }
+    for target in PLATFORM_TARGETS
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _spec_exists(spec_name: str) -> bool:
+    """Stat each PyInstaller spec at most once per test run."""
+    return (SPEC_DIR / spec_name).exists()
+
+
+@pytest.fixture(scope="module")
+def makefile_text() -> str:
+    """Read the Makefile once for every test in this module."""
+    makefile_path = PROJECT_ROOT / "Makefile"
+
+    # Property: Makefile should exist
+    assert makefile_path.exists(), "Makefile should exist"
+    return makefile_path.read_text()
+
+
+@pytest.fixture(scope="module")
+def makefile_targets(makefile_text: str) -> dict[str, str]:
+    """Split the Makefile into ``{target: definition}`` in a single pass.
+
+    Each definition holds the target's header line (with its prerequisites)
+    followed by its tab-indented recipe lines.
+    """
+    targets: dict[str, list[str]] = {}
+    definition: list[str] | None = None
+    for line in makefile_text.splitlines():
+        header = _TARGET_HEADER_RE.match(line)
+        if header:
+            definition = targets.setdefault(header.group(1), [])
+            definition.append(line)
+        elif definition is not None and line.startswith("\t"):
+            definition.append(line)
+        elif line and not line.startswith("#"):
+            # Any other column-0 line ends the current rule
+            definition = None
+    return {name: "\n".join(lines) for name, lines in targets.items()}
+
+
+@pytest.fixture(scope="module")
+def version_string() -> str:
+    """Extract the package version from __version__.py once per module."""
+    version_file = PROJECT_ROOT / "src" / "email_signature" / "__version__.py"
+    version_match = _VERSION_RE.search(version_file.read_bytes())
+    assert version_match, "Could not find version in __version__.py"
+    return version_match.group(1).decode("ascii")
+
+
+# Specs that can produce an artifact here; other combinations never reach setup
+_SUPPORTED_SPECS = tuple(
+    spec_name
+    for spec_name in SPEC_NAMES
+    if _spec_exists(spec_name) and (_CURRENT_PLATFORM, "gui" in spec_name) in _BINARY_PATHS
+)
 
 
 # Feature: deployment-and-release, Property 1: Platform-specific build outputs
 @pytest.mark.slow
-@settings(max_examples=10)  # Reduced since builds are expensive
-@given(
-    spec_name=st.sampled_from(["email-signature.spec", "email-signature-gui.spec"])
-)
+@pytest.mark.build_artifacts
+@requires_build_artifacts
+@pytest.mark.parametrize("spec_name", _SUPPORTED_SPECS)
 def test_platform_specific_build_outputs(spec_name: str) -> None:
     """
     **Feature: deployment-and-release, Property 1: Platform-specific build outputs**
@@ -33,42 +135,14 @@ def test_platform_specific_build_outputs(spec_name: str) -> None:
     
     **Validates: Requirements 1.1, 1.2, 1.3**
     """
-    project_root = Path(__file__).parent.parent.parent
-    spec_path = project_root / "build" / "pyinstaller" / spec_name
-    
-    # Skip if spec file doesn't exist
-    if not spec_path.exists():
-        pytest.skip(f"Spec file {spec_name} does not exist")
-    
     # Determine expected output based on current platform and spec
-    current_platform = platform.system()
-    is_gui = "gui" in spec_name
-    
-    if current_platform == "Darwin":  # macOS
-        if is_gui:
-            expected_output = project_root / "dist" / "EmailSignatureGenerator.app"
-            expected_type = "app_bundle"
-        else:
-            expected_output = project_root / "dist" / "email-signature"
-            expected_type = "executable"
-    elif current_platform == "Windows":
-        if is_gui:
-            expected_output = project_root / "dist" / "email-signature-gui.exe"
-        else:
-            expected_output = project_root / "dist" / "email-signature.exe"
-        expected_type = "exe"
-    elif current_platform == "Linux":
-        if is_gui:
-            expected_output = project_root / "dist" / "email-signature-gui"
-        else:
-            expected_output = project_root / "dist" / "email-signature"
-        expected_type = "executable"
-    else:
-        pytest.skip(f"Unsupported platform: {current_platform}")
+    key = (_CURRENT_PLATFORM, "gui" in spec_name)
+    expected_output = _BINARY_PATHS[key]
+    expected_type = _EXPECTED_TYPES[key]
     
     # Property: The expected output should exist
     assert expected_output.exists(), (
-        f"Expected build output {expected_output} does not exist for platform {current_platform}"
+        f"Expected build output {expected_output} does not exist for platform {_CURRENT_PLATFORM}"
     )
     
     # Property: The output should be executable (or an app bundle on macOS)
@@ -85,83 +159,79 @@ def test_platform_specific_build_outputs(spec_name: str) -> None:
         )
 
 
-# Feature: deployment-and-release, Property 2: Binary completeness
-@pytest.mark.slow
-@settings(max_examples=10, deadline=None)  # No deadline for slow build tests
-@given(
-    spec_name=st.just("email-signature.spec")  # Only test CLI binary
-)
-def test_binary_completeness(spec_name: str) -> None:
-    """
-    **Feature: deployment-and-release, Property 2: Binary completeness**
-    
-    For any built binary, the binary should contain all required components
-    (GUI entry point, CLI entry point, default config, and font fallbacks)
-    accessible within the bundle.
-    
-    **Validates: Requirements 1.4**
-    """
-    project_root = Path(__file__).parent.parent.parent
-    spec_path = project_root / "build" / "pyinstaller" / spec_name
-    
+@pytest.fixture(scope="module")
+def cli_binary_path() -> Path:
+    """Locate the built CLI binary, skipping when it has not been built."""
+    spec_name = "email-signature.spec"  # Only test CLI binary
     # Skip if spec file doesn't exist
-    if not spec_path.exists():
+    if not _spec_exists(spec_name):
         pytest.skip(f"Spec file {spec_name} does not exist")
-    
-    # Determine binary path based on current platform and spec
-    current_platform = platform.system()
-    is_gui = "gui" in spec_name
-    
-    # Skip GUI binaries for this test since they don't support --version
-    # and would require GUI interaction
-    if is_gui:
-        pytest.skip("GUI binaries don't support --version flag")
-    
-    if current_platform == "Darwin":  # macOS
-        binary_path = project_root / "dist" / "email-signature"
-    elif current_platform == "Windows":
-        binary_path = project_root / "dist" / "email-signature.exe"
-    elif current_platform == "Linux":
-        binary_path = project_root / "dist" / "email-signature"
-    else:
-        pytest.skip(f"Unsupported platform: {current_platform}")
-    
+
+    binary_path = _BINARY_PATHS.get((_CURRENT_PLATFORM, False))
+    if binary_path is None:
+        pytest.skip(f"Unsupported platform: {_CURRENT_PLATFORM}")
+
     # Skip if binary doesn't exist
     if not binary_path.exists():
         pytest.skip(f"Binary {binary_path} does not exist")
-    
-    # Property: Binary should be runnable and show version (indicates it has all dependencies)
+
+    # Skip stale or un-chmodded artifacts before paying for a process launch
+    if not os.access(binary_path, os.X_OK):
+        pytest.skip(f"Binary {binary_path} is not executable")
+    return binary_path
+
+
+@pytest.fixture(scope="module")
+def cli_version_output(cli_binary_path: Path) -> bytes:
+    """Run ``<binary> --version`` once and share its output between tests.
+
+    Each launch of a onefile PyInstaller binary unpacks and boots a fresh
+    interpreter, so the binary tests assert against a single cached run.
+    stderr is merged into stdout and left undecoded; the assertions only
+    look for ASCII version strings.
+    """
     try:
-        result = subprocess.run(
-            [str(binary_path), "--version"],
-            capture_output=True,
-            text=True,
+        return subprocess.check_output(
+            [str(cli_binary_path), "--version"],
+            stderr=subprocess.STDOUT,
             timeout=10,
         )
-        
+    except subprocess.CalledProcessError as e:
         # Property: Binary should execute successfully
-        assert result.returncode == 0, (
-            f"Binary {binary_path} failed to execute: {result.stderr}"
-        )
-        
-        # Property: Binary should output version information
-        assert "0.1.0" in result.stdout or "0.1.0" in result.stderr, (
-            f"Binary should display version information. Got: {result.stdout} {result.stderr}"
-        )
-        
+        pytest.fail(f"Binary {cli_binary_path} failed to execute: {e.output!r}")
     except subprocess.TimeoutExpired:
-        pytest.fail(f"Binary {binary_path} timed out during execution")
+        pytest.fail(f"Binary {cli_binary_path} timed out during execution")
     except Exception as e:
-        pytest.fail(f"Failed to execute binary {binary_path}: {e}")
+        pytest.fail(f"Failed to execute binary {cli_binary_path}: {e}")
+
+
+# Feature: deployment-and-release, Property 2: Binary completeness
+@pytest.mark.slow
+@pytest.mark.subprocess
+@pytest.mark.build_artifacts
+@requires_build_artifacts
+def test_binary_completeness(cli_version_output: bytes) -> None:
+    """
+    **Feature: deployment-and-release, Property 2: Binary completeness**
+    
+    For any built binary, the binary should contain all required components
+    (GUI entry point, CLI entry point, default config, and font fallbacks)
+    accessible within the bundle.
+    
+    **Validates: Requirements 1.4**
+    """
+    # Property: Binary should output version information
+    assert b"0.1.0" in cli_version_output, (
+        f"Binary should display version information. Got: {cli_version_output!r}"
+    )
 
 
 # Feature: deployment-and-release, Property 6: Binary version metadata
 @pytest.mark.slow
-@settings(max_examples=10, deadline=None)  # No deadline for slow build tests
-@given(
-    spec_name=st.just("email-signature.spec")  # Only test CLI binary
-)
-def test_binary_version_metadata(spec_name: str) -> None:
+@pytest.mark.subprocess
+@pytest.mark.build_artifacts
+@requires_build_artifacts
+def test_binary_version_metadata(version_string: str, cli_version_output: bytes) -> None:
     """
     **Feature: deployment-and-release, Property 6: Binary version metadata**
     
@@ -170,69 +240,14 @@ def test_binary_version_metadata(spec_name: str) -> None:
     
     **Validates: Requirements 8.4**
     """
-    project_root = Path(__file__).parent.parent.parent
-    spec_path = project_root / "build" / "pyinstaller" / spec_name
-    
-    # Skip if spec file doesn't exist
-    if not spec_path.exists():
-        pytest.skip(f"Spec file {spec_name} does not exist")
-    
-    # Get the expected version from __version__.py
-    version_file = project_root / "src" / "email_signature" / "__version__.py"
-    version_content = version_file.read_text()
-    
-    # Extract version string
-    import re
-    version_match = re.search(r'__version__\s*=\s*["\']([^"\']+)["\']', version_content)
-    assert version_match, "Could not find version in __version__.py"
-    expected_version = version_match.group(1)
-    
-    # Determine binary path based on current platform and spec
-    current_platform = platform.system()
-    is_gui = "gui" in spec_name
-    
-    # Skip GUI binaries for this test since they don't support --version
-    # and would require GUI interaction
-    if is_gui:
-        pytest.skip("GUI binaries don't support --version flag")
-    
-    if current_platform == "Darwin":  # macOS
-        binary_path = project_root / "dist" / "email-signature"
-    elif current_platform == "Windows":
-        binary_path = project_root / "dist" / "email-signature.exe"
-    elif current_platform == "Linux":
-        binary_path = project_root / "dist" / "email-signature"
-    else:
-        pytest.skip(f"Unsupported platform: {current_platform}")
-    
-    # Skip if binary doesn't exist
-    if not binary_path.exists():
-        pytest.skip(f"Binary {binary_path} does not exist")
-    
     # Property: Binary should report the correct version when executed with --version
-    try:
-        result = subprocess.run(
-            [str(binary_path), "--version"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        
-        # Property: Version output should match expected version
-        output = result.stdout + result.stderr
-        assert expected_version in output, (
-            f"Binary version output should contain {expected_version}. Got: {output}"
-        )
-        
-    except subprocess.TimeoutExpired:
-        pytest.fail(f"Binary {binary_path} timed out during execution")
-    except Exception as e:
-        pytest.fail(f"Failed to execute binary {binary_path}: {e}")
+    assert version_string.encode("ascii") in cli_version_output, (
+        f"Binary version output should contain {version_string}. Got: {cli_version_output!r}"
+    )
 
 
 # Feature: deployment-and-release, Property 16: Build-all target completeness
-@pytest.mark.slow
-def test_build_all_target_completeness() -> None:
+def test_build_all_target_completeness(makefile_targets: dict[str, str]) -> None:
     """
     **Feature: deployment-and-release, Property 16: Build-all target completeness**
     
@@ -245,29 +260,11 @@ def test_build_all_target_completeness() -> None:
     configured to call all platform-specific targets. It does not actually
     execute the builds (which would be extremely time-consuming).
     """
-    project_root = Path(__file__).parent.parent.parent
-    makefile_path = project_root / "Makefile"
-    
-    # Property: Makefile should exist
-    assert makefile_path.exists(), "Makefile should exist"
-    
-    # Read Makefile content
-    makefile_content = makefile_path.read_text()
-    
     # Property: build-all target should exist
-    assert "build-all:" in makefile_content, "Makefile should contain build-all target"
+    assert "build-all" in makefile_targets, "Makefile should contain build-all target"
     
     # Property: build-all should reference all platform-specific targets
-    # Extract the build-all target definition
-    import re
-    build_all_match = re.search(
-        r'^build-all:.*?(?=^[^\t]|\Z)',
-        makefile_content,
-        re.MULTILINE | re.DOTALL
-    )
-    
-    assert build_all_match, "Could not find build-all target definition"
-    build_all_section = build_all_match.group(0)
+    build_all_section = makefile_targets["build-all"]
     
     # Property: build-all should call build-windows
     assert "build-windows" in build_all_section, (
@@ -285,24 +282,20 @@ def test_build_all_target_completeness() -> None:
     )
     
     # Property: All platform-specific targets should exist
-    assert "build-windows:" in makefile_content, (
+    assert "build-windows" in makefile_targets, (
         "Makefile should contain build-windows target"
     )
-    assert "build-macos:" in makefile_content, (
+    assert "build-macos" in makefile_targets, (
         "Makefile should contain build-macos target"
     )
-    assert "build-linux:" in makefile_content, (
+    assert "build-linux" in makefile_targets, (
         "Makefile should contain build-linux target"
     )
 
 
 # Feature: deployment-and-release, Property 17: Platform-specific build isolation
-@pytest.mark.slow
-@settings(max_examples=10, deadline=None)
-@given(
-    target=st.sampled_from(["build-windows", "build-macos", "build-linux"])
-)
-def test_platform_specific_build_isolation(target: str) -> None:
+@pytest.mark.parametrize("target", PLATFORM_TARGETS)
+def test_platform_specific_build_isolation(makefile_targets: dict[str, str], target: str) -> None:
     """
     **Feature: deployment-and-release, Property 17: Platform-specific build isolation**
     
@@ -315,48 +308,18 @@ def test_platform_specific_build_isolation(target: str) -> None:
     and don't inadvertently trigger builds for other platforms. It checks
     the Makefile structure rather than executing builds.
     """
-    project_root = Path(__file__).parent.parent.parent
-    makefile_path = project_root / "Makefile"
-    
-    # Property: Makefile should exist
-    assert makefile_path.exists(), "Makefile should exist"
-    
-    # Read Makefile content
-    makefile_content = makefile_path.read_text()
-    
     # Property: The target should exist
-    assert f"{target}:" in makefile_content, (
+    assert target in makefile_targets, (
         f"Makefile should contain {target} target"
     )
     
-    # Extract the target definition
-    import re
-    # Match from target name to the next target or end of file
-    # Makefile targets start at column 0, commands are indented with tabs
-    target_match = re.search(
-        rf'^{re.escape(target)}:.*?(?=^[a-zA-Z_-]+:|\Z)',
-        makefile_content,
-        re.MULTILINE | re.DOTALL
-    )
-    
-    assert target_match, f"Could not find {target} target definition"
-    target_section = target_match.group(0)
+    target_section = makefile_targets[target]
     
     # Property: Platform-specific target should NOT call other platform targets
-    other_targets = {
-        "build-windows": ["build-macos", "build-linux"],
-        "build-macos": ["build-windows", "build-linux"],
-        "build-linux": ["build-windows", "build-macos"],
-    }
-    
-    for other_target in other_targets[target]:
+    for other_target, invocation in _OTHER_TARGET_INVOCATIONS[target].items():
         # Check that the other target is not invoked (not as a dependency or make call)
         # Allow the target name to appear in comments or strings, but not as a make invocation
-        assert not re.search(
-            rf'\$\(MAKE\)\s+{re.escape(other_target)}|^\s*{re.escape(other_target)}\s*$',
-            target_section,
-            re.MULTILINE
-        ), (
+        assert not invocation.search(target_section), (
             f"{target} should not invoke {other_target} (targets should be isolated)"
         )
     
@@ -1,24 +1,398 @@
 """Property-based tests for community health files and open source standards."""
 
+import functools
+import os
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, NamedTuple
+
+import pytest
+
+_CONTRIBUTING_MD = "CONTRIBUTING.md"
+_CODE_OF_CONDUCT_MD = "CODE_OF_CONDUCT.md"
+_SECURITY_MD = "SECURITY.md"
+_README_MD = "README.md"
+_PULL_REQUEST_TEMPLATE_MD = ".github/pull_request_template.md"
+_ISSUE_TEMPLATE_DIR = ".github/ISSUE_TEMPLATE"
+_BUG_REPORT_YML = f"{_ISSUE_TEMPLATE_DIR}/bug_report.yml"
+_FEATURE_REQUEST_YML = f"{_ISSUE_TEMPLATE_DIR}/feature_request.yml"
+_ISSUE_CONFIG_YML = f"{_ISSUE_TEMPLATE_DIR}/config.yml"
+
+
+class _Document(NamedTuple):
+    """A community health document as read from disk."""
+
+    lower: str
+    size: int
+    heading_count: int
+    line_count: int
+    has_heading: bool
+    has_code_block: bool
+
+
+@functools.lru_cache(maxsize=None)
+def _load_document(path: str) -> _Document:
+    """Read and lowercase a document once, however many examples use it.
+
+    A missing document fails the calling test the same way an explicit
+    existence assertion would, without a separate stat() beforehand.
+    """
+    try:
+        with open(path, "rb") as file:
+            raw = file.read()
+    except FileNotFoundError:
+        raise AssertionError(f"{path} file must exist") from None
+    return _Document(
+        lower=raw.decode("utf-8").lower(),
+        size=len(raw),
+        heading_count=raw.count(b"\n#"),
+        line_count=raw.count(b"\n") + (0 if raw.endswith(b"\n") else 1),
+        has_heading=b"#" in raw,
+        has_code_block=b"```" in raw or b"    " in raw,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _read_text(path: str) -> str:
+    """Read a document verbatim once per test session, for case-sensitive checks."""
+    try:
+        return Path(path).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raise AssertionError(f"{path} file must exist") from None
+
+
+@functools.lru_cache(maxsize=None)
+def _read_lines(path: str) -> tuple[str, ...]:
+    """Split a document into lines once per test session."""
+    return tuple(_read_text(path).splitlines())
+
+
+class _BadgeMarkup(NamedTuple):
+    """Which image and link markup forms a document uses."""
 
-from hypothesis import given
-from hypothesis import strategies as st
-
-
-@given(
-    required_section=st.sampled_from(
-        [
-            "development setup",
-            "pull request",
-            "code style",
-            "testing",
-            "contributing",
-            "workflow",
-            "commit",
-            "branch",
-        ]
+    has_markdown_image: bool
+    has_html_image: bool
+    has_linked_image: bool
+    has_link: bool
+
+
+@functools.lru_cache(maxsize=None)
+def _badge_markup(path: str) -> _BadgeMarkup:
+    """Scan a document's badge markup once per test session."""
+    content = _read_text(path)
+    return _BadgeMarkup(
+        has_markdown_image="![" in content,
+        has_html_image="<img" in content,
+        has_linked_image="[![" in content,
+        has_link="](" in content,
     )
+
+
+@functools.lru_cache(maxsize=None)
+def _path_exists(path: str) -> bool:
+    """Check that a repository file exists once per test session."""
+    return os.path.exists(path)
+
+
+@functools.lru_cache(maxsize=None)
+def _path_size(path: str) -> int:
+    """Stat a repository file once per test session."""
+    return os.path.getsize(path)
+
+
+# CONTRIBUTING.md keyword tables: topic -> keywords that show the topic is covered
+_CONTRIBUTING_SECTION_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "development setup": ("development setup", "install", "dependencies", "virtual environment"),
+        "pull request": ("pull request", "pr process", "submitting", "review"),
+        "code style": ("code style", "formatting", "black", "ruff", "linting"),
+        "testing": ("testing", "pytest", "test", "coverage", "hypothesis"),
+        "contributing": ("contributing", "contribute", "contribution"),
+        "workflow": ("workflow", "process", "steps", "fork"),
+        "commit": ("commit", "commit message", "git commit"),
+        "branch": ("branch", "feature branch", "git branch"),
+    }
+)
+_CONTRIBUTING_COMMAND_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "install": ("install", "uv sync", "pip install"),
+        "test": ("pytest", "test", "uv run pytest"),
+        "format": ("black", "format", "uv run black"),
+        "lint": ("ruff", "lint", "uv run ruff"),
+        "typecheck": ("mypy", "type check", "uv run mypy"),
+    }
+)
+_CONTRIBUTING_CHANNEL_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "issue": ("issue", "bug report", "feature request"),
+        "discussion": ("discussion", "question", "help"),
+        "github": ("github", "repository", "pull request"),
+    }
+)
+_CONTRIBUTING_TOOL_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {tool: (tool,) for tool in ("black", "ruff", "mypy", "pytest", "hypothesis")}
+)
+
+# CODE_OF_CONDUCT.md keyword tables: topic -> keywords that show the topic is covered
+_CODE_OF_CONDUCT_SECTION_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "pledge": ("pledge", "commitment", "welcoming"),
+        "standards": ("standards", "expected behavior", "unacceptable behavior", "examples"),
+        "enforcement": ("enforcement", "responsibilities", "consequences", "reporting"),
+        "scope": ("scope", "applies", "spaces", "representation"),
+        "contact": ("contact", "email", "report", "@"),
+        "our pledge": ("our pledge", "pledge"),
+        "our standards": ("our standards", "standards"),
+        "enforcement responsibilities": ("enforcement responsibilities", "enforcement", "responsibilities"),
+        "enforcement guidelines": ("enforcement guidelines", "guidelines", "enforcement"),
+    }
+)
+_CODE_OF_CONDUCT_BEHAVIOR_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "expected": ("expected", "positive", "welcoming", "respectful", "empathy"),
+        "unacceptable": ("unacceptable", "inappropriate", "unwelcome", "harassment"),
+        "positive": ("positive", "welcoming", "inclusive", "respectful"),
+        "harassment": ("harassment", "trolling", "insulting", "derogatory"),
+    }
+)
+_CODE_OF_CONDUCT_ENFORCEMENT_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "reporting": ("report", "reporting", "complaint", "violation"),
+        "investigation": ("investigate", "investigation", "review", "determine"),
+        "consequences": ("consequences", "action", "ban", "removal", "warning"),
+    }
+)
+_CODE_OF_CONDUCT_CONTACT_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "email": ("email", "@", "contact"),
+        "maintainer": ("maintainer", "team", "leader"),
+        "project": ("project", "repository", "github"),
+    }
+)
+
+# SECURITY.md keyword tables: topic -> keywords that show the topic is covered
+_SECURITY_SECTION_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "supported versions": ("supported versions", "version", "support"),
+        "reporting": ("reporting", "report", "how to report"),
+        "vulnerability": ("vulnerability", "vulnerabilities", "security issue"),
+        "response": ("response", "respond", "acknowledgment"),
+        "timeline": ("timeline", "timeframe", "within", "hours", "days"),
+        "contact": ("contact", "email", "@", "maintainer"),
+        "disclosure": ("disclosure", "disclose", "public"),
+        "security": ("security", "secure"),
+    }
+)
+_SECURITY_REPORTING_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "github": ("github", "repository", "security tab"),
+        "security advisory": ("security advisory", "advisory", "report a vulnerability"),
+        "private": ("private", "privately", "do not", "not public"),
+        "issue": ("issue", "report", "contact"),
+    }
+)
+_SECURITY_RESPONSE_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "acknowledgment": ("acknowledge", "acknowledgment", "receipt", "confirm"),
+        "investigation": ("investigate", "investigation", "assess", "determine"),
+        "fix": ("fix", "patch", "resolve", "solution"),
+        "update": ("update", "status", "progress", "inform"),
+    }
+)
+_SECURITY_TIMEFRAME_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "48 hours": ("48 hours", "48 hour", "two days"),
+        "hours": ("hours", "hour"),
+        "days": ("days", "day"),
+        "timeline": ("timeline", "timeframe", "within"),
+    }
+)
+_SECURITY_CHANNEL_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "github": ("github", "repository", "security tab"),
+        "security advisory": ("security advisory", "advisory"),
+        "maintainer": ("maintainer", "@ultrasardine", "contact"),
+    }
+)
+_SECURITY_DISCLOSURE_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "coordinated": ("coordinated", "coordinate", "coordination"),
+        "private": ("private", "privately", "confidential"),
+        "public": ("public", "publicly", "disclosure"),
+        "policy": ("policy", "approach", "process"),
+    }
+)
+
+# Pull request template keyword tables: topic -> keywords that show the topic is covered
+_PULL_REQUEST_SECTION_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "description": ("description", "what does this pr do", "why is this change"),
+        "related issues": ("related issues", "fixes", "closes", "issue"),
+        "type of change": ("type of change", "bug fix", "feature", "breaking change"),
+        "testing": ("testing", "tests", "test coverage", "pytest"),
+        "documentation": ("documentation", "readme", "docs", "changelog"),
+        "code quality": ("code quality", "linting", "type checking", "black", "ruff", "mypy"),
+    }
+)
+_PULL_REQUEST_CHECKLIST_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "testing": ("testing", "tests", "test"),
+        "documentation": ("documentation", "readme", "docs", "changelog"),
+        "code quality": ("code quality", "linting", "type checking", "black", "ruff", "mypy"),
+        "type of change": ("type of change", "bug fix", "feature", "breaking change"),
+    }
+)
+_PULL_REQUEST_CHANGE_TYPE_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "bug fix": ("bug fix", "bug"),
+        "feature": ("feature", "new feature"),
+        "breaking change": ("breaking change", "breaking"),
+        "documentation": ("documentation", "docs"),
+    }
+)
+_PULL_REQUEST_TESTING_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "tests added": ("added tests", "tests that prove", "test"),
+        "tests pass": ("tests pass", "passing", "all new and existing tests"),
+        "coverage": ("coverage", "test coverage"),
+    }
+)
+_PULL_REQUEST_DOCUMENTATION_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "readme": ("readme", "readme.md"),
+        "docs": ("docs", "documentation"),
+        "changelog": ("changelog", "changelog.md"),
+    }
+)
+_PULL_REQUEST_QUALITY_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "linting": ("linting", "lint", "ruff"),
+        "type checking": ("type checking", "type check", "mypy"),
+        "black": ("black", "format"),
+        "ruff": ("ruff", "lint"),
+        "mypy": ("mypy", "type"),
+    }
+)
+_PULL_REQUEST_LINKING_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "fixes": ("fixes", "fix"),
+        "closes": ("closes", "close"),
+        "related": ("related", "related to"),
+    }
+)
+_PULL_REQUEST_PROMPT_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "what does this pr do": ("what does this pr do", "what", "do"),
+        "why is this change needed": ("why", "needed", "motivation"),
+        "describe": ("describe", "description", "explain"),
+    }
+)
+
+# README.md keyword tables: topic -> keywords that show the topic is covered
+_README_BADGE_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "ci": ("cross-platform tests", "workflow", "actions", "ci", "build"),
+        "coverage": ("codecov", "coverage", "cov"),
+        "release": ("release", "version", "v/release"),
+        "license": ("license", "mit"),
+    }
+)
+_README_SCREENSHOT_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "gui": ("gui", "interface", "main window", "application"),
+        "signature": ("signature", "output", "example", "generated"),
+        "settings": ("settings", "configuration", "preferences"),
+        "profile": ("profile", "management", "user"),
+    }
+)
+_README_SCREENSHOT_SECTION_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "screenshots": ("screenshots", "## screenshots", "### screenshots"),
+        "features": ("features", "## features", "### features"),
+        "gui": ("gui", "interface", "graphical"),
+        "usage": ("usage", "## usage", "### usage"),
+    }
+)
+# Badge link targets are matched case-sensitively against the raw README text, so
+# they stay out of the lowercased keyword index below
+_README_BADGE_LINK_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "actions": ("actions/workflows", "github.com"),
+        "codecov": ("codecov.io",),
+        "releases": ("releases", "github.com"),
+        "license": ("LICENSE", "license"),
+    }
+)
+
+_DOCUMENT_KEYWORD_TABLES = {
+    _CONTRIBUTING_MD: (
+        _CONTRIBUTING_SECTION_KEYWORDS,
+        _CONTRIBUTING_COMMAND_KEYWORDS,
+        _CONTRIBUTING_CHANNEL_KEYWORDS,
+        _CONTRIBUTING_TOOL_KEYWORDS,
+    ),
+    _CODE_OF_CONDUCT_MD: (
+        _CODE_OF_CONDUCT_SECTION_KEYWORDS,
+        _CODE_OF_CONDUCT_BEHAVIOR_KEYWORDS,
+        _CODE_OF_CONDUCT_ENFORCEMENT_KEYWORDS,
+        _CODE_OF_CONDUCT_CONTACT_KEYWORDS,
+    ),
+    _SECURITY_MD: (
+        _SECURITY_SECTION_KEYWORDS,
+        _SECURITY_REPORTING_KEYWORDS,
+        _SECURITY_RESPONSE_KEYWORDS,
+        _SECURITY_TIMEFRAME_KEYWORDS,
+        _SECURITY_CHANNEL_KEYWORDS,
+        _SECURITY_DISCLOSURE_KEYWORDS,
+    ),
+    _PULL_REQUEST_TEMPLATE_MD: (
+        _PULL_REQUEST_SECTION_KEYWORDS,
+        _PULL_REQUEST_CHECKLIST_KEYWORDS,
+        _PULL_REQUEST_CHANGE_TYPE_KEYWORDS,
+        _PULL_REQUEST_TESTING_KEYWORDS,
+        _PULL_REQUEST_DOCUMENTATION_KEYWORDS,
+        _PULL_REQUEST_QUALITY_KEYWORDS,
+        _PULL_REQUEST_LINKING_KEYWORDS,
+        _PULL_REQUEST_PROMPT_KEYWORDS,
+    ),
+    _README_MD: (
+        _README_BADGE_KEYWORDS,
+        _README_SCREENSHOT_KEYWORDS,
+        _README_SCREENSHOT_SECTION_KEYWORDS,
+    ),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _matched_keywords(path: str) -> frozenset[str]:
+    """Return every tabled keyword that occurs in the lowercased document.
+
+    All of a document's keyword tables are checked in a single sweep, so each
+    test answers its question with set lookups instead of rescanning the text.
+    """
+    lower = _load_document(path).lower
+    keywords = {
+        keyword
+        for table in _DOCUMENT_KEYWORD_TABLES[path]
+        for topic_keywords in table.values()
+        for keyword in topic_keywords
+    }
+    return frozenset(keyword for keyword in keywords if keyword in lower)
+
+
+@pytest.mark.parametrize(
+    "required_section",
+    [
+        "development setup",
+        "pull request",
+        "code style",
+        "testing",
+        "contributing",
+        "workflow",
+        "commit",
+        "branch",
+    ],
 )
 def test_contributing_has_required_sections(required_section: str) -> None:
     """Feature: open-source-standards, Property 3: CONTRIBUTING.md contains required sections.
@@ -29,44 +403,26 @@ def test_contributing_has_required_sections(required_section: str) -> None:
     testing requirements), the CONTRIBUTING.md file should contain a heading or
     content addressing that section.
     """
-    # Given the CONTRIBUTING.md file exists
-    contributing_path = Path("CONTRIBUTING.md")
-    assert contributing_path.exists(), "CONTRIBUTING.md file must exist"
-
-    # When we read the file content
-    content = contributing_path.read_text(encoding="utf-8").lower()
-
     # Then it should contain content related to the required section
     # We check for section keywords that would indicate the topic is covered
-    section_keywords = {
-        "development setup": ["development setup", "install", "dependencies", "virtual environment"],
-        "pull request": ["pull request", "pr process", "submitting", "review"],
-        "code style": ["code style", "formatting", "black", "ruff", "linting"],
-        "testing": ["testing", "pytest", "test", "coverage", "hypothesis"],
-        "contributing": ["contributing", "contribute", "contribution"],
-        "workflow": ["workflow", "process", "steps", "fork"],
-        "commit": ["commit", "commit message", "git commit"],
-        "branch": ["branch", "feature branch", "git branch"],
-    }
-
-    keywords = section_keywords.get(required_section, [required_section])
+    keywords = _CONTRIBUTING_SECTION_KEYWORDS[required_section]
 
     # At least one keyword should be present in the content
+    matched = _matched_keywords(_CONTRIBUTING_MD)
     assert any(
-        keyword in content for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"CONTRIBUTING.md should contain content about '{required_section}'"
 
 
-@given(
-    tool=st.sampled_from(
-        [
-            "black",
-            "ruff",
-            "mypy",
-            "pytest",
-            "hypothesis",
-        ]
-    )
+@pytest.mark.parametrize(
+    "tool",
+    [
+        "black",
+        "ruff",
+        "mypy",
+        "pytest",
+        "hypothesis",
+    ],
 )
 def test_contributing_mentions_required_tools(tool: str) -> None:
     """Feature: open-source-standards, Property 3: CONTRIBUTING.md contains required sections.
@@ -76,33 +432,11 @@ def test_contributing_mentions_required_tools(tool: str) -> None:
     For any required development tool (black, ruff, mypy, pytest, hypothesis),
     the CONTRIBUTING.md file should mention that tool.
     """
-    # Given the CONTRIBUTING.md file exists
-    contributing_path = Path("CONTRIBUTING.md")
-    assert contributing_path.exists(), "CONTRIBUTING.md file must exist"
+    # Then it should mention the required tool
+    assert tool in _matched_keywords(_CONTRIBUTING_MD), f"CONTRIBUTING.md should mention {tool}"
 
-    # When we read the file content
-    content = contributing_path.read_text(encoding="utf-8").lower()
 
-    # Then it should mention the required tool
-    assert tool.lower() in content, f"CONTRIBUTING.md should mention {tool}"
-
-
-@given(
-    heading_level=st.sampled_from(["#", "##", "###"]),
-    section_name=st.sampled_from(
-        [
-            "Getting Started",
-            "Development Setup",
-            "Code Style",
-            "Testing",
-            "Pull Request",
-            "Contributing",
-        ]
-    ),
-)
-def test_contributing_has_proper_markdown_structure(
-    heading_level: str, section_name: str
-) -> None:
+def test_contributing_has_proper_markdown_structure() -> None:
     """Feature: open-source-standards, Property 3: CONTRIBUTING.md contains required sections.
 
     Validates: Requirements 1.2, 1.3, 1.4, 1.5
@@ -110,32 +444,27 @@ def test_contributing_has_proper_markdown_structure(
     For any major section in CONTRIBUTING.md, the file should use proper markdown
     heading structure to organize content.
     """
-    # Given the CONTRIBUTING.md file exists
-    contributing_path = Path("CONTRIBUTING.md")
-    assert contributing_path.exists(), "CONTRIBUTING.md file must exist"
-
     # When we read the file content
-    content = contributing_path.read_text(encoding="utf-8")
+    document = _load_document(_CONTRIBUTING_MD)
 
     # Then it should contain markdown headings
     # We verify that the file uses markdown heading syntax
-    assert "#" in content, "CONTRIBUTING.md should use markdown headings"
+    assert document.has_heading, "CONTRIBUTING.md should use markdown headings"
 
     # The file should be well-structured with multiple sections
-    heading_count = content.count("\n#")
+    heading_count = document.heading_count
     assert heading_count >= 5, "CONTRIBUTING.md should have multiple sections (at least 5 headings)"
 
 
-@given(
-    command_type=st.sampled_from(
-        [
-            "install",
-            "test",
-            "format",
-            "lint",
-            "typecheck",
-        ]
-    )
+@pytest.mark.parametrize(
+    "command_type",
+    [
+        "install",
+        "test",
+        "format",
+        "lint",
+        "typecheck",
+    ],
 )
 def test_contributing_includes_command_examples(command_type: str) -> None:
     """Feature: open-source-standards, Property 3: CONTRIBUTING.md contains required sections.
@@ -145,68 +474,48 @@ def test_contributing_includes_command_examples(command_type: str) -> None:
     For any common development command (install, test, format, lint, typecheck),
     the CONTRIBUTING.md file should include code examples showing how to run that command.
     """
-    # Given the CONTRIBUTING.md file exists
-    contributing_path = Path("CONTRIBUTING.md")
-    assert contributing_path.exists(), "CONTRIBUTING.md file must exist"
-
     # When we read the file content
-    content = contributing_path.read_text(encoding="utf-8")
+    document = _load_document(_CONTRIBUTING_MD)
 
     # Then it should contain code blocks (indicated by ``` or indented code)
-    assert "```" in content or "    " in content, "CONTRIBUTING.md should include code examples"
+    assert document.has_code_block, "CONTRIBUTING.md should include code examples"
 
     # And it should mention the command type
-    content_lower = content.lower()
-    command_keywords = {
-        "install": ["install", "uv sync", "pip install"],
-        "test": ["pytest", "test", "uv run pytest"],
-        "format": ["black", "format", "uv run black"],
-        "lint": ["ruff", "lint", "uv run ruff"],
-        "typecheck": ["mypy", "type check", "uv run mypy"],
-    }
-
-    keywords = command_keywords.get(command_type, [command_type])
+    keywords = _CONTRIBUTING_COMMAND_KEYWORDS[command_type]
+    matched = _matched_keywords(_CONTRIBUTING_MD)
     assert any(
-        keyword in content_lower for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"CONTRIBUTING.md should include examples for {command_type}"
 
 
-@given(
-    file_size_threshold=st.integers(min_value=1000, max_value=100000),
-)
-def test_contributing_has_substantial_content(file_size_threshold: int) -> None:
+def test_contributing_has_substantial_content() -> None:
     """Feature: open-source-standards, Property 3: CONTRIBUTING.md contains required sections.
 
     Validates: Requirements 1.1, 1.2, 1.3, 1.4, 1.5
 
-    For any reasonable content threshold, the CONTRIBUTING.md file should contain
-    substantial content (not just a placeholder).
+    The CONTRIBUTING.md file should contain substantial content (not just a
+    placeholder).
     """
-    # Given the CONTRIBUTING.md file exists
-    contributing_path = Path("CONTRIBUTING.md")
-    assert contributing_path.exists(), "CONTRIBUTING.md file must exist"
-
     # When we check the file size
-    file_size = contributing_path.stat().st_size
+    document = _load_document(_CONTRIBUTING_MD)
+    file_size = document.size
 
     # Then it should have substantial content
     # A comprehensive CONTRIBUTING.md should be at least 5KB
     assert file_size >= 5000, f"CONTRIBUTING.md should have substantial content (at least 5KB), got {file_size} bytes"
 
     # And it should have multiple lines
-    content = contributing_path.read_text(encoding="utf-8")
-    line_count = len(content.splitlines())
+    line_count = document.line_count
     assert line_count >= 50, f"CONTRIBUTING.md should have substantial content (at least 50 lines), got {line_count} lines"
 
 
-@given(
-    contact_method=st.sampled_from(
-        [
-            "issue",
-            "discussion",
-            "github",
-        ]
-    )
+@pytest.mark.parametrize(
+    "contact_method",
+    [
+        "issue",
+        "discussion",
+        "github",
+    ],
 )
 def test_contributing_includes_communication_channels(contact_method: str) -> None:
     """Feature: open-source-standards, Property 3: CONTRIBUTING.md contains required sections.
@@ -216,40 +525,27 @@ def test_contributing_includes_communication_channels(contact_method: str) -> No
     For any communication channel (issues, discussions, GitHub), the CONTRIBUTING.md
     file should provide information about how to use that channel.
     """
-    # Given the CONTRIBUTING.md file exists
-    contributing_path = Path("CONTRIBUTING.md")
-    assert contributing_path.exists(), "CONTRIBUTING.md file must exist"
-
-    # When we read the file content
-    content = contributing_path.read_text(encoding="utf-8").lower()
-
     # Then it should mention communication channels
-    communication_keywords = {
-        "issue": ["issue", "bug report", "feature request"],
-        "discussion": ["discussion", "question", "help"],
-        "github": ["github", "repository", "pull request"],
-    }
-
-    keywords = communication_keywords.get(contact_method, [contact_method])
+    keywords = _CONTRIBUTING_CHANNEL_KEYWORDS[contact_method]
+    matched = _matched_keywords(_CONTRIBUTING_MD)
     assert any(
-        keyword in content for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"CONTRIBUTING.md should mention {contact_method} as a communication channel"
 
 
-@given(
-    required_section=st.sampled_from(
-        [
-            "pledge",
-            "standards",
-            "enforcement",
-            "scope",
-            "contact",
-            "our pledge",
-            "our standards",
-            "enforcement responsibilities",
-            "enforcement guidelines",
-        ]
-    )
+@pytest.mark.parametrize(
+    "required_section",
+    [
+        "pledge",
+        "standards",
+        "enforcement",
+        "scope",
+        "contact",
+        "our pledge",
+        "our standards",
+        "enforcement responsibilities",
+        "enforcement guidelines",
+    ],
 )
 def test_code_of_conduct_has_required_sections(required_section: str) -> None:
     """Feature: open-source-standards, Property 4: CODE_OF_CONDUCT.md contains required sections.
@@ -259,44 +555,25 @@ def test_code_of_conduct_has_required_sections(required_section: str) -> None:
     For any required section (standards, enforcement, contact), the CODE_OF_CONDUCT.md
     file should contain that section with substantive content.
     """
-    # Given the CODE_OF_CONDUCT.md file exists
-    code_of_conduct_path = Path("CODE_OF_CONDUCT.md")
-    assert code_of_conduct_path.exists(), "CODE_OF_CONDUCT.md file must exist"
-
-    # When we read the file content
-    content = code_of_conduct_path.read_text(encoding="utf-8").lower()
-
     # Then it should contain the required section
     # We check for section keywords that indicate the topic is covered
-    section_keywords = {
-        "pledge": ["pledge", "commitment", "welcoming"],
-        "standards": ["standards", "expected behavior", "unacceptable behavior", "examples"],
-        "enforcement": ["enforcement", "responsibilities", "consequences", "reporting"],
-        "scope": ["scope", "applies", "spaces", "representation"],
-        "contact": ["contact", "email", "report", "@"],
-        "our pledge": ["our pledge", "pledge"],
-        "our standards": ["our standards", "standards"],
-        "enforcement responsibilities": ["enforcement responsibilities", "enforcement", "responsibilities"],
-        "enforcement guidelines": ["enforcement guidelines", "guidelines", "enforcement"],
-    }
-
-    keywords = section_keywords.get(required_section, [required_section])
+    keywords = _CODE_OF_CONDUCT_SECTION_KEYWORDS[required_section]
 
     # At least one keyword should be present in the content
+    matched = _matched_keywords(_CODE_OF_CONDUCT_MD)
     assert any(
-        keyword in content for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"CODE_OF_CONDUCT.md should contain content about '{required_section}'"
 
 
-@given(
-    behavior_type=st.sampled_from(
-        [
-            "expected",
-            "unacceptable",
-            "positive",
-            "harassment",
-        ]
-    )
+@pytest.mark.parametrize(
+    "behavior_type",
+    [
+        "expected",
+        "unacceptable",
+        "positive",
+        "harassment",
+    ],
 )
 def test_code_of_conduct_defines_behaviors(behavior_type: str) -> None:
     """Feature: open-source-standards, Property 4: CODE_OF_CONDUCT.md contains required sections.
@@ -306,35 +583,21 @@ def test_code_of_conduct_defines_behaviors(behavior_type: str) -> None:
     For any behavior category (expected, unacceptable), the CODE_OF_CONDUCT.md
     file should define what constitutes that type of behavior.
     """
-    # Given the CODE_OF_CONDUCT.md file exists
-    code_of_conduct_path = Path("CODE_OF_CONDUCT.md")
-    assert code_of_conduct_path.exists(), "CODE_OF_CONDUCT.md file must exist"
-
-    # When we read the file content
-    content = code_of_conduct_path.read_text(encoding="utf-8").lower()
-
     # Then it should define behaviors
-    behavior_keywords = {
-        "expected": ["expected", "positive", "welcoming", "respectful", "empathy"],
-        "unacceptable": ["unacceptable", "inappropriate", "unwelcome", "harassment"],
-        "positive": ["positive", "welcoming", "inclusive", "respectful"],
-        "harassment": ["harassment", "trolling", "insulting", "derogatory"],
-    }
-
-    keywords = behavior_keywords.get(behavior_type, [behavior_type])
+    keywords = _CODE_OF_CONDUCT_BEHAVIOR_KEYWORDS[behavior_type]
+    matched = _matched_keywords(_CODE_OF_CONDUCT_MD)
     assert any(
-        keyword in content for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"CODE_OF_CONDUCT.md should define {behavior_type} behaviors"
 
 
-@given(
-    enforcement_aspect=st.sampled_from(
-        [
-            "reporting",
-            "investigation",
-            "consequences",
-        ]
-    )
+@pytest.mark.parametrize(
+    "enforcement_aspect",
+    [
+        "reporting",
+        "investigation",
+        "consequences",
+    ],
 )
 def test_code_of_conduct_describes_enforcement(enforcement_aspect: str) -> None:
     """Feature: open-source-standards, Property 4: CODE_OF_CONDUCT.md contains required sections.
@@ -344,88 +607,61 @@ def test_code_of_conduct_describes_enforcement(enforcement_aspect: str) -> None:
     For any enforcement aspect (reporting, investigation, consequences),
     the CODE_OF_CONDUCT.md file should describe how that aspect is handled.
     """
-    # Given the CODE_OF_CONDUCT.md file exists
-    code_of_conduct_path = Path("CODE_OF_CONDUCT.md")
-    assert code_of_conduct_path.exists(), "CODE_OF_CONDUCT.md file must exist"
-
-    # When we read the file content
-    content = code_of_conduct_path.read_text(encoding="utf-8").lower()
-
     # Then it should describe enforcement procedures
-    enforcement_keywords = {
-        "reporting": ["report", "reporting", "complaint", "violation"],
-        "investigation": ["investigate", "investigation", "review", "determine"],
-        "consequences": ["consequences", "action", "ban", "removal", "warning"],
-    }
-
-    keywords = enforcement_keywords.get(enforcement_aspect, [enforcement_aspect])
+    keywords = _CODE_OF_CONDUCT_ENFORCEMENT_KEYWORDS[enforcement_aspect]
+    matched = _matched_keywords(_CODE_OF_CONDUCT_MD)
     assert any(
-        keyword in content for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"CODE_OF_CONDUCT.md should describe {enforcement_aspect} procedures"
 
 
-@given(
-    file_size_threshold=st.integers(min_value=1000, max_value=50000),
-)
-def test_code_of_conduct_has_substantial_content(file_size_threshold: int) -> None:
+def test_code_of_conduct_has_substantial_content() -> None:
     """Feature: open-source-standards, Property 4: CODE_OF_CONDUCT.md contains required sections.
 
     Validates: Requirements 2.1, 2.2, 2.3, 2.4, 2.5
 
-    For any reasonable content threshold, the CODE_OF_CONDUCT.md file should contain
-    substantial content (not just a placeholder).
+    The CODE_OF_CONDUCT.md file should contain substantial content (not just a
+    placeholder).
     """
-    # Given the CODE_OF_CONDUCT.md file exists
-    code_of_conduct_path = Path("CODE_OF_CONDUCT.md")
-    assert code_of_conduct_path.exists(), "CODE_OF_CONDUCT.md file must exist"
-
     # When we check the file size
-    file_size = code_of_conduct_path.stat().st_size
+    document = _load_document(_CODE_OF_CONDUCT_MD)
+    file_size = document.size
 
     # Then it should have substantial content
     # A comprehensive CODE_OF_CONDUCT.md (like Contributor Covenant) should be at least 3KB
     assert file_size >= 3000, f"CODE_OF_CONDUCT.md should have substantial content (at least 3KB), got {file_size} bytes"
 
     # And it should have multiple lines
-    content = code_of_conduct_path.read_text(encoding="utf-8")
-    line_count = len(content.splitlines())
+    line_count = document.line_count
     assert line_count >= 30, f"CODE_OF_CONDUCT.md should have substantial content (at least 30 lines), got {line_count} lines"
 
 
-@given(
-    heading_level=st.sampled_from(["#", "##", "###"]),
-)
-def test_code_of_conduct_has_proper_markdown_structure(heading_level: str) -> None:
+def test_code_of_conduct_has_proper_markdown_structure() -> None:
     """Feature: open-source-standards, Property 4: CODE_OF_CONDUCT.md contains required sections.
 
     Validates: Requirements 2.2, 2.3, 2.4, 2.5
 
-    For any markdown heading level, the CODE_OF_CONDUCT.md file should use proper
-    markdown structure to organize content into sections.
+    The CODE_OF_CONDUCT.md file should use proper markdown structure to organize
+    content into sections.
     """
-    # Given the CODE_OF_CONDUCT.md file exists
-    code_of_conduct_path = Path("CODE_OF_CONDUCT.md")
-    assert code_of_conduct_path.exists(), "CODE_OF_CONDUCT.md file must exist"
-
     # When we read the file content
-    content = code_of_conduct_path.read_text(encoding="utf-8")
+    document = _load_document(_CODE_OF_CONDUCT_MD)
 
     # Then it should contain markdown headings
-    assert "#" in content, "CODE_OF_CONDUCT.md should use markdown headings"
+    assert document.has_heading, "CODE_OF_CONDUCT.md should use markdown headings"
 
     # The file should be well-structured with multiple sections
-    heading_count = content.count("\n#")
+    heading_count = document.heading_count
     assert heading_count >= 4, "CODE_OF_CONDUCT.md should have multiple sections (at least 4 headings)"
 
 
-@given(
-    contact_info_type=st.sampled_from(
-        [
-            "email",
-            "maintainer",
-            "project",
-        ]
-    )
+@pytest.mark.parametrize(
+    "contact_info_type",
+    [
+        "email",
+        "maintainer",
+        "project",
+    ],
 )
 def test_code_of_conduct_includes_contact_information(contact_info_type: str) -> None:
     """Feature: open-source-standards, Property 4: CODE_OF_CONDUCT.md contains required sections.
@@ -435,39 +671,26 @@ def test_code_of_conduct_includes_contact_information(contact_info_type: str) ->
     For any contact information type (email, maintainer reference, project reference),
     the CODE_OF_CONDUCT.md file should include that information for reporting violations.
     """
-    # Given the CODE_OF_CONDUCT.md file exists
-    code_of_conduct_path = Path("CODE_OF_CONDUCT.md")
-    assert code_of_conduct_path.exists(), "CODE_OF_CONDUCT.md file must exist"
-
-    # When we read the file content
-    content = code_of_conduct_path.read_text(encoding="utf-8").lower()
-
     # Then it should include contact information
-    contact_keywords = {
-        "email": ["email", "@", "contact"],
-        "maintainer": ["maintainer", "team", "leader"],
-        "project": ["project", "repository", "github"],
-    }
-
-    keywords = contact_keywords.get(contact_info_type, [contact_info_type])
+    keywords = _CODE_OF_CONDUCT_CONTACT_KEYWORDS[contact_info_type]
+    matched = _matched_keywords(_CODE_OF_CONDUCT_MD)
     assert any(
-        keyword in content for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"CODE_OF_CONDUCT.md should include {contact_info_type} information"
 
 
-@given(
-    required_section=st.sampled_from(
-        [
-            "supported versions",
-            "reporting",
-            "vulnerability",
-            "response",
-            "timeline",
-            "contact",
-            "disclosure",
-            "security",
-        ]
-    )
+@pytest.mark.parametrize(
+    "required_section",
+    [
+        "supported versions",
+        "reporting",
+        "vulnerability",
+        "response",
+        "timeline",
+        "contact",
+        "disclosure",
+        "security",
+    ],
 )
 def test_security_has_required_sections(required_section: str) -> None:
     """Feature: open-source-standards, Property 5: SECURITY.md contains required sections.
@@ -477,42 +700,24 @@ def test_security_has_required_sections(required_section: str) -> None:
     For any required section (supported versions, reporting instructions, response
     timeline, contact), the SECURITY.md file should contain that section.
     """
-    # Given the SECURITY.md file exists
-    security_path = Path("SECURITY.md")
-    assert security_path.exists(), "SECURITY.md file must exist"
-
-    # When we read the file content
-    content = security_path.read_text(encoding="utf-8").lower()
-
     # Then it should contain the required section
-    section_keywords = {
-        "supported versions": ["supported versions", "version", "support"],
-        "reporting": ["reporting", "report", "how to report"],
-        "vulnerability": ["vulnerability", "vulnerabilities", "security issue"],
-        "response": ["response", "respond", "acknowledgment"],
-        "timeline": ["timeline", "timeframe", "within", "hours", "days"],
-        "contact": ["contact", "email", "@", "maintainer"],
-        "disclosure": ["disclosure", "disclose", "public"],
-        "security": ["security", "secure"],
-    }
-
-    keywords = section_keywords.get(required_section, [required_section])
+    keywords = _SECURITY_SECTION_KEYWORDS[required_section]
 
     # At least one keyword should be present in the content
+    matched = _matched_keywords(_SECURITY_MD)
     assert any(
-        keyword in content for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"SECURITY.md should contain content about '{required_section}'"
 
 
-@given(
-    reporting_method=st.sampled_from(
-        [
-            "github",
-            "security advisory",
-            "private",
-            "issue",
-        ]
-    )
+@pytest.mark.parametrize(
+    "reporting_method",
+    [
+        "github",
+        "security advisory",
+        "private",
+        "issue",
+    ],
 )
 def test_security_provides_reporting_instructions(reporting_method: str) -> None:
     """Feature: open-source-standards, Property 5: SECURITY.md contains required sections.
@@ -522,36 +727,22 @@ def test_security_provides_reporting_instructions(reporting_method: str) -> None
     For any reporting method (GitHub, security advisory, private contact),
     the SECURITY.md file should provide instructions for that method.
     """
-    # Given the SECURITY.md file exists
-    security_path = Path("SECURITY.md")
-    assert security_path.exists(), "SECURITY.md file must exist"
-
-    # When we read the file content
-    content = security_path.read_text(encoding="utf-8").lower()
-
     # Then it should provide reporting instructions
-    reporting_keywords = {
-        "github": ["github", "repository", "security tab"],
-        "security advisory": ["security advisory", "advisory", "report a vulnerability"],
-        "private": ["private", "privately", "do not", "not public"],
-        "issue": ["issue", "report", "contact"],
-    }
-
-    keywords = reporting_keywords.get(reporting_method, [reporting_method])
+    keywords = _SECURITY_REPORTING_KEYWORDS[reporting_method]
+    matched = _matched_keywords(_SECURITY_MD)
     assert any(
-        keyword in content for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"SECURITY.md should provide instructions for {reporting_method}"
 
 
-@given(
-    response_aspect=st.sampled_from(
-        [
-            "acknowledgment",
-            "investigation",
-            "fix",
-            "update",
-        ]
-    )
+@pytest.mark.parametrize(
+    "response_aspect",
+    [
+        "acknowledgment",
+        "investigation",
+        "fix",
+        "update",
+    ],
 )
 def test_security_describes_response_process(response_aspect: str) -> None:
     """Feature: open-source-standards, Property 5: SECURITY.md contains required sections.
@@ -561,36 +752,22 @@ def test_security_describes_response_process(response_aspect: str) -> None:
     For any response aspect (acknowledgment, investigation, fix, update),
     the SECURITY.md file should describe how that aspect is handled.
     """
-    # Given the SECURITY.md file exists
-    security_path = Path("SECURITY.md")
-    assert security_path.exists(), "SECURITY.md file must exist"
-
-    # When we read the file content
-    content = security_path.read_text(encoding="utf-8").lower()
-
     # Then it should describe the response process
-    response_keywords = {
-        "acknowledgment": ["acknowledge", "acknowledgment", "receipt", "confirm"],
-        "investigation": ["investigate", "investigation", "assess", "determine"],
-        "fix": ["fix", "patch", "resolve", "solution"],
-        "update": ["update", "status", "progress", "inform"],
-    }
-
-    keywords = response_keywords.get(response_aspect, [response_aspect])
+    keywords = _SECURITY_RESPONSE_KEYWORDS[response_aspect]
+    matched = _matched_keywords(_SECURITY_MD)
     assert any(
-        keyword in content for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"SECURITY.md should describe {response_aspect} process"
 
 
-@given(
-    time_commitment=st.sampled_from(
-        [
-            "48 hours",
-            "hours",
-            "days",
-            "timeline",
-        ]
-    )
+@pytest.mark.parametrize(
+    "time_commitment",
+    [
+        "48 hours",
+        "hours",
+        "days",
+        "timeline",
+    ],
 )
 def test_security_includes_response_timeframes(time_commitment: str) -> None:
     """Feature: open-source-standards, Property 5: SECURITY.md contains required sections.
@@ -600,35 +777,21 @@ def test_security_includes_response_timeframes(time_commitment: str) -> None:
     For any time commitment aspect, the SECURITY.md file should include
     expected response timeframes.
     """
-    # Given the SECURITY.md file exists
-    security_path = Path("SECURITY.md")
-    assert security_path.exists(), "SECURITY.md file must exist"
-
-    # When we read the file content
-    content = security_path.read_text(encoding="utf-8").lower()
-
     # Then it should include timeframes
-    time_keywords = {
-        "48 hours": ["48 hours", "48 hour", "two days"],
-        "hours": ["hours", "hour"],
-        "days": ["days", "day"],
-        "timeline": ["timeline", "timeframe", "within"],
-    }
-
-    keywords = time_keywords.get(time_commitment, [time_commitment])
+    keywords = _SECURITY_TIMEFRAME_KEYWORDS[time_commitment]
+    matched = _matched_keywords(_SECURITY_MD)
     assert any(
-        keyword in content for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"SECURITY.md should include timeframes mentioning {time_commitment}"
 
 
-@given(
-    communication_channel=st.sampled_from(
-        [
-            "github",
-            "security advisory",
-            "maintainer",
-        ]
-    )
+@pytest.mark.parametrize(
+    "communication_channel",
+    [
+        "github",
+        "security advisory",
+        "maintainer",
+    ],
 )
 def test_security_specifies_communication_channels(communication_channel: str) -> None:
     """Feature: open-source-standards, Property 5: SECURITY.md contains required sections.
@@ -638,89 +801,62 @@ def test_security_specifies_communication_channels(communication_channel: str) -
     For any communication channel (GitHub, security advisory, maintainer contact),
     the SECURITY.md file should specify how to use that channel.
     """
-    # Given the SECURITY.md file exists
-    security_path = Path("SECURITY.md")
-    assert security_path.exists(), "SECURITY.md file must exist"
-
-    # When we read the file content
-    content = security_path.read_text(encoding="utf-8").lower()
-
     # Then it should specify communication channels
-    channel_keywords = {
-        "github": ["github", "repository", "security tab"],
-        "security advisory": ["security advisory", "advisory"],
-        "maintainer": ["maintainer", "@ultrasardine", "contact"],
-    }
-
-    keywords = channel_keywords.get(communication_channel, [communication_channel])
+    keywords = _SECURITY_CHANNEL_KEYWORDS[communication_channel]
+    matched = _matched_keywords(_SECURITY_MD)
     assert any(
-        keyword in content for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"SECURITY.md should specify {communication_channel} as a communication channel"
 
 
-@given(
-    file_size_threshold=st.integers(min_value=1000, max_value=50000),
-)
-def test_security_has_substantial_content(file_size_threshold: int) -> None:
+def test_security_has_substantial_content() -> None:
     """Feature: open-source-standards, Property 5: SECURITY.md contains required sections.
 
     Validates: Requirements 3.1, 3.2, 3.3, 3.4, 3.5
 
-    For any reasonable content threshold, the SECURITY.md file should contain
-    substantial content (not just a placeholder).
+    The SECURITY.md file should contain substantial content (not just a
+    placeholder).
     """
-    # Given the SECURITY.md file exists
-    security_path = Path("SECURITY.md")
-    assert security_path.exists(), "SECURITY.md file must exist"
-
     # When we check the file size
-    file_size = security_path.stat().st_size
+    document = _load_document(_SECURITY_MD)
+    file_size = document.size
 
     # Then it should have substantial content
     # A comprehensive SECURITY.md should be at least 3KB
     assert file_size >= 3000, f"SECURITY.md should have substantial content (at least 3KB), got {file_size} bytes"
 
     # And it should have multiple lines
-    content = security_path.read_text(encoding="utf-8")
-    line_count = len(content.splitlines())
+    line_count = document.line_count
     assert line_count >= 50, f"SECURITY.md should have substantial content (at least 50 lines), got {line_count} lines"
 
 
-@given(
-    heading_level=st.sampled_from(["#", "##", "###"]),
-)
-def test_security_has_proper_markdown_structure(heading_level: str) -> None:
+def test_security_has_proper_markdown_structure() -> None:
     """Feature: open-source-standards, Property 5: SECURITY.md contains required sections.
 
     Validates: Requirements 3.2, 3.3, 3.4, 3.5
 
-    For any markdown heading level, the SECURITY.md file should use proper
-    markdown structure to organize content into sections.
+    The SECURITY.md file should use proper markdown structure to organize content
+    into sections.
     """
-    # Given the SECURITY.md file exists
-    security_path = Path("SECURITY.md")
-    assert security_path.exists(), "SECURITY.md file must exist"
-
     # When we read the file content
-    content = security_path.read_text(encoding="utf-8")
+    document = _load_document(_SECURITY_MD)
 
     # Then it should contain markdown headings
-    assert "#" in content, "SECURITY.md should use markdown headings"
+    assert document.has_heading, "SECURITY.md should use markdown headings"
 
     # The file should be well-structured with multiple sections
-    heading_count = content.count("\n#")
+    heading_count = document.heading_count
     assert heading_count >= 5, "SECURITY.md should have multiple sections (at least 5 headings)"
 
 
-@given(
-    disclosure_aspect=st.sampled_from(
-        [
-            "coordinated",
-            "private",
-            "public",
-            "policy",
-        ]
-    )
+@pytest.mark.parametrize(
+    "disclosure_aspect",
+    [
+        "coordinated",
+        "private",
+        "public",
+        "policy",
+    ],
 )
 def test_security_includes_disclosure_policy(disclosure_aspect: str) -> None:
     """Feature: open-source-standards, Property 5: SECURITY.md contains required sections.
@@ -730,37 +866,75 @@ def test_security_includes_disclosure_policy(disclosure_aspect: str) -> None:
     For any disclosure aspect (coordinated, private, public, policy),
     the SECURITY.md file should include information about the disclosure policy.
     """
-    # Given the SECURITY.md file exists
-    security_path = Path("SECURITY.md")
-    assert security_path.exists(), "SECURITY.md file must exist"
-
-    # When we read the file content
-    content = security_path.read_text(encoding="utf-8").lower()
-
     # Then it should include disclosure policy information
-    disclosure_keywords = {
-        "coordinated": ["coordinated", "coordinate", "coordination"],
-        "private": ["private", "privately", "confidential"],
-        "public": ["public", "publicly", "disclosure"],
-        "policy": ["policy", "approach", "process"],
-    }
-
-    keywords = disclosure_keywords.get(disclosure_aspect, [disclosure_aspect])
+    keywords = _SECURITY_DISCLOSURE_KEYWORDS[disclosure_aspect]
+    matched = _matched_keywords(_SECURITY_MD)
     assert any(
-        keyword in content for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"SECURITY.md should include information about {disclosure_aspect} disclosure"
 
 
 import yaml
 
+# libyaml's C parser when PyYAML was built against it, the pure-Python one otherwise
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class _IssueFormFields(NamedTuple):
+    """Ids, lowercased labels and validation counts of an issue form's body fields.
+
+    The labels are joined one per line, so a keyword can be found with a single
+    substring search but never matches across two labels.
+    """
+
+    ids: frozenset[str]
+    label_text: str
+    validated_count: int
+    required_count: int
+    optional_count: int
+
+
+@functools.lru_cache(maxsize=None)
+def _load_yaml(path: str) -> Any:
+    """Parse a YAML file once per test session."""
+    return yaml.load(Path(path).read_text(encoding="utf-8"), Loader=_YamlLoader)
+
 
-@given(
-    template_file=st.sampled_from(
-        [
-            ".github/ISSUE_TEMPLATE/bug_report.yml",
-            ".github/ISSUE_TEMPLATE/feature_request.yml",
-        ]
+@functools.lru_cache(maxsize=None)
+def _issue_form_fields(path: str) -> _IssueFormFields:
+    """Collect the field ids, labels and validations of an issue form once per session."""
+    body = _load_yaml(path)["body"]
+    required = [field["validations"].get("required") for field in body if "validations" in field]
+    return _IssueFormFields(
+        ids=frozenset(field["id"] for field in body if "id" in field),
+        label_text="\n".join(
+            field.get("attributes", {}).get("label", "").lower()
+            for field in body
+            if "attributes" in field
+        ),
+        validated_count=len(required),
+        required_count=sum(value is True for value in required),
+        optional_count=sum(value is False for value in required),
     )
+
+
+# Bug report field -> label keywords that show the field is present
+_BUG_REPORT_FIELD_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "description": ("description", "bug description"),
+        "reproduction": ("reproduction", "reproduce", "steps"),
+        "expected": ("expected", "expected behavior"),
+        "actual": ("actual", "actual behavior"),
+    }
+)
+
+
+@pytest.mark.parametrize(
+    "template_file",
+    [
+        _BUG_REPORT_YML,
+        _FEATURE_REQUEST_YML,
+    ],
 )
 def test_issue_templates_exist(template_file: str) -> None:
     """Feature: open-source-standards, Property 6: Issue templates contain required fields.
@@ -770,25 +944,21 @@ def test_issue_templates_exist(template_file: str) -> None:
     For any issue template (bug report, feature request), the template file
     should exist in the .github/ISSUE_TEMPLATE/ directory.
     """
-    # Given an issue template path
-    template_path = Path(template_file)
-
     # Then the template file should exist
-    assert template_path.exists(), f"Issue template {template_file} should exist"
+    assert _path_exists(template_file), f"Issue template {template_file} should exist"
 
     # And it should not be empty
-    assert template_path.stat().st_size > 0, f"Issue template {template_file} should not be empty"
+    assert _path_size(template_file) > 0, f"Issue template {template_file} should not be empty"
 
 
-@given(
-    required_field=st.sampled_from(
-        [
-            "description",
-            "reproduction",
-            "expected",
-            "actual",
-        ]
-    )
+@pytest.mark.parametrize(
+    "required_field",
+    [
+        "description",
+        "reproduction",
+        "expected",
+        "actual",
+    ],
 )
 def test_bug_report_template_has_required_fields(required_field: str) -> None:
     """Feature: open-source-standards, Property 6: Issue templates contain required fields.
@@ -799,48 +969,32 @@ def test_bug_report_template_has_required_fields(required_field: str) -> None:
     expected behavior, actual behavior), the template should include that field.
     """
     # Given the bug report template exists
-    template_path = Path(".github/ISSUE_TEMPLATE/bug_report.yml")
-    assert template_path.exists(), "Bug report template should exist"
+    assert _path_exists(_BUG_REPORT_YML), "Bug report template should exist"
 
     # When we parse the template YAML
-    content = template_path.read_text(encoding="utf-8")
-    template_data = yaml.safe_load(content)
+    template_data = _load_yaml(_BUG_REPORT_YML)
 
     # Then it should have a body with form fields
     assert "body" in template_data, "Bug report template should have a body"
     assert isinstance(template_data["body"], list), "Template body should be a list of fields"
 
     # And it should contain the required field
-    field_ids = [field.get("id", "") for field in template_data["body"] if "id" in field]
-    field_labels = [
-        field.get("attributes", {}).get("label", "").lower()
-        for field in template_data["body"]
-        if "attributes" in field
-    ]
-
-    field_keywords = {
-        "description": ["description", "bug description"],
-        "reproduction": ["reproduction", "reproduce", "steps"],
-        "expected": ["expected", "expected behavior"],
-        "actual": ["actual", "actual behavior"],
-    }
-
-    keywords = field_keywords.get(required_field, [required_field])
+    fields = _issue_form_fields(_BUG_REPORT_YML)
+    keywords = _BUG_REPORT_FIELD_KEYWORDS.get(required_field, (required_field,))
 
     # Check if the field ID or label matches
     assert (
-        required_field in field_ids
-        or any(keyword in label for label in field_labels for keyword in keywords)
+        required_field in fields.ids
+        or any(keyword in fields.label_text for keyword in keywords)
     ), f"Bug report template should include field for {required_field}"
 
 
-@given(
-    environment_field=st.sampled_from(
-        [
-            "os",
-            "python-version",
-        ]
-    )
+@pytest.mark.parametrize(
+    "environment_field",
+    [
+        "os",
+        "python-version",
+    ],
 )
 def test_bug_report_template_has_environment_fields(environment_field: str) -> None:
     """Feature: open-source-standards, Property 6: Issue templates contain required fields.
@@ -851,17 +1005,15 @@ def test_bug_report_template_has_environment_fields(environment_field: str) -> N
     should include that field to capture environment information.
     """
     # Given the bug report template exists
-    template_path = Path(".github/ISSUE_TEMPLATE/bug_report.yml")
-    assert template_path.exists(), "Bug report template should exist"
+    assert _path_exists(_BUG_REPORT_YML), "Bug report template should exist"
 
     # When we parse the template YAML
-    content = template_path.read_text(encoding="utf-8")
-    template_data = yaml.safe_load(content)
+    template_data = _load_yaml(_BUG_REPORT_YML)
 
     # Then it should have environment fields
     assert "body" in template_data, "Bug report template should have a body"
 
-    field_ids = [field.get("id", "") for field in template_data["body"] if "id" in field]
+    field_ids = _issue_form_fields(_BUG_REPORT_YML).ids
 
     # Check if the environment field is present
     assert (
@@ -869,14 +1021,13 @@ def test_bug_report_template_has_environment_fields(environment_field: str) -> N
     ), f"Bug report template should include {environment_field} field"
 
 
-@given(
-    required_field=st.sampled_from(
-        [
-            "problem",
-            "solution",
-            "use-case",
-        ]
-    )
+@pytest.mark.parametrize(
+    "required_field",
+    [
+        "problem",
+        "solution",
+        "use-case",
+    ],
 )
 def test_feature_request_template_has_required_fields(required_field: str) -> None:
     """Feature: open-source-standards, Property 6: Issue templates contain required fields.
@@ -887,19 +1038,17 @@ def test_feature_request_template_has_required_fields(required_field: str) -> No
     proposed solution, use case), the template should include that field.
     """
     # Given the feature request template exists
-    template_path = Path(".github/ISSUE_TEMPLATE/feature_request.yml")
-    assert template_path.exists(), "Feature request template should exist"
+    assert _path_exists(_FEATURE_REQUEST_YML), "Feature request template should exist"
 
     # When we parse the template YAML
-    content = template_path.read_text(encoding="utf-8")
-    template_data = yaml.safe_load(content)
+    template_data = _load_yaml(_FEATURE_REQUEST_YML)
 
     # Then it should have a body with form fields
     assert "body" in template_data, "Feature request template should have a body"
     assert isinstance(template_data["body"], list), "Template body should be a list of fields"
 
     # And it should contain the required field
-    field_ids = [field.get("id", "") for field in template_data["body"] if "id" in field]
+    field_ids = _issue_form_fields(_FEATURE_REQUEST_YML).ids
 
     # Check if the field ID matches
     assert (
@@ -907,13 +1056,12 @@ def test_feature_request_template_has_required_fields(required_field: str) -> No
     ), f"Feature request template should include field for {required_field}"
 
 
-@given(
-    optional_field=st.sampled_from(
-        [
-            "alternatives",
-            "additional",
-        ]
-    )
+@pytest.mark.parametrize(
+    "optional_field",
+    [
+        "alternatives",
+        "additional",
+    ],
 )
 def test_feature_request_template_has_optional_fields(optional_field: str) -> None:
     """Feature: open-source-standards, Property 6: Issue templates contain required fields.
@@ -924,17 +1072,15 @@ def test_feature_request_template_has_optional_fields(optional_field: str) -> No
     additional context), the template should include that field.
     """
     # Given the feature request template exists
-    template_path = Path(".github/ISSUE_TEMPLATE/feature_request.yml")
-    assert template_path.exists(), "Feature request template should exist"
+    assert _path_exists(_FEATURE_REQUEST_YML), "Feature request template should exist"
 
     # When we parse the template YAML
-    content = template_path.read_text(encoding="utf-8")
-    template_data = yaml.safe_load(content)
+    template_data = _load_yaml(_FEATURE_REQUEST_YML)
 
     # Then it should have a body with form fields
     assert "body" in template_data, "Feature request template should have a body"
 
-    field_ids = [field.get("id", "") for field in template_data["body"] if "id" in field]
+    field_ids = _issue_form_fields(_FEATURE_REQUEST_YML).ids
 
     # Check if the optional field is present
     assert (
@@ -942,13 +1088,12 @@ def test_feature_request_template_has_optional_fields(optional_field: str) -> No
     ), f"Feature request template should include optional field for {optional_field}"
 
 
-@given(
-    template_file=st.sampled_from(
-        [
-            ".github/ISSUE_TEMPLATE/bug_report.yml",
-            ".github/ISSUE_TEMPLATE/feature_request.yml",
-        ]
-    )
+@pytest.mark.parametrize(
+    "template_file",
+    [
+        _BUG_REPORT_YML,
+        _FEATURE_REQUEST_YML,
+    ],
 )
 def test_issue_templates_have_valid_yaml_structure(template_file: str) -> None:
     """Feature: open-source-standards, Property 6: Issue templates contain required fields.
@@ -959,12 +1104,10 @@ def test_issue_templates_have_valid_yaml_structure(template_file: str) -> None:
     including name, description, and body fields.
     """
     # Given an issue template
-    template_path = Path(template_file)
-    assert template_path.exists(), f"Template {template_file} should exist"
+    assert _path_exists(template_file), f"Template {template_file} should exist"
 
     # When we parse the template
-    content = template_path.read_text(encoding="utf-8")
-    template_data = yaml.safe_load(content)
+    template_data = _load_yaml(template_file)
 
     # Then it should have required top-level fields
     assert "name" in template_data, f"Template {template_file} should have a name"
@@ -978,9 +1121,18 @@ def test_issue_templates_have_valid_yaml_structure(template_file: str) -> None:
     assert len(template_data["body"]) > 0, f"Template {template_file} should have at least one field"
 
 
-@given(
-    field_index=st.integers(min_value=0, max_value=10),
-)
+@functools.lru_cache(maxsize=None)
+def _bug_report_field_count() -> int:
+    """Count the bug report's fields, or 1 so a broken form fails inside the test."""
+    try:
+        return len(_load_yaml(_BUG_REPORT_YML)["body"])
+    except (OSError, yaml.YAMLError, KeyError, TypeError):
+        return 1
+
+
+# Parametrize over the fields the bug report actually has, rather than a fixed
+# range that leaves most indices with nothing to check
+@pytest.mark.parametrize("field_index", range(_bug_report_field_count()))
 def test_issue_template_fields_have_proper_structure(field_index: int) -> None:
     """Feature: open-source-standards, Property 6: Issue templates contain required fields.
 
@@ -990,25 +1142,20 @@ def test_issue_template_fields_have_proper_structure(field_index: int) -> None:
     with type and attributes.
     """
     # Given a bug report template
-    template_path = Path(".github/ISSUE_TEMPLATE/bug_report.yml")
-    assert template_path.exists(), "Bug report template should exist"
+    assert _path_exists(_BUG_REPORT_YML), "Bug report template should exist"
 
     # When we parse the template
-    content = template_path.read_text(encoding="utf-8")
-    template_data = yaml.safe_load(content)
-
-    # Then if the field index is valid
-    if field_index < len(template_data["body"]):
-        field = template_data["body"][field_index]
+    template_data = _load_yaml(_BUG_REPORT_YML)
 
-        # The field should have a type
-        assert "type" in field, f"Field at index {field_index} should have a type"
+    # Then the field should have a type
+    field = template_data["body"][field_index]
+    assert "type" in field, f"Field at index {field_index} should have a type"
 
-        # If it's not a markdown field, it should have attributes
-        if field["type"] != "markdown":
-            assert (
-                "attributes" in field
-            ), f"Non-markdown field at index {field_index} should have attributes"
+    # If it's not a markdown field, it should have attributes
+    if field["type"] != "markdown":
+        assert (
+            "attributes" in field
+        ), f"Non-markdown field at index {field_index} should have attributes"
 
 
 def test_issue_template_config_exists() -> None:
@@ -1018,15 +1165,11 @@ def test_issue_template_config_exists() -> None:
 
     The issue template configuration file should exist to configure the template chooser.
     """
-    # Given the issue template directory
-    config_path = Path(".github/ISSUE_TEMPLATE/config.yml")
-
     # Then the config file should exist
-    assert config_path.exists(), "Issue template config.yml should exist"
+    assert _path_exists(_ISSUE_CONFIG_YML), "Issue template config.yml should exist"
 
     # And it should be valid YAML
-    content = config_path.read_text(encoding="utf-8")
-    config_data = yaml.safe_load(content)
+    config_data = _load_yaml(_ISSUE_CONFIG_YML)
 
     # And it should have the blank_issues_enabled setting
     assert (
@@ -1034,13 +1177,12 @@ def test_issue_template_config_exists() -> None:
     ), "config.yml should have blank_issues_enabled setting"
 
 
-@given(
-    template_type=st.sampled_from(
-        [
-            "bug_report",
-            "feature_request",
-        ]
-    )
+@pytest.mark.parametrize(
+    "template_type",
+    [
+        "bug_report",
+        "feature_request",
+    ],
 )
 def test_issue_templates_have_labels(template_type: str) -> None:
     """Feature: open-source-standards, Property 6: Issue templates contain required fields.
@@ -1051,12 +1193,10 @@ def test_issue_templates_have_labels(template_type: str) -> None:
     to issues created with that template.
     """
     # Given an issue template
-    template_path = Path(f".github/ISSUE_TEMPLATE/{template_type}.yml")
-    assert template_path.exists(), f"Template {template_type}.yml should exist"
+    assert _path_exists(f"{_ISSUE_TEMPLATE_DIR}/{template_type}.yml"), f"Template {template_type}.yml should exist"
 
     # When we parse the template
-    content = template_path.read_text(encoding="utf-8")
-    template_data = yaml.safe_load(content)
+    template_data = _load_yaml(f"{_ISSUE_TEMPLATE_DIR}/{template_type}.yml")
 
     # Then it should have labels defined
     assert "labels" in template_data, f"Template {template_type}.yml should have labels"
@@ -1064,13 +1204,12 @@ def test_issue_templates_have_labels(template_type: str) -> None:
     assert len(template_data["labels"]) > 0, f"Template {template_type}.yml should have at least one label"
 
 
-@given(
-    validation_requirement=st.sampled_from(
-        [
-            "required_true",
-            "required_false",
-        ]
-    )
+@pytest.mark.parametrize(
+    "validation_requirement",
+    [
+        "required_true",
+        "required_false",
+    ],
 )
 def test_issue_template_fields_have_validation(validation_requirement: str) -> None:
     """Feature: open-source-standards, Property 6: Issue templates contain required fields.
@@ -1081,48 +1220,31 @@ def test_issue_template_fields_have_validation(validation_requirement: str) -> N
     fields as required or optional using the validations section.
     """
     # Given the bug report template
-    template_path = Path(".github/ISSUE_TEMPLATE/bug_report.yml")
-    assert template_path.exists(), "Bug report template should exist"
+    assert _path_exists(_BUG_REPORT_YML), "Bug report template should exist"
 
     # When we parse the template
-    content = template_path.read_text(encoding="utf-8")
-    template_data = yaml.safe_load(content)
+    fields = _issue_form_fields(_BUG_REPORT_YML)
 
     # Then we should find fields with validation settings
-    fields_with_validation = [
-        field for field in template_data["body"] if "validations" in field
-    ]
-
-    assert len(fields_with_validation) > 0, "Template should have fields with validation settings"
+    assert fields.validated_count > 0, "Template should have fields with validation settings"
 
     # And we should find both required and optional fields
     if validation_requirement == "required_true":
-        required_fields = [
-            field
-            for field in fields_with_validation
-            if field.get("validations", {}).get("required") is True
-        ]
-        assert len(required_fields) > 0, "Template should have required fields"
+        assert fields.required_count > 0, "Template should have required fields"
     else:
-        optional_fields = [
-            field
-            for field in fields_with_validation
-            if field.get("validations", {}).get("required") is False
-        ]
-        assert len(optional_fields) > 0, "Template should have optional fields"
-
-
-@given(
-    required_section=st.sampled_from(
-        [
-            "description",
-            "related issues",
-            "type of change",
-            "testing",
-            "documentation",
-            "code quality",
-        ]
-    )
+        assert fields.optional_count > 0, "Template should have optional fields"
+
+
+@pytest.mark.parametrize(
+    "required_section",
+    [
+        "description",
+        "related issues",
+        "type of change",
+        "testing",
+        "documentation",
+        "code quality",
+    ],
 )
 def test_pr_template_has_required_sections(required_section: str) -> None:
     """Feature: open-source-standards, Property 7: Pull request template contains required sections.
@@ -1133,39 +1255,26 @@ def test_pr_template_has_required_sections(required_section: str) -> None:
     documentation checklist), the PR template should contain that section.
     """
     # Given the PR template exists
-    pr_template_path = Path(".github/pull_request_template.md")
-    assert pr_template_path.exists(), "Pull request template should exist"
-
-    # When we read the file content
-    content = pr_template_path.read_text(encoding="utf-8").lower()
+    assert _path_exists(_PULL_REQUEST_TEMPLATE_MD), "Pull request template should exist"
 
     # Then it should contain the required section
-    section_keywords = {
-        "description": ["description", "what does this pr do", "why is this change"],
-        "related issues": ["related issues", "fixes", "closes", "issue"],
-        "type of change": ["type of change", "bug fix", "feature", "breaking change"],
-        "testing": ["testing", "tests", "test coverage", "pytest"],
-        "documentation": ["documentation", "readme", "docs", "changelog"],
-        "code quality": ["code quality", "linting", "type checking", "black", "ruff", "mypy"],
-    }
-
-    keywords = section_keywords.get(required_section, [required_section])
+    keywords = _PULL_REQUEST_SECTION_KEYWORDS[required_section]
 
     # At least one keyword should be present in the content
+    matched = _matched_keywords(_PULL_REQUEST_TEMPLATE_MD)
     assert any(
-        keyword in content for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"PR template should contain section about '{required_section}'"
 
 
-@given(
-    checklist_type=st.sampled_from(
-        [
-            "testing",
-            "documentation",
-            "code quality",
-            "type of change",
-        ]
-    )
+@pytest.mark.parametrize(
+    "checklist_type",
+    [
+        "testing",
+        "documentation",
+        "code quality",
+        "type of change",
+    ],
 )
 def test_pr_template_has_checklists(checklist_type: str) -> None:
     """Feature: open-source-standards, Property 7: Pull request template contains required sections.
@@ -1176,39 +1285,30 @@ def test_pr_template_has_checklists(checklist_type: str) -> None:
     the PR template should include a checklist for that category.
     """
     # Given the PR template exists
-    pr_template_path = Path(".github/pull_request_template.md")
-    assert pr_template_path.exists(), "Pull request template should exist"
+    assert _path_exists(_PULL_REQUEST_TEMPLATE_MD), "Pull request template should exist"
 
     # When we read the file content
-    content = pr_template_path.read_text(encoding="utf-8")
+    content = _load_document(_PULL_REQUEST_TEMPLATE_MD).lower
 
     # Then it should contain checkbox items (markdown checkboxes)
     assert "- [ ]" in content, "PR template should contain checkbox items"
 
     # And it should contain the checklist type
-    content_lower = content.lower()
-    checklist_keywords = {
-        "testing": ["testing", "tests", "test"],
-        "documentation": ["documentation", "readme", "docs", "changelog"],
-        "code quality": ["code quality", "linting", "type checking", "black", "ruff", "mypy"],
-        "type of change": ["type of change", "bug fix", "feature", "breaking change"],
-    }
-
-    keywords = checklist_keywords.get(checklist_type, [checklist_type])
+    keywords = _PULL_REQUEST_CHECKLIST_KEYWORDS[checklist_type]
+    matched = _matched_keywords(_PULL_REQUEST_TEMPLATE_MD)
     assert any(
-        keyword in content_lower for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"PR template should include checklist for {checklist_type}"
 
 
-@given(
-    change_type=st.sampled_from(
-        [
-            "bug fix",
-            "feature",
-            "breaking change",
-            "documentation",
-        ]
-    )
+@pytest.mark.parametrize(
+    "change_type",
+    [
+        "bug fix",
+        "feature",
+        "breaking change",
+        "documentation",
+    ],
 )
 def test_pr_template_includes_change_types(change_type: str) -> None:
     """Feature: open-source-standards, Property 7: Pull request template contains required sections.
@@ -1219,34 +1319,23 @@ def test_pr_template_includes_change_types(change_type: str) -> None:
     the PR template should include that option in the type of change checklist.
     """
     # Given the PR template exists
-    pr_template_path = Path(".github/pull_request_template.md")
-    assert pr_template_path.exists(), "Pull request template should exist"
-
-    # When we read the file content
-    content = pr_template_path.read_text(encoding="utf-8").lower()
+    assert _path_exists(_PULL_REQUEST_TEMPLATE_MD), "Pull request template should exist"
 
     # Then it should include the change type
-    change_type_keywords = {
-        "bug fix": ["bug fix", "bug"],
-        "feature": ["feature", "new feature"],
-        "breaking change": ["breaking change", "breaking"],
-        "documentation": ["documentation", "docs"],
-    }
-
-    keywords = change_type_keywords.get(change_type, [change_type])
+    keywords = _PULL_REQUEST_CHANGE_TYPE_KEYWORDS[change_type]
+    matched = _matched_keywords(_PULL_REQUEST_TEMPLATE_MD)
     assert any(
-        keyword in content for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"PR template should include '{change_type}' as a change type option"
 
 
-@given(
-    testing_item=st.sampled_from(
-        [
-            "tests added",
-            "tests pass",
-            "coverage",
-        ]
-    )
+@pytest.mark.parametrize(
+    "testing_item",
+    [
+        "tests added",
+        "tests pass",
+        "coverage",
+    ],
 )
 def test_pr_template_includes_testing_checklist_items(testing_item: str) -> None:
     """Feature: open-source-standards, Property 7: Pull request template contains required sections.
@@ -1257,33 +1346,23 @@ def test_pr_template_includes_testing_checklist_items(testing_item: str) -> None
     the PR template should include that item in the testing checklist.
     """
     # Given the PR template exists
-    pr_template_path = Path(".github/pull_request_template.md")
-    assert pr_template_path.exists(), "Pull request template should exist"
-
-    # When we read the file content
-    content = pr_template_path.read_text(encoding="utf-8").lower()
+    assert _path_exists(_PULL_REQUEST_TEMPLATE_MD), "Pull request template should exist"
 
     # Then it should include the testing item
-    testing_keywords = {
-        "tests added": ["added tests", "tests that prove", "test"],
-        "tests pass": ["tests pass", "passing", "all new and existing tests"],
-        "coverage": ["coverage", "test coverage"],
-    }
-
-    keywords = testing_keywords.get(testing_item, [testing_item])
+    keywords = _PULL_REQUEST_TESTING_KEYWORDS[testing_item]
+    matched = _matched_keywords(_PULL_REQUEST_TEMPLATE_MD)
     assert any(
-        keyword in content for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"PR template should include testing checklist item for '{testing_item}'"
 
 
-@given(
-    documentation_item=st.sampled_from(
-        [
-            "readme",
-            "docs",
-            "changelog",
-        ]
-    )
+@pytest.mark.parametrize(
+    "documentation_item",
+    [
+        "readme",
+        "docs",
+        "changelog",
+    ],
 )
 def test_pr_template_includes_documentation_checklist_items(
     documentation_item: str,
@@ -1296,35 +1375,25 @@ def test_pr_template_includes_documentation_checklist_items(
     the PR template should include that item in the documentation checklist.
     """
     # Given the PR template exists
-    pr_template_path = Path(".github/pull_request_template.md")
-    assert pr_template_path.exists(), "Pull request template should exist"
-
-    # When we read the file content
-    content = pr_template_path.read_text(encoding="utf-8").lower()
+    assert _path_exists(_PULL_REQUEST_TEMPLATE_MD), "Pull request template should exist"
 
     # Then it should include the documentation item
-    documentation_keywords = {
-        "readme": ["readme", "readme.md"],
-        "docs": ["docs", "documentation"],
-        "changelog": ["changelog", "changelog.md"],
-    }
-
-    keywords = documentation_keywords.get(documentation_item, [documentation_item])
+    keywords = _PULL_REQUEST_DOCUMENTATION_KEYWORDS[documentation_item]
+    matched = _matched_keywords(_PULL_REQUEST_TEMPLATE_MD)
     assert any(
-        keyword in content for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"PR template should include documentation checklist item for '{documentation_item}'"
 
 
-@given(
-    quality_check=st.sampled_from(
-        [
-            "linting",
-            "type checking",
-            "black",
-            "ruff",
-            "mypy",
-        ]
-    )
+@pytest.mark.parametrize(
+    "quality_check",
+    [
+        "linting",
+        "type checking",
+        "black",
+        "ruff",
+        "mypy",
+    ],
 )
 def test_pr_template_includes_code_quality_checks(quality_check: str) -> None:
     """Feature: open-source-standards, Property 7: Pull request template contains required sections.
@@ -1335,35 +1404,23 @@ def test_pr_template_includes_code_quality_checks(quality_check: str) -> None:
     the PR template should include that check in the code quality checklist.
     """
     # Given the PR template exists
-    pr_template_path = Path(".github/pull_request_template.md")
-    assert pr_template_path.exists(), "Pull request template should exist"
-
-    # When we read the file content
-    content = pr_template_path.read_text(encoding="utf-8").lower()
+    assert _path_exists(_PULL_REQUEST_TEMPLATE_MD), "Pull request template should exist"
 
     # Then it should include the quality check
-    quality_keywords = {
-        "linting": ["linting", "lint", "ruff"],
-        "type checking": ["type checking", "type check", "mypy"],
-        "black": ["black", "format"],
-        "ruff": ["ruff", "lint"],
-        "mypy": ["mypy", "type"],
-    }
-
-    keywords = quality_keywords.get(quality_check, [quality_check])
+    keywords = _PULL_REQUEST_QUALITY_KEYWORDS[quality_check]
+    matched = _matched_keywords(_PULL_REQUEST_TEMPLATE_MD)
     assert any(
-        keyword in content for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"PR template should include code quality check for '{quality_check}'"
 
 
-@given(
-    linking_instruction=st.sampled_from(
-        [
-            "fixes",
-            "closes",
-            "related",
-        ]
-    )
+@pytest.mark.parametrize(
+    "linking_instruction",
+    [
+        "fixes",
+        "closes",
+        "related",
+    ],
 )
 def test_pr_template_includes_issue_linking_instructions(
     linking_instruction: str,
@@ -1376,76 +1433,59 @@ def test_pr_template_includes_issue_linking_instructions(
     the PR template should include examples or instructions for that linking keyword.
     """
     # Given the PR template exists
-    pr_template_path = Path(".github/pull_request_template.md")
-    assert pr_template_path.exists(), "Pull request template should exist"
-
-    # When we read the file content
-    content = pr_template_path.read_text(encoding="utf-8").lower()
+    assert _path_exists(_PULL_REQUEST_TEMPLATE_MD), "Pull request template should exist"
 
     # Then it should include issue linking instructions
-    linking_keywords = {
-        "fixes": ["fixes", "fix"],
-        "closes": ["closes", "close"],
-        "related": ["related", "related to"],
-    }
-
-    keywords = linking_keywords.get(linking_instruction, [linking_instruction])
+    keywords = _PULL_REQUEST_LINKING_KEYWORDS[linking_instruction]
+    matched = _matched_keywords(_PULL_REQUEST_TEMPLATE_MD)
     assert any(
-        keyword in content for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"PR template should include issue linking instruction for '{linking_instruction}'"
 
 
-@given(
-    file_size_threshold=st.integers(min_value=1000, max_value=50000),
-)
-def test_pr_template_has_substantial_content(file_size_threshold: int) -> None:
+def test_pr_template_has_substantial_content() -> None:
     """Feature: open-source-standards, Property 7: Pull request template contains required sections.
 
     Validates: Requirements 5.1, 5.2, 5.3, 5.4, 5.5
 
-    For any reasonable content threshold, the PR template should contain
-    substantial content (not just a placeholder).
+    The PR template should contain substantial content (not just a
+    placeholder).
     """
     # Given the PR template exists
-    pr_template_path = Path(".github/pull_request_template.md")
-    assert pr_template_path.exists(), "Pull request template should exist"
+    assert _path_exists(_PULL_REQUEST_TEMPLATE_MD), "Pull request template should exist"
 
     # When we check the file size
-    file_size = pr_template_path.stat().st_size
+    document = _load_document(_PULL_REQUEST_TEMPLATE_MD)
+    file_size = document.size
 
     # Then it should have substantial content
     # A comprehensive PR template should be at least 2KB
     assert file_size >= 2000, f"PR template should have substantial content (at least 2KB), got {file_size} bytes"
 
     # And it should have multiple lines
-    content = pr_template_path.read_text(encoding="utf-8")
-    line_count = len(content.splitlines())
+    line_count = document.line_count
     assert line_count >= 50, f"PR template should have substantial content (at least 50 lines), got {line_count} lines"
 
 
-@given(
-    heading_level=st.sampled_from(["#", "##", "###"]),
-)
-def test_pr_template_has_proper_markdown_structure(heading_level: str) -> None:
+def test_pr_template_has_proper_markdown_structure() -> None:
     """Feature: open-source-standards, Property 7: Pull request template contains required sections.
 
     Validates: Requirements 5.2, 5.3, 5.4, 5.5
 
-    For any markdown heading level, the PR template should use proper
-    markdown structure to organize content into sections.
+    The PR template should use proper markdown structure to organize content
+    into sections.
     """
     # Given the PR template exists
-    pr_template_path = Path(".github/pull_request_template.md")
-    assert pr_template_path.exists(), "Pull request template should exist"
+    assert _path_exists(_PULL_REQUEST_TEMPLATE_MD), "Pull request template should exist"
 
     # When we read the file content
-    content = pr_template_path.read_text(encoding="utf-8")
+    document = _load_document(_PULL_REQUEST_TEMPLATE_MD)
 
     # Then it should contain markdown headings
-    assert "#" in content, "PR template should use markdown headings"
+    assert document.has_heading, "PR template should use markdown headings"
 
     # The file should be well-structured with multiple sections
-    heading_count = content.count("\n#")
+    heading_count = document.heading_count
     assert heading_count >= 5, "PR template should have multiple sections (at least 5 headings)"
 
 
@@ -1456,24 +1496,20 @@ def test_pr_template_exists() -> None:
 
     The pull request template file should exist at the expected location.
     """
-    # Given the expected PR template path
-    pr_template_path = Path(".github/pull_request_template.md")
-
     # Then the template file should exist
-    assert pr_template_path.exists(), "Pull request template should exist at .github/pull_request_template.md"
+    assert _path_exists(_PULL_REQUEST_TEMPLATE_MD), "Pull request template should exist at .github/pull_request_template.md"
 
     # And it should not be empty
-    assert pr_template_path.stat().st_size > 0, "Pull request template should not be empty"
+    assert _path_size(_PULL_REQUEST_TEMPLATE_MD) > 0, "Pull request template should not be empty"
 
 
-@given(
-    prompt_type=st.sampled_from(
-        [
-            "what does this pr do",
-            "why is this change needed",
-            "describe",
-        ]
-    )
+@pytest.mark.parametrize(
+    "prompt_type",
+    [
+        "what does this pr do",
+        "why is this change needed",
+        "describe",
+    ],
 )
 def test_pr_template_includes_description_prompts(prompt_type: str) -> None:
     """Feature: open-source-standards, Property 7: Pull request template contains required sections.
@@ -1484,35 +1520,25 @@ def test_pr_template_includes_description_prompts(prompt_type: str) -> None:
     to guide contributors in providing comprehensive descriptions.
     """
     # Given the PR template exists
-    pr_template_path = Path(".github/pull_request_template.md")
-    assert pr_template_path.exists(), "Pull request template should exist"
-
-    # When we read the file content
-    content = pr_template_path.read_text(encoding="utf-8").lower()
+    assert _path_exists(_PULL_REQUEST_TEMPLATE_MD), "Pull request template should exist"
 
     # Then it should include description prompts
-    prompt_keywords = {
-        "what does this pr do": ["what does this pr do", "what", "do"],
-        "why is this change needed": ["why", "needed", "motivation"],
-        "describe": ["describe", "description", "explain"],
-    }
-
-    keywords = prompt_keywords.get(prompt_type, [prompt_type])
+    keywords = _PULL_REQUEST_PROMPT_KEYWORDS[prompt_type]
+    matched = _matched_keywords(_PULL_REQUEST_TEMPLATE_MD)
     assert any(
-        keyword in content for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"PR template should include description prompt for '{prompt_type}'"
 
 
 
-@given(
-    badge_type=st.sampled_from(
-        [
-            "ci",
-            "coverage",
-            "release",
-            "license",
-        ]
-    )
+@pytest.mark.parametrize(
+    "badge_type",
+    [
+        "ci",
+        "coverage",
+        "release",
+        "license",
+    ],
 )
 def test_readme_contains_required_badges(badge_type: str) -> None:
     """Feature: open-source-standards, Property 9: README contains required badges.
@@ -1522,40 +1548,30 @@ def test_readme_contains_required_badges(badge_type: str) -> None:
     For any required badge type (CI/CD status, coverage, release, license),
     the README should contain badge markdown or HTML for that badge type.
     """
-    # Given the README.md file exists
-    readme_path = Path("README.md")
-    assert readme_path.exists(), "README.md file must exist"
-
-    # When we read the file content
-    content = readme_path.read_text(encoding="utf-8")
+    # When we scan the badge markup
+    markup = _badge_markup(_README_MD)
 
     # Then it should contain badge markdown (shields.io or GitHub badges)
-    assert "![" in content or "<img" in content, "README should contain badge markdown or HTML"
+    assert (
+        markup.has_markdown_image or markup.has_html_image
+    ), "README should contain badge markdown or HTML"
 
     # And it should contain the specific badge type
-    content_lower = content.lower()
-    badge_keywords = {
-        "ci": ["cross-platform tests", "workflow", "actions", "ci", "build"],
-        "coverage": ["codecov", "coverage", "cov"],
-        "release": ["release", "version", "v/release"],
-        "license": ["license", "mit"],
-    }
-
-    keywords = badge_keywords.get(badge_type, [badge_type])
+    keywords = _README_BADGE_KEYWORDS[badge_type]
+    matched = _matched_keywords(_README_MD)
     assert any(
-        keyword in content_lower for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"README should contain badge for {badge_type}"
 
 
-@given(
-    badge_url_component=st.sampled_from(
-        [
-            "github.com",
-            "codecov.io",
-            "shields.io",
-            "img.shields.io",
-        ]
-    )
+@pytest.mark.parametrize(
+    "badge_url_component",
+    [
+        "github.com",
+        "codecov.io",
+        "shields.io",
+        "img.shields.io",
+    ],
 )
 def test_readme_badges_use_standard_services(badge_url_component: str) -> None:
     """Feature: open-source-standards, Property 9: README contains required badges.
@@ -1565,12 +1581,8 @@ def test_readme_badges_use_standard_services(badge_url_component: str) -> None:
     For any standard badge service (GitHub, Codecov, shields.io),
     the README should use that service for displaying badges.
     """
-    # Given the README.md file exists
-    readme_path = Path("README.md")
-    assert readme_path.exists(), "README.md file must exist"
-
     # When we read the file content
-    content = readme_path.read_text(encoding="utf-8")
+    content = _read_text(_README_MD)
 
     # Then it should contain URLs from standard badge services
     assert (
@@ -1578,13 +1590,12 @@ def test_readme_badges_use_standard_services(badge_url_component: str) -> None:
     ), f"README should use {badge_url_component} for badges"
 
 
-@given(
-    badge_format=st.sampled_from(
-        [
-            "markdown",
-            "clickable",
-        ]
-    )
+@pytest.mark.parametrize(
+    "badge_format",
+    [
+        "markdown",
+        "clickable",
+    ],
 )
 def test_readme_badges_have_proper_format(badge_format: str) -> None:
     """Feature: open-source-standards, Property 9: README contains required badges.
@@ -1594,30 +1605,27 @@ def test_readme_badges_have_proper_format(badge_format: str) -> None:
     For any badge format requirement (markdown syntax, clickable links),
     the README badges should follow that format.
     """
-    # Given the README.md file exists
-    readme_path = Path("README.md")
-    assert readme_path.exists(), "README.md file must exist"
-
-    # When we read the file content
-    content = readme_path.read_text(encoding="utf-8")
+    # When we scan the badge markup
+    markup = _badge_markup(_README_MD)
 
     # Then badges should follow proper format
     if badge_format == "markdown":
         # Badges should use markdown image syntax
-        assert "![" in content, "README should use markdown image syntax for badges"
+        assert markup.has_markdown_image, "README should use markdown image syntax for badges"
     elif badge_format == "clickable":
         # Badges should be wrapped in links
-        assert "[![" in content or "](" in content, "README badges should be clickable (wrapped in links)"
+        assert (
+            markup.has_linked_image or markup.has_link
+        ), "README badges should be clickable (wrapped in links)"
 
 
-@given(
-    badge_position=st.sampled_from(
-        [
-            "top",
-            "after title",
-            "before features",
-        ]
-    )
+@pytest.mark.parametrize(
+    "badge_position",
+    [
+        "top",
+        "after title",
+        "before features",
+    ],
 )
 def test_readme_badges_positioned_prominently(badge_position: str) -> None:
     """Feature: open-source-standards, Property 9: README contains required badges.
@@ -1627,28 +1635,24 @@ def test_readme_badges_positioned_prominently(badge_position: str) -> None:
     For any badge positioning requirement, the README should position badges
     prominently near the top of the document.
     """
-    # Given the README.md file exists
-    readme_path = Path("README.md")
-    assert readme_path.exists(), "README.md file must exist"
-
     # When we read the file content
-    content = readme_path.read_text(encoding="utf-8")
-    lines = content.splitlines()
+    lines = _read_lines(_README_MD)
 
     # Then badges should appear in the first 20 lines (prominently positioned)
-    badge_line_indices = [i for i, line in enumerate(lines) if "![" in line and "badge" in line.lower()]
+    first_badge_index = next(
+        (i for i, line in enumerate(lines) if "![" in line and "badge" in line.lower()), None
+    )
 
-    assert len(badge_line_indices) > 0, "README should contain badges"
-    assert min(badge_line_indices) < 20, "Badges should be positioned prominently (within first 20 lines)"
+    assert first_badge_index is not None, "README should contain badges"
+    assert first_badge_index < 20, "Badges should be positioned prominently (within first 20 lines)"
 
 
-@given(
-    workflow_name=st.sampled_from(
-        [
-            "Cross-Platform Tests",
-            "test",
-        ]
-    )
+@pytest.mark.parametrize(
+    "workflow_name",
+    [
+        "Cross-Platform Tests",
+        "test",
+    ],
 )
 def test_readme_ci_badge_references_actual_workflow(workflow_name: str) -> None:
     """Feature: open-source-standards, Property 9: README contains required badges.
@@ -1658,12 +1662,8 @@ def test_readme_ci_badge_references_actual_workflow(workflow_name: str) -> None:
     For any CI workflow name, the README CI badge should reference an actual
     GitHub Actions workflow that exists in the repository.
     """
-    # Given the README.md file exists
-    readme_path = Path("README.md")
-    assert readme_path.exists(), "README.md file must exist"
-
     # When we read the file content
-    content = readme_path.read_text(encoding="utf-8")
+    content = _read_text(_README_MD)
 
     # Then it should reference the workflow
     # The badge should contain either the workflow name or the workflow file
@@ -1679,23 +1679,16 @@ def test_readme_ci_badge_references_actual_workflow(workflow_name: str) -> None:
     ), f"README CI badge should reference workflow '{workflow_name}' or workflow file"
 
 
-@given(
-    badge_count_threshold=st.integers(min_value=3, max_value=10),
-)
-def test_readme_has_multiple_badges(badge_count_threshold: int) -> None:
+def test_readme_has_multiple_badges() -> None:
     """Feature: open-source-standards, Property 9: README contains required badges.
 
     Validates: Requirements 6.5, 8.2, 8.3, 8.4, 8.5
 
-    For any reasonable badge count threshold, the README should contain
+    The README should contain
     multiple badges to display project health and status.
     """
-    # Given the README.md file exists
-    readme_path = Path("README.md")
-    assert readme_path.exists(), "README.md file must exist"
-
     # When we read the file content
-    content = readme_path.read_text(encoding="utf-8")
+    content = _read_text(_README_MD)
 
     # Then it should contain multiple badges
     # Count badge markdown patterns
@@ -1705,15 +1698,14 @@ def test_readme_has_multiple_badges(badge_count_threshold: int) -> None:
     assert badge_count >= 4, f"README should have at least 4 badges, found {badge_count}"
 
 
-@given(
-    link_target=st.sampled_from(
-        [
-            "actions",
-            "codecov",
-            "releases",
-            "license",
-        ]
-    )
+@pytest.mark.parametrize(
+    "link_target",
+    [
+        "actions",
+        "codecov",
+        "releases",
+        "license",
+    ],
 )
 def test_readme_badges_link_to_relevant_pages(link_target: str) -> None:
     """Feature: open-source-standards, Property 9: README contains required badges.
@@ -1723,36 +1715,24 @@ def test_readme_badges_link_to_relevant_pages(link_target: str) -> None:
     For any badge link target (actions, codecov, releases, license),
     the README badges should link to relevant pages that provide more information.
     """
-    # Given the README.md file exists
-    readme_path = Path("README.md")
-    assert readme_path.exists(), "README.md file must exist"
-
     # When we read the file content
-    content = readme_path.read_text(encoding="utf-8")
+    content = _read_text(_README_MD)
 
     # Then badges should link to relevant pages
-    link_keywords = {
-        "actions": ["actions/workflows", "github.com"],
-        "codecov": ["codecov.io"],
-        "releases": ["releases", "github.com"],
-        "license": ["LICENSE", "license"],
-    }
-
-    keywords = link_keywords.get(link_target, [link_target])
+    keywords = _README_BADGE_LINK_KEYWORDS[link_target]
     assert any(
         keyword in content for keyword in keywords
     ), f"README badges should link to {link_target} page"
 
 
-@given(
-    screenshot_type=st.sampled_from(
-        [
-            "gui",
-            "signature",
-            "settings",
-            "profile",
-        ]
-    )
+@pytest.mark.parametrize(
+    "screenshot_type",
+    [
+        "gui",
+        "signature",
+        "settings",
+        "profile",
+    ],
 )
 def test_readme_contains_screenshots(screenshot_type: str) -> None:
     """Feature: open-source-standards, Property 11: README contains screenshots.
@@ -1762,41 +1742,29 @@ def test_readme_contains_screenshots(screenshot_type: str) -> None:
     For any visual component (GUI interface, generated output, settings, profile management),
     the README should reference screenshot images that exist in the repository.
     """
-    # Given the README.md file exists
-    readme_path = Path("README.md")
-    assert readme_path.exists(), "README.md file must exist"
-
     # When we read the file content
-    content = readme_path.read_text(encoding="utf-8")
+    content = _read_text(_README_MD)
 
     # Then it should contain image references (markdown or HTML)
     assert "![" in content or "<img" in content, "README should contain image references"
 
     # And it should reference screenshots for the visual component
-    content_lower = content.lower()
-    screenshot_keywords = {
-        "gui": ["gui", "interface", "main window", "application"],
-        "signature": ["signature", "output", "example", "generated"],
-        "settings": ["settings", "configuration", "preferences"],
-        "profile": ["profile", "management", "user"],
-    }
-
-    keywords = screenshot_keywords.get(screenshot_type, [screenshot_type])
+    keywords = _README_SCREENSHOT_KEYWORDS[screenshot_type]
     # Check if any keyword appears near an image reference
+    matched = _matched_keywords(_README_MD)
     assert any(
-        keyword in content_lower for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"README should reference screenshots for {screenshot_type}"
 
 
-@given(
-    image_path_component=st.sampled_from(
-        [
-            "docs/images",
-            ".png",
-            ".jpg",
-            "screenshot",
-        ]
-    )
+@pytest.mark.parametrize(
+    "image_path_component",
+    [
+        "docs/images",
+        ".png",
+        ".jpg",
+        "screenshot",
+    ],
 )
 def test_readme_screenshot_paths_are_valid(image_path_component: str) -> None:
     """Feature: open-source-standards, Property 11: README contains screenshots.
@@ -1806,12 +1774,8 @@ def test_readme_screenshot_paths_are_valid(image_path_component: str) -> None:
     For any screenshot path component (directory, file extension),
     the README should use valid relative paths to images.
     """
-    # Given the README.md file exists
-    readme_path = Path("README.md")
-    assert readme_path.exists(), "README.md file must exist"
-
     # When we read the file content
-    content = readme_path.read_text(encoding="utf-8")
+    content = _read_text(_README_MD)
 
     # Then if it contains image references, they should use valid paths
     if "![" in content or "<img" in content:
@@ -1830,15 +1794,14 @@ def test_readme_screenshot_paths_are_valid(image_path_component: str) -> None:
         ), f"README image paths should include {image_path_component}"
 
 
-@given(
-    alt_text_requirement=st.sampled_from(
-        [
-            "gui",
-            "signature",
-            "settings",
-            "screenshot",
-        ]
-    )
+@pytest.mark.parametrize(
+    "alt_text_requirement",
+    [
+        "gui",
+        "signature",
+        "settings",
+        "screenshot",
+    ],
 )
 def test_readme_screenshots_have_alt_text(alt_text_requirement: str) -> None:
     """Feature: open-source-standards, Property 11: README contains screenshots.
@@ -1848,12 +1811,8 @@ def test_readme_screenshots_have_alt_text(alt_text_requirement: str) -> None:
     For any screenshot in the README, the image should have descriptive alt text
     for accessibility.
     """
-    # Given the README.md file exists
-    readme_path = Path("README.md")
-    assert readme_path.exists(), "README.md file must exist"
-
     # When we read the file content
-    content = readme_path.read_text(encoding="utf-8")
+    content = _read_text(_README_MD)
 
     # Then if it contains markdown images, they should have alt text
     # Markdown format: ![alt text](path)
@@ -1868,15 +1827,14 @@ def test_readme_screenshots_have_alt_text(alt_text_requirement: str) -> None:
         assert len(images_with_alt) > 0, "README images should have descriptive alt text"
 
 
-@given(
-    screenshot_section=st.sampled_from(
-        [
-            "screenshots",
-            "features",
-            "gui",
-            "usage",
-        ]
-    )
+@pytest.mark.parametrize(
+    "screenshot_section",
+    [
+        "screenshots",
+        "features",
+        "gui",
+        "usage",
+    ],
 )
 def test_readme_screenshots_in_appropriate_section(screenshot_section: str) -> None:
     """Feature: open-source-standards, Property 11: README contains screenshots.
@@ -1886,46 +1844,25 @@ def test_readme_screenshots_in_appropriate_section(screenshot_section: str) -> N
     For any appropriate section (Screenshots, Features, GUI, Usage),
     the README should include screenshots in or near that section.
     """
-    # Given the README.md file exists
-    readme_path = Path("README.md")
-    assert readme_path.exists(), "README.md file must exist"
-
-    # When we read the file content
-    content = readme_path.read_text(encoding="utf-8")
-    content_lower = content.lower()
-
     # Then it should have sections where screenshots would be appropriate
-    section_keywords = {
-        "screenshots": ["screenshots", "## screenshots", "### screenshots"],
-        "features": ["features", "## features", "### features"],
-        "gui": ["gui", "interface", "graphical"],
-        "usage": ["usage", "## usage", "### usage"],
-    }
-
-    keywords = section_keywords.get(screenshot_section, [screenshot_section])
+    keywords = _README_SCREENSHOT_SECTION_KEYWORDS[screenshot_section]
     # At least one appropriate section should exist
+    matched = _matched_keywords(_README_MD)
     assert any(
-        keyword in content_lower for keyword in keywords
+        keyword in matched for keyword in keywords
     ), f"README should have a section for {screenshot_section}"
 
 
-@given(
-    image_count_threshold=st.integers(min_value=1, max_value=10),
-)
-def test_readme_has_multiple_screenshots(image_count_threshold: int) -> None:
+def test_readme_has_multiple_screenshots() -> None:
     """Feature: open-source-standards, Property 11: README contains screenshots.
 
     Validates: Requirements 11.1
 
-    For any reasonable image count threshold, the README should contain
+    The README should contain
     multiple screenshots to demonstrate different aspects of the application.
     """
-    # Given the README.md file exists
-    readme_path = Path("README.md")
-    assert readme_path.exists(), "README.md file must exist"
-
     # When we read the file content
-    content = readme_path.read_text(encoding="utf-8")
+    content = _read_text(_README_MD)
 
     # Then it should contain multiple image references
     import re
@@ -1982,14 +1919,13 @@ def test_readme_screenshot_files_exist() -> None:
         ), f"At least 50% of referenced screenshot files should exist, found {len(existing_images)}/{len(local_image_paths)}"
 
 
-@given(
-    governance_aspect=st.sampled_from(
-        [
-            "maintainers",
-            "decision-making",
-            "becoming a maintainer",
-        ]
-    )
+@pytest.mark.parametrize(
+    "governance_aspect",
+    [
+        "maintainers",
+        "decision-making",
+        "becoming a maintainer",
+    ],
 )
 def test_project_governance_is_documented(governance_aspect: str) -> None:
     """Feature: open-source-standards, Property 17: Project governance is documented.
@@ -1999,12 +1935,8 @@ def test_project_governance_is_documented(governance_aspect: str) -> None:
     For any governance aspect (maintainer identification, decision process,
     maintainer onboarding), the documentation should address that aspect.
     """
-    # Given the CONTRIBUTING.md file exists
-    contributing_path = Path("CONTRIBUTING.md")
-    assert contributing_path.exists(), "CONTRIBUTING.md file must exist"
-
     # When we read the file content
-    content = contributing_path.read_text(encoding="utf-8").lower()
+    content = _load_document(_CONTRIBUTING_MD).lower
 
     # Then it should contain governance information
     governance_keywords = {
@@ -2019,14 +1951,13 @@ def test_project_governance_is_documented(governance_aspect: str) -> None:
     ), f"CONTRIBUTING.md should document {governance_aspect}"
 
 
-@given(
-    governance_section=st.sampled_from(
-        [
-            "project governance",
-            "maintainers",
-            "decision-making process",
-        ]
-    )
+@pytest.mark.parametrize(
+    "governance_section",
+    [
+        "project governance",
+        "maintainers",
+        "decision-making process",
+    ],
 )
 def test_contributing_has_governance_section(governance_section: str) -> None:
     """Feature: open-source-standards, Property 17: Project governance is documented.
@@ -2036,12 +1967,8 @@ def test_contributing_has_governance_section(governance_section: str) -> None:
     For any governance section, the CONTRIBUTING.md file should have a dedicated
     section addressing that governance topic.
     """
-    # Given the CONTRIBUTING.md file exists
-    contributing_path = Path("CONTRIBUTING.md")
-    assert contributing_path.exists(), "CONTRIBUTING.md file must exist"
-
     # When we read the file content
-    content = contributing_path.read_text(encoding="utf-8").lower()
+    content = _load_document(_CONTRIBUTING_MD).lower
 
     # Then it should have a governance section
     section_keywords = {
@@ -2056,14 +1983,13 @@ def test_contributing_has_governance_section(governance_section: str) -> None:
     ), f"CONTRIBUTING.md should have a section about {governance_section}"
 
 
-@given(
-    maintainer_info=st.sampled_from(
-        [
-            "name",
-            "role",
-            "ultrasardine",
-        ]
-    )
+@pytest.mark.parametrize(
+    "maintainer_info",
+    [
+        "name",
+        "role",
+        "ultrasardine",
+    ],
 )
 def test_contributing_identifies_maintainers(maintainer_info: str) -> None:
     """Feature: open-source-standards, Property 17: Project governance is documented.
@@ -2073,12 +1999,8 @@ def test_contributing_identifies_maintainers(maintainer_info: str) -> None:
     For any maintainer information (name, role), the CONTRIBUTING.md file
     should identify the project maintainers.
     """
-    # Given the CONTRIBUTING.md file exists
-    contributing_path = Path("CONTRIBUTING.md")
-    assert contributing_path.exists(), "CONTRIBUTING.md file must exist"
-
     # When we read the file content
-    content = contributing_path.read_text(encoding="utf-8").lower()
+    content = _load_document(_CONTRIBUTING_MD).lower
 
     # Then it should identify maintainers
     maintainer_keywords = {
@@ -2093,14 +2015,13 @@ def test_contributing_identifies_maintainers(maintainer_info: str) -> None:
     ), f"CONTRIBUTING.md should identify maintainers with {maintainer_info}"
 
 
-@given(
-    decision_aspect=st.sampled_from(
-        [
-            "pull request approval",
-            "maintainer approval",
-            "consensus",
-        ]
-    )
+@pytest.mark.parametrize(
+    "decision_aspect",
+    [
+        "pull request approval",
+        "maintainer approval",
+        "consensus",
+    ],
 )
 def test_contributing_explains_decision_making(decision_aspect: str) -> None:
     """Feature: open-source-standards, Property 17: Project governance is documented.
@@ -2110,12 +2031,8 @@ def test_contributing_explains_decision_making(decision_aspect: str) -> None:
     For any decision-making aspect (PR approval, maintainer approval, consensus),
     the CONTRIBUTING.md file should explain how decisions are made.
     """
-    # Given the CONTRIBUTING.md file exists
-    contributing_path = Path("CONTRIBUTING.md")
-    assert contributing_path.exists(), "CONTRIBUTING.md file must exist"
-
     # When we read the file content
-    content = contributing_path.read_text(encoding="utf-8").lower()
+    content = _load_document(_CONTRIBUTING_MD).lower
 
     # Then it should explain decision-making
     decision_keywords = {
@@ -2130,14 +2047,13 @@ def test_contributing_explains_decision_making(decision_aspect: str) -> None:
     ), f"CONTRIBUTING.md should explain {decision_aspect} in decision-making"
 
 
-@given(
-    onboarding_aspect=st.sampled_from(
-        [
-            "contributions",
-            "community trust",
-            "commitment",
-        ]
-    )
+@pytest.mark.parametrize(
+    "onboarding_aspect",
+    [
+        "contributions",
+        "community trust",
+        "commitment",
+    ],
 )
 def test_contributing_explains_maintainer_onboarding(onboarding_aspect: str) -> None:
     """Feature: open-source-standards, Property 17: Project governance is documented.
@@ -2147,12 +2063,8 @@ def test_contributing_explains_maintainer_onboarding(onboarding_aspect: str) ->
     For any maintainer onboarding aspect (consistent contributions, community trust,
     commitment), the CONTRIBUTING.md file should explain how to become a maintainer.
     """
-    # Given the CONTRIBUTING.md file exists
-    contributing_path = Path("CONTRIBUTING.md")
-    assert contributing_path.exists(), "CONTRIBUTING.md file must exist"
-
     # When we read the file content
-    content = contributing_path.read_text(encoding="utf-8").lower()
+    content = _load_document(_CONTRIBUTING_MD).lower
 
     # Then it should explain how to become a maintainer
     onboarding_keywords = {
@@ -2168,13 +2080,12 @@ def test_contributing_explains_maintainer_onboarding(onboarding_aspect: str) ->
 
 
 
-@given(
-    acknowledgment_location=st.sampled_from(
-        [
-            "readme",
-            "contributing",
-        ]
-    )
+@pytest.mark.parametrize(
+    "acknowledgment_location",
+    [
+        "readme",
+        "contributing",
+    ],
 )
 def test_contributors_are_acknowledged(acknowledgment_location: str) -> None:
     """Feature: open-source-standards, Property 18: Contributors are acknowledged.
@@ -2186,15 +2097,13 @@ def test_contributors_are_acknowledged(acknowledgment_location: str) -> None:
     """
     # Given the documentation files exist
     readme_path = Path("README.md")
-    contributing_path = Path("CONTRIBUTING.md")
 
     # When we check the appropriate file
     if acknowledgment_location == "readme":
         assert readme_path.exists(), "README.md file must exist"
         content = readme_path.read_text(encoding="utf-8").lower()
     else:
-        assert contributing_path.exists(), "CONTRIBUTING.md file must exist"
-        content = contributing_path.read_text(encoding="utf-8").lower()
+        content = _load_document(_CONTRIBUTING_MD).lower
 
     # Then it should acknowledge contributors
     acknowledgment_keywords = [
@@ -2211,14 +2120,13 @@ def test_contributors_are_acknowledged(acknowledgment_location: str) -> None:
     ), f"{acknowledgment_location.upper()} should acknowledge contributors"
 
 
-@given(
-    acknowledgment_type=st.sampled_from(
-        [
-            "all contributors",
-            "github contributors",
-            "contributor graph",
-        ]
-    )
+@pytest.mark.parametrize(
+    "acknowledgment_type",
+    [
+        "all contributors",
+        "github contributors",
+        "contributor graph",
+    ],
 )
 def test_readme_acknowledges_contributors(acknowledgment_type: str) -> None:
     """Feature: open-source-standards, Property 18: Contributors are acknowledged.
@@ -2248,14 +2156,13 @@ def test_readme_acknowledges_contributors(acknowledgment_type: str) -> None:
     ), f"README should acknowledge contributors via {acknowledgment_type}"
 
 
-@given(
-    recognition_aspect=st.sampled_from(
-        [
-            "valued",
-            "appreciated",
-            "recognized",
-        ]
-    )
+@pytest.mark.parametrize(
+    "recognition_aspect",
+    [
+        "valued",
+        "appreciated",
+        "recognized",
+    ],
 )
 def test_contributing_expresses_contributor_appreciation(recognition_aspect: str) -> None:
     """Feature: open-source-standards, Property 18: Contributors are acknowledged.
@@ -2265,12 +2172,8 @@ def test_contributing_expresses_contributor_appreciation(recognition_aspect: str
     For any recognition aspect (valued, appreciated, recognized), the CONTRIBUTING.md
     file should express appreciation for contributors.
     """
-    # Given the CONTRIBUTING.md file exists
-    contributing_path = Path("CONTRIBUTING.md")
-    assert contributing_path.exists(), "CONTRIBUTING.md file must exist"
-
     # When we read the file content
-    content = contributing_path.read_text(encoding="utf-8").lower()
+    content = _load_document(_CONTRIBUTING_MD).lower
 
     # Then it should express appreciation
     appreciation_keywords = {
@@ -2285,14 +2188,13 @@ def test_contributing_expresses_contributor_appreciation(recognition_aspect: str
     ), f"CONTRIBUTING.md should express that contributors are {recognition_aspect}"
 
 
-@given(
-    contributor_visibility=st.sampled_from(
-        [
-            "github graph",
-            "release notes",
-            "readme",
-        ]
-    )
+@pytest.mark.parametrize(
+    "contributor_visibility",
+    [
+        "github graph",
+        "release notes",
+        "readme",
+    ],
 )
 def test_contributors_have_visibility(contributor_visibility: str) -> None:
     """Feature: open-source-standards, Property 18: Contributors are acknowledged.
@@ -2302,12 +2204,8 @@ def test_contributors_have_visibility(contributor_visibility: str) -> None:
     For any visibility mechanism (GitHub graph, release notes, README),
     the documentation should mention how contributors gain visibility.
     """
-    # Given the CONTRIBUTING.md file exists
-    contributing_path = Path("CONTRIBUTING.md")
-    assert contributing_path.exists(), "CONTRIBUTING.md file must exist"
-
     # When we read the file content
-    content = contributing_path.read_text(encoding="utf-8").lower()
+    content = _load_document(_CONTRIBUTING_MD).lower
 
     # Then it should mention contributor visibility
     visibility_keywords = {
@@ -2322,14 +2220,13 @@ def test_contributors_have_visibility(contributor_visibility: str) -> None:
     ), f"CONTRIBUTING.md should mention contributor visibility via {contributor_visibility}"
 
 
-@given(
-    contribution_size=st.sampled_from(
-        [
-            "small",
-            "large",
-            "any",
-        ]
-    )
+@pytest.mark.parametrize(
+    "contribution_size",
+    [
+        "small",
+        "large",
+        "any",
+    ],
 )
 def test_all_contribution_sizes_are_valued(contribution_size: str) -> None:
     """Feature: open-source-standards, Property 18: Contributors are acknowledged.
@@ -2339,12 +2236,8 @@ def test_all_contribution_sizes_are_valued(contribution_size: str) -> None:
     For any contribution size (small, large, any), the documentation should
     express that all contributions are valued.
     """
-    # Given the CONTRIBUTING.md file exists
-    contributing_path = Path("CONTRIBUTING.md")
-    assert contributing_path.exists(), "CONTRIBUTING.md file must exist"
-
     # When we read the file content
-    content = contributing_path.read_text(encoding="utf-8").lower()
+    content = _load_document(_CONTRIBUTING_MD).lower
 
     # Then it should value all contributions
     value_keywords = {
@@ -2359,14 +2252,13 @@ def test_all_contribution_sizes_are_valued(contribution_size: str) -> None:
     ), f"CONTRIBUTING.md should express that {contribution_size} contributions are valued"
 
 
-@given(
-    required_file=st.sampled_from(
-        [
-            "CONTRIBUTING.md",
-            "CODE_OF_CONDUCT.md",
-            "SECURITY.md",
-        ]
-    )
+@pytest.mark.parametrize(
+    "required_file",
+    [
+        "CONTRIBUTING.md",
+        "CODE_OF_CONDUCT.md",
+        "SECURITY.md",
+    ],
 )
 def test_required_community_health_files_exist(required_file: str) -> None:
     """Feature: open-source-standards, Property 1: Required community health files exist.
@@ -2390,15 +2282,14 @@ def test_required_community_health_files_exist(required_file: str) -> None:
     assert len(content) > 0, f"Required community health file {required_file} should have content"
 
 
-@given(
-    template_path=st.sampled_from(
-        [
-            ".github/ISSUE_TEMPLATE/bug_report.yml",
-            ".github/ISSUE_TEMPLATE/feature_request.yml",
-            ".github/ISSUE_TEMPLATE/config.yml",
-            ".github/pull_request_template.md",
-        ]
-    )
+@pytest.mark.parametrize(
+    "template_path",
+    [
+        ".github/ISSUE_TEMPLATE/bug_report.yml",
+        ".github/ISSUE_TEMPLATE/feature_request.yml",
+        ".github/ISSUE_TEMPLATE/config.yml",
+        ".github/pull_request_template.md",
+    ],
 )
 def test_github_templates_exist(template_path: str) -> None:
     """Feature: open-source-standards, Property 2: GitHub templates exist.
@@ -2422,14 +2313,13 @@ def test_github_templates_exist(template_path: str) -> None:
     assert len(content) > 0, f"Required GitHub template {template_path} should have content"
 
 
-@given(
-    platform=st.sampled_from(
-        [
-            "windows",
-            "macos",
-            "linux",
-        ]
-    )
+@pytest.mark.parametrize(
+    "platform",
+    [
+        "windows",
+        "macos",
+        "linux",
+    ],
 )
 def test_readme_contains_platform_specific_installation_instructions(platform: str) -> None:
     """Feature: open-source-standards, Property 8: README contains platform-specific installation instructions.
@@ -2462,15 +2352,14 @@ def test_readme_contains_platform_specific_installation_instructions(platform: s
     assert "install" in content, "README should have an installation section"
 
 
-@given(
-    usage_type=st.sampled_from(
-        [
-            "cli",
-            "gui",
-            "docker",
-            "command",
-        ]
-    )
+@pytest.mark.parametrize(
+    "usage_type",
+    [
+        "cli",
+        "gui",
+        "docker",
+        "command",
+    ],
 )
 def test_readme_contains_usage_examples(usage_type: str) -> None:
     """Feature: open-source-standards, Property 10: README contains usage examples.
@@ -2507,14 +2396,13 @@ def test_readme_contains_usage_examples(usage_type: str) -> None:
     ), f"README should include usage examples for {usage_type}"
 
 
-@given(
-    license_location=st.sampled_from(
-        [
-            "LICENSE",
-            "README.md",
-            "pyproject.toml",
-        ]
-    )
+@pytest.mark.parametrize(
+    "license_location",
+    [
+        "LICENSE",
+        "README.md",
+        "pyproject.toml",
+    ],
 )
 def test_license_information_is_consistent(license_location: str) -> None:
     """Feature: open-source-standards, Property 12: License information is consistent.
@@ -2551,15 +2439,14 @@ def test_license_information_is_consistent(license_location: str) -> None:
         assert "license" in content_lower, "pyproject.toml should have license metadata"
 
 
-@given(
-    platform=st.sampled_from(
-        [
-            "windows",
-            "macos",
-            "ubuntu",
-            "linux",
-        ]
-    )
+@pytest.mark.parametrize(
+    "platform",
+    [
+        "windows",
+        "macos",
+        "ubuntu",
+        "linux",
+    ],
 )
 def test_ci_workflow_tests_all_platforms(platform: str) -> None:
     """Feature: open-source-standards, Property 13: CI workflow tests all platforms.
@@ -2593,15 +2480,14 @@ def test_ci_workflow_tests_all_platforms(platform: str) -> None:
     assert "matrix" in content or "strategy" in content, "CI workflow should use matrix strategy"
 
 
-@given(
-    quality_check=st.sampled_from(
-        [
-            "tests",
-            "coverage",
-            "linting",
-            "type checking",
-        ]
-    )
+@pytest.mark.parametrize(
+    "quality_check",
+    [
+        "tests",
+        "coverage",
+        "linting",
+        "type checking",
+    ],
 )
 def test_ci_workflow_includes_quality_checks(quality_check: str) -> None:
     """Feature: open-source-standards, Property 14: CI workflow includes quality checks.
@@ -2635,14 +2521,13 @@ def test_ci_workflow_includes_quality_checks(quality_check: str) -> None:
     assert "steps:" in content or "run:" in content, "CI workflow should have steps defined"
 
 
-@given(
-    platform=st.sampled_from(
-        [
-            "windows",
-            "macos",
-            "linux",
-        ]
-    )
+@pytest.mark.parametrize(
+    "platform",
+    [
+        "windows",
+        "macos",
+        "linux",
+    ],
 )
 def test_release_scripts_support_all_platforms(platform: str) -> None:
     """Feature: open-source-standards, Property 15: Release scripts support all platforms.
@@ -2675,15 +2560,14 @@ def test_release_scripts_support_all_platforms(platform: str) -> None:
     assert "build" in content or "release" in content, "Release documentation should mention building or releases"
 
 
-@given(
-    release_step=st.sampled_from(
-        [
-            "changelog",
-            "binary",
-            "github release",
-            "git tag",
-        ]
-    )
+@pytest.mark.parametrize(
+    "release_step",
+    [
+        "changelog",
+        "binary",
+        "github release",
+        "git tag",
+    ],
 )
 def test_release_process_includes_required_steps(release_step: str) -> None:
     """Feature: open-source-standards, Property 16: Release process includes required steps.
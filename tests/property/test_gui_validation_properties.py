@@ -22,6 +22,12 @@ class ValidationTestHelper(ValidationMixin):
         self.root = root
 
 
+def _error_label(helper: ValidationMixin, widget: tk.Widget):
+    """Get the validation error label shown for a widget, if any."""
+    state = helper._fields.get(id(widget))
+    return state.label if state is not None and state.label_shown else None
+
+
 # Strategy for generating invalid email addresses
 invalid_emails = st.one_of(
     # Strings without @ symbol
@@ -87,13 +93,13 @@ def test_validation_triggers_on_input_change(value: str) -> None:
         if is_valid:
             test_helper.set_field_valid(entry)
             # Verify no error label exists
-            assert entry not in test_helper._validation_labels
+            assert _error_label(test_helper, entry) is None
         else:
             test_helper.set_field_invalid(entry)
             test_helper.show_validation_error(entry, error_message)
             # Verify error label exists
-            assert entry in test_helper._validation_labels
-            assert test_helper._validation_labels[entry].cget("text") == error_message
+            assert _error_label(test_helper, entry) is not None
+            assert _error_label(test_helper, entry).cget("text") == error_message
         
         # Verify the widget's visual state changed
         # For invalid: should have light red background
@@ -151,8 +157,8 @@ def test_invalid_email_detection(email: str) -> None:
         test_helper.show_validation_error(email_entry, error_message)
         
         # Verify error indicator is displayed
-        assert email_entry in test_helper._validation_labels
-        error_label = test_helper._validation_labels[email_entry]
+        error_label = _error_label(test_helper, email_entry)
+        assert error_label is not None
         
         # Verify error label has red text (convert color object to string)
         foreground_color = str(error_label.cget("foreground"))
@@ -212,8 +218,8 @@ def test_invalid_phone_detection(phone: str) -> None:
         test_helper.show_validation_error(phone_entry, error_message)
         
         # Verify error indicator is displayed
-        assert phone_entry in test_helper._validation_labels
-        error_label = test_helper._validation_labels[phone_entry]
+        error_label = _error_label(test_helper, phone_entry)
+        assert error_label is not None
         
         # Verify error label has red text (convert color object to string)
         foreground_color = str(error_label.cget("foreground"))
@@ -543,6 +549,78 @@ def test_preview_auto_update_on_data_change(
             pass
 
 
+@pytest.mark.gui
+def test_preview_renders_edits_whose_idle_handler_has_not_run() -> None:
+    """Feature: gui-interface, Property 7: Preview auto-update.
+    
+    Validates: Requirements 3.4
+    
+    A preview requested right after an edit, before the idle-deferred field
+    handler runs, should render the edited value rather than stale data.
+    """
+    try:
+        root = tk.Tk()
+        root.withdraw()
+    except tk.TclError:
+        # Skip test if Tkinter is not properly configured
+        return
+    
+    try:
+        from PIL import Image
+        from src.email_signature.domain.config import SignatureConfig
+        from src.email_signature.application.use_cases import GenerateSignatureUseCase
+        from src.email_signature.interface.gui.signature_tab import SignatureTab
+        from src.email_signature.infrastructure.image_renderer import ImageRenderer
+        from src.email_signature.infrastructure.logo_loader import LogoLoader
+        from src.email_signature.infrastructure.file_service import FileSystemService
+        from unittest.mock import Mock, patch
+        
+        config = SignatureConfig()
+        use_case = GenerateSignatureUseCase(
+            ImageRenderer(config),
+            LogoLoader(config.logo_search_paths),
+            FileSystemService(),
+            config,
+        )
+        tab = SignatureTab(root, config, InputValidator(), use_case)
+        
+        for field_name, value in {
+            "name": "Jane Doe",
+            "position": "Engineer",
+            "address": "Anytown, USA",
+            "email": "jane@example.com",
+        }.items():
+            tab.field_vars[field_name].set(value)
+            tab._validate_field(field_name, value)
+        tab._update_generate_button_state()
+        
+        # Run the background render inline so its arguments can be inspected
+        inline_thread = lambda target, daemon: Mock(start=target)
+        with patch.object(
+            tab.preview_generator, "generate_preview", return_value=Image.new("RGB", (10, 10))
+        ) as generate_preview, patch(
+            "src.email_signature.interface.gui.signature_tab.threading.Thread",
+            side_effect=inline_thread,
+        ):
+            tab._generate_preview()
+            
+            # Edit a field and request a preview before idle handlers run
+            tab.field_vars["name"].set("John Smith")
+            assert "name" in tab._pending_field_changes
+            tab._generate_preview()
+        
+        assert generate_preview.call_count == 2
+        assert generate_preview.call_args[0][0].name == "John Smith"
+        
+        tab.cleanup()
+        
+    finally:
+        try:
+            root.destroy()
+        except:
+            pass
+
+
 # Strategy for generating invalid dimension values
 invalid_dimensions = st.one_of(
     # Negative numbers
@@ -698,3 +698,42 @@ def test_text_rendering_consistency(
     finally:
         # Clean up
         Path(tmp_path).unlink(missing_ok=True)
+
+
+@given(
+    name=st.text(
+        min_size=1, max_size=50, alphabet=st.characters(blacklist_categories=("Cs", "Cc"))
+    ).filter(lambda x: x.strip()),
+    position=st.text(
+        min_size=1, max_size=50, alphabet=st.characters(blacklist_categories=("Cs", "Cc"))
+    ).filter(lambda x: x.strip()),
+    email=st.emails(),
+)
+@settings(deadline=None, max_examples=50)
+def test_cached_text_metrics_consistency(name: str, position: str, email: str) -> None:
+    """Feature: email-signature-refactor, Property: Cached text metrics consistency.
+
+    For any signature data, rendering it again with a renderer whose text
+    measurements are already cached should produce an identical image.
+    """
+    from src.email_signature.domain.models import SignatureData
+
+    signature_data = SignatureData(
+        name=name,
+        position=position,
+        address="Anytown, USA",
+        phone="",
+        mobile="",
+        email=email,
+        website="www.example.com",
+    )
+    logo = Image.new("RGBA", (50, 50), (255, 0, 0, 255))
+
+    renderer = ImageRenderer(SignatureConfig())
+    first_image = renderer.create_signature_image(signature_data, logo)
+    second_image = renderer.create_signature_image(signature_data, logo)
+
+    # Measurements from the first render are reused by the second
+    assert renderer._text_width_cache
+    assert first_image.size == second_image.size
+    assert first_image.tobytes() == second_image.tobytes()
@@ -318,3 +318,16 @@ def test_image_dimensions_consistent_across_platforms() -> None:
     # Verify dimensions are reasonable
     assert signature_image_1.width > logo.width
     assert signature_image_1.height >= logo.height
+
+
+def test_renderers_share_loaded_fonts() -> None:
+    """Test that renderers with the same configuration reuse loaded fonts."""
+    config = SignatureConfig()
+    renderer_1 = ImageRenderer(config)
+    renderer_2 = ImageRenderer(config)
+
+    if not hasattr(renderer_1.fonts["regular"], "path"):
+        pytest.skip("No TrueType fonts available on this system")
+
+    assert renderer_1.fonts["regular"] is renderer_2.fonts["regular"]
+    assert renderer_1.fonts["bold"] is renderer_2.fonts["bold"]
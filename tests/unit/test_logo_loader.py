@@ -133,3 +133,25 @@ def test_corrupted_logo_raises_logo_load_error() -> None:
     finally:
         # Clean up
         Path(logo_path).unlink(missing_ok=True)
+
+
+def test_find_logo_with_explicit_search_paths() -> None:
+    """Test that find_logo searches explicit paths instead of configured ones."""
+    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp_file:
+        logo_path = tmp_file.name
+        test_image = Image.new("RGB", (100, 100), color="red")
+        test_image.save(logo_path, "PNG")
+
+    try:
+        loader = LogoLoader(["nonexistent_logo.png"])
+
+        # The configured paths find nothing, the explicit path is found
+        assert loader.find_logo() is None
+        result = loader.find_logo([logo_path])
+        assert result is not None
+        assert Path(result).resolve() == Path(logo_path).resolve()
+
+        # The configured search paths are left unchanged
+        assert loader.search_paths == ["nonexistent_logo.png"]
+    finally:
+        Path(logo_path).unlink(missing_ok=True)
@@ -0,0 +1,143 @@
+"""Unit tests for profile management caching."""
+
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from src.email_signature.domain.models import SignatureData
+from src.email_signature.interface.gui.profile_manager import (
+    CachedProfileManager,
+    ProfileManager,
+)
+
+
+@pytest.fixture
+def sample_signature_data():
+    """Create sample signature data for testing."""
+    return SignatureData(
+        name="John Doe",
+        position="Software Engineer",
+        address="Anytown, USA",
+        phone="900000008",
+        mobile="900000009",
+        email="john.doe@example.com",
+        website="www.example.com",
+    )
+
+
+def test_list_profiles_reads_directory_once(sample_signature_data):
+    """Test that repeated listings are served from memory."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = CachedProfileManager(profiles_dir=temp_dir)
+        manager.save_profile("alice", sample_signature_data)
+
+        with patch.object(
+            ProfileManager, "list_profiles", autospec=True, return_value=["alice"]
+        ) as list_profiles:
+            assert manager.list_profiles() == ["alice"]
+            assert manager.list_profiles() == ["alice"]
+
+        list_profiles.assert_called_once()
+
+
+def test_save_and_delete_invalidate_profile_list(sample_signature_data):
+    """Test that saving or deleting a profile refreshes the cached listing."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = CachedProfileManager(profiles_dir=temp_dir)
+        assert manager.list_profiles() == []
+
+        manager.save_profile("alice", sample_signature_data)
+        assert manager.list_profiles() == ["alice"]
+
+        manager.save_profile("bob", sample_signature_data)
+        assert manager.list_profiles() == ["alice", "bob"]
+
+        manager.delete_profile("alice")
+        assert manager.list_profiles() == ["bob"]
+
+
+def test_load_profile_reuses_unchanged_file(sample_signature_data):
+    """Test that an unchanged profile file is not parsed again."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = CachedProfileManager(profiles_dir=temp_dir)
+        manager.save_profile("alice", sample_signature_data)
+
+        first = manager.load_profile("alice")
+        with patch.object(ProfileManager, "load_profile", autospec=True) as load_profile:
+            second = manager.load_profile("alice")
+
+        load_profile.assert_not_called()
+        assert second is first
+        assert second == sample_signature_data
+
+
+def test_load_profile_rereads_modified_file(sample_signature_data):
+    """Test that a profile modified on disk is loaded again."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = CachedProfileManager(profiles_dir=temp_dir)
+        manager.save_profile("alice", sample_signature_data)
+        manager.load_profile("alice")
+
+        # Rewrite the file behind the cache's back with a newer mtime
+        other_manager = ProfileManager(profiles_dir=temp_dir)
+        updated = SignatureData(
+            name="Alice Doe",
+            position="Manager",
+            address="Anytown, USA",
+            phone="",
+            mobile="",
+            email="alice@example.com",
+        )
+        other_manager.save_profile("alice", updated)
+        profile_path = manager._profile_path("alice")
+        stat = profile_path.stat()
+        os.utime(profile_path, (stat.st_atime, stat.st_mtime + 10))
+
+        assert manager.load_profile("alice") == updated
+
+
+def test_load_missing_profile_raises(sample_signature_data):
+    """Test that loading a deleted profile raises FileNotFoundError."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = CachedProfileManager(profiles_dir=temp_dir)
+        manager.save_profile("alice", sample_signature_data)
+        manager.load_profile("alice")
+        manager.delete_profile("alice")
+
+        with pytest.raises(FileNotFoundError):
+            manager.load_profile("alice")
+
+
+def test_sanitize_name_rejects_names_without_valid_characters():
+    """Test that profile names are checked before anything is written."""
+    assert ProfileManager.sanitize_name(" my-profile_1 ") == "my-profile_1"
+    with pytest.raises(ValueError):
+        ProfileManager.sanitize_name("   ")
+    with pytest.raises(ValueError):
+        ProfileManager.sanitize_name("///")
+
+
+def test_save_under_alias_invalidates_sanitized_name(sample_signature_data):
+    """Test that saving under an unsanitized spelling refreshes the shared file's cache."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = CachedProfileManager(profiles_dir=temp_dir)
+        manager.save_profile("alice", sample_signature_data)
+        profile_path = manager._profile_path("alice")
+        mtime = profile_path.stat().st_mtime
+        manager.load_profile("alice")
+
+        updated = SignatureData(
+            name="Alice Doe",
+            position="Manager",
+            address="Anytown, USA",
+            phone="",
+            mobile="",
+            email="alice@example.com",
+        )
+        manager.save_profile(" alice! ", updated)
+        # Simulate a filesystem whose mtime did not advance within the tick
+        os.utime(profile_path, (mtime, mtime))
+
+        assert manager.load_profile("alice") == updated
@@ -260,3 +260,80 @@ def test_file_system_error_propagates() -> None:
     # When executing the use case
     with pytest.raises(FileSystemError):
         use_case.execute(signature_data, "output.png")
+
+
+def test_logo_path_override_is_passed_per_call() -> None:
+    """Test that a custom logo is searched without mutating the loader.
+
+    When a logo path override is given, only that path should be searched
+    and the loader's configured search paths must remain untouched.
+    """
+    # Given signature data
+    signature_data = SignatureData(
+        name="Test User",
+        position="Tester",
+        address="Test Address",
+        phone="",
+        mobile="",
+        email="test@example.com",
+    )
+
+    # Create mock dependencies
+    config = SignatureConfig()
+    image_renderer = Mock(spec=ImageRenderer)
+    image_renderer.create_signature_image.return_value = Image.new("RGBA", (400, 200))
+    logo_loader = Mock(spec=LogoLoader)
+    logo_loader.search_paths = ["path1", "path2"]
+    logo_loader.find_logo.return_value = "custom_logo.png"
+    logo_loader.load_and_resize_logo.return_value = Image.new("RGBA", (100, 70))
+    file_service = Mock(spec=FileSystemService)
+
+    use_case = GenerateSignatureUseCase(
+        image_renderer=image_renderer,
+        logo_loader=logo_loader,
+        file_service=file_service,
+        config=config,
+    )
+
+    # When executing with a logo override
+    use_case.execute(signature_data, "output.png", logo_path_override="custom_logo.png")
+
+    # Then only the override should be searched
+    logo_loader.find_logo.assert_called_once_with(["custom_logo.png"])
+    logo_loader.load_and_resize_logo.assert_called_once_with(
+        "custom_logo.png", config.logo_height
+    )
+
+    # And the shared loader state should be unchanged
+    assert logo_loader.search_paths == ["path1", "path2"]
+
+
+def test_missing_logo_override_reports_override_path() -> None:
+    """Test that LogoNotFoundError lists the override path when it is missing."""
+    signature_data = SignatureData(
+        name="Test User",
+        position="Tester",
+        address="Test Address",
+        phone="",
+        mobile="",
+        email="test@example.com",
+    )
+
+    config = SignatureConfig()
+    image_renderer = Mock(spec=ImageRenderer)
+    logo_loader = Mock(spec=LogoLoader)
+    logo_loader.search_paths = ["path1", "path2"]
+    logo_loader.find_logo.return_value = None
+    file_service = Mock(spec=FileSystemService)
+
+    use_case = GenerateSignatureUseCase(
+        image_renderer=image_renderer,
+        logo_loader=logo_loader,
+        file_service=file_service,
+        config=config,
+    )
+
+    with pytest.raises(LogoNotFoundError) as exc_info:
+        use_case.execute(signature_data, "output.png", logo_path_override="missing.png")
+
+    assert exc_info.value.searched_paths == ["missing.png"]
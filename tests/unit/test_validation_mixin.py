@@ -0,0 +1,164 @@
+"""Unit tests for validation feedback state handling without a display."""
+
+import gc
+from types import SimpleNamespace
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+
+from src.email_signature.interface.gui import validation_mixin
+from src.email_signature.interface.gui.validation_mixin import ValidationMixin
+
+
+class _FakeWidget:
+    """Tk-free stand-in for a gridded classic widget."""
+
+    def __init__(self, master=None, **options):
+        self.master = master
+        self.options = options or {"background": "white", "foreground": "black"}
+        self.idle_callbacks = []
+
+    def after_idle(self, func, *args):
+        self.idle_callbacks.append((func, args))
+
+    def run_idle(self):
+        callbacks, self.idle_callbacks = self.idle_callbacks, []
+        for func, args in callbacks:
+            func(*args)
+
+    def grid_info(self):
+        return {"row": 2, "column": 1, "columnspan": 1}
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    def keys(self):
+        return list(self.options)
+
+    def cget(self, key):
+        return self.options[key]
+
+    def configure(self, **options):
+        self.options.update(options)
+
+
+@pytest.fixture
+def fake_ttk():
+    """Replace the mixin's ttk module with mocks."""
+    fake = SimpleNamespace(
+        Label=MagicMock(name="Label", side_effect=lambda *args, **kwargs: MagicMock()),
+        Entry=type("Entry", (_FakeWidget,), {}),
+        Style=MagicMock(name="Style"),
+    )
+    with patch.object(validation_mixin, "ttk", fake):
+        yield fake
+
+
+def test_field_state_is_dropped_when_widget_is_collected():
+    """Test that a collected widget's id() no longer maps to its old state."""
+    mixin = ValidationMixin()
+    widget = _FakeWidget()
+    mixin.set_field_invalid(widget)
+    widget_id = id(widget)
+    assert widget_id in mixin._fields
+
+    del widget
+    gc.collect()
+
+    assert widget_id not in mixin._fields
+
+
+def test_error_label_is_reused_after_being_hidden(fake_ttk):
+    """Test that re-showing an error re-grids the hidden label instead of creating one."""
+    mixin = ValidationMixin()
+    widget = _FakeWidget(master=_FakeWidget())
+
+    mixin.show_validation_error(widget, "Name is required")
+    label = mixin._fields[id(widget)].label
+    mixin.set_field_valid(widget)
+    mixin.show_validation_error(widget, "Name is too long")
+
+    assert fake_ttk.Label.call_count == 1
+    assert mixin._fields[id(widget)].label is label
+    label.grid_remove.assert_called_once_with()
+    assert label.grid.call_args_list == [
+        call(row=3, column=1, columnspan=1, sticky="w", padx=(5, 0)),
+        call(),
+    ]
+    label.config.assert_called_once_with(text="Name is too long")
+
+
+def test_repeated_errors_collapse_into_one_idle_update(fake_ttk):
+    """Test that messages for a shown label are queued once and the last one wins."""
+    mixin = ValidationMixin()
+    widget = _FakeWidget(master=_FakeWidget())
+    mixin.show_validation_error(widget, "first")
+    label = mixin._fields[id(widget)].label
+
+    mixin.show_validation_error(widget, "second")
+    mixin.show_validation_error(widget, "third")
+
+    assert len(widget.idle_callbacks) == 1
+    label.config.assert_not_called()
+
+    widget.run_idle()
+
+    label.config.assert_called_once_with(text="third")
+
+
+def test_clearing_before_idle_drops_the_queued_error(fake_ttk):
+    """Test that a message queued for a label is discarded once the error is cleared."""
+    mixin = ValidationMixin()
+    widget = _FakeWidget(master=_FakeWidget())
+    mixin.show_validation_error(widget, "first")
+    label = mixin._fields[id(widget)].label
+    mixin.show_validation_error(widget, "second")
+
+    mixin.clear_validation_error(widget)
+    widget.run_idle()
+
+    label.config.assert_not_called()
+    label.grid_remove.assert_called_once_with()
+
+
+def test_themed_entry_styles_are_configured_once_per_root(fake_ttk):
+    """Test that the Error/Success entry styles are registered once for each root."""
+    mixin = ValidationMixin()
+    root = _FakeWidget()
+    first = fake_ttk.Entry(master=root, style="TEntry")
+    second = fake_ttk.Entry(master=root, style="TEntry")
+
+    mixin.set_field_invalid(first)
+    mixin.set_field_valid(first)
+    mixin.set_field_invalid(second)
+
+    fake_ttk.Style.assert_called_once_with(root)
+    style = fake_ttk.Style.return_value
+    assert style.configure.call_args_list == [
+        call("Error.TEntry", fieldbackground="#ffebee"),
+        call("Success.TEntry", fieldbackground="#e8f5e9"),
+    ]
+
+
+def test_themed_entry_states_map_to_validation_styles(fake_ttk):
+    """Test that invalid and valid themed entries use the Error and Success styles."""
+    mixin = ValidationMixin()
+    entry = fake_ttk.Entry(master=_FakeWidget(), style="TEntry")
+
+    mixin.set_field_invalid(entry)
+    assert entry.cget("style") == "Error.TEntry"
+
+    mixin.set_field_valid(entry)
+    assert entry.cget("style") == "Success.TEntry"
+
+
+def test_clearing_themed_entry_restores_its_original_style(fake_ttk):
+    """Test that clear_validation_error puts back the style the entry had before."""
+    mixin = ValidationMixin()
+    entry = fake_ttk.Entry(master=_FakeWidget(), style="Custom.TEntry")
+
+    mixin.set_field_invalid(entry)
+    mixin.set_field_valid(entry)
+    mixin.clear_validation_error(entry)
+
+    assert entry.cget("style") == "Custom.TEntry"